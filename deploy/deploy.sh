@@ -52,12 +52,13 @@ echo ""
 echo "--- Restarting services ---"
 sudo systemctl restart abay-daphne
 sudo systemctl restart abay-celery
+sudo systemctl restart abay-celery-io
 sudo systemctl restart abay-celerybeat
 sudo systemctl restart abay-alerts
 
 echo ""
 echo "--- Checking service status ---"
-for svc in abay-daphne abay-celery abay-celerybeat abay-alerts; do
+for svc in abay-daphne abay-celery abay-celery-io abay-celerybeat abay-alerts; do
     status=$(systemctl is-active $svc 2>/dev/null || echo "inactive")
     echo "  $svc: $status"
 done
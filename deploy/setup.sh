@@ -51,13 +51,13 @@ python manage.py collectstatic --noinput
 # 5. Install systemd services
 echo ""
 echo "--- Installing systemd services ---"
-for svc in abay-daphne abay-celery abay-celerybeat abay-alerts; do
+for svc in abay-daphne abay-celery abay-celery-io abay-celerybeat abay-alerts; do
     cp "$DEPLOY_DIR/$svc.service" /etc/systemd/system/
     echo "  Installed $svc.service"
 done
 
 systemctl daemon-reload
-for svc in abay-daphne abay-celery abay-celerybeat abay-alerts; do
+for svc in abay-daphne abay-celery abay-celery-io abay-celerybeat abay-alerts; do
     systemctl enable $svc
     systemctl start $svc
     echo "  Started $svc"
@@ -81,7 +81,7 @@ echo "  (Run 'ufw enable' manually if not already enabled)"
 # 8. Status check
 echo ""
 echo "--- Service Status ---"
-for svc in redis-server nginx abay-daphne abay-celery abay-celerybeat abay-alerts; do
+for svc in redis-server nginx abay-daphne abay-celery abay-celery-io abay-celerybeat abay-alerts; do
     status=$(systemctl is-active $svc 2>/dev/null || echo "inactive")
     echo "  $svc: $status"
 done
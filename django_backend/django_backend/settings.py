@@ -84,6 +84,17 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'America/Los_Angeles'
+# Fair scheduling: a worker reserves one task at a time and acknowledges it
+# only once finished, so a long optimization run cannot hold queued alert
+# checks hostage in its prefetch buffer.
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_TASK_ACKS_LATE = True
+# Disk-bound housekeeping runs on its own queue. In production
+# deploy/abay-celery-io.service consumes it with a separate worker, so it
+# never occupies a solver slot; a single dev worker can take both: -Q celery,io
+CELERY_TASK_ROUTES = {
+    'optimization_api.tasks.write_csv_snapshot_task': {'queue': 'io'},
+}
 
 if os.name == "nt":
     CELERY_WORKER_POOL = "solo"
@@ -160,7 +171,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # REST Framework configuration
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'optimization_api.renderers.OrjsonRenderer',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',  # Change in production
@@ -206,13 +217,26 @@ ABAY_OPTIMIZATION = {
 }
 
 # Add caching for price data (optional but recommended)
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'abay-optimization-cache',
-        'TIMEOUT': 300,  # 5 minutes default
+# Prices cached by fetch_price_data_task are read by optimizations in other
+# worker processes and by Daphne, so deployments point DJANGO_CACHE_URL at the
+# Redis instance the broker uses. Without it the cache is per process.
+DJANGO_CACHE_URL = os.environ.get('DJANGO_CACHE_URL')
+if DJANGO_CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': DJANGO_CACHE_URL,
+            'TIMEOUT': 300,  # 5 minutes default
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'abay-optimization-cache',
+            'TIMEOUT': 300,  # 5 minutes default
+        }
     }
-}
 
 # Logging configuration
 LOGGING = {
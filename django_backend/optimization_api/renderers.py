@@ -0,0 +1,44 @@
+# django_backend/optimization_api/renderers.py
+
+from rest_framework.renderers import JSONRenderer
+
+# orjson is listed in requirements.txt; the guard keeps hosts without it on
+# DRF's stdlib json path
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonRenderer(JSONRenderer):
+    """JSONRenderer that encodes with orjson when it is installed.
+
+    Numpy scalars/arrays and non-string keys are serialized natively; anything
+    else orjson does not know (Decimal, lazy strings, ...) goes through DRF's
+    encoder. Datetimes, dates and times are passed through to that encoder
+    too, so they keep DRF's format (milliseconds, ``Z`` for UTC). Indented
+    output (browsable API, ``indent=`` media type) keeps the stock renderer.
+
+    One difference remains: orjson writes NaN and infinity as ``null``, where
+    DRF's strict encoder raises. Views convert missing values to ``None``
+    before responding, so this only matters for a stray non-finite float.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(
+            data,
+            default=self.encoder_class().default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+
+        # Match JSONRenderer: escape U+2028/U+2029 so the output stays a
+        # strict JavaScript subset
+        if b'\xe2\x80' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
@@ -3,15 +3,16 @@
 import os
 import sys
 import logging
-import traceback
-import time
+import threading
 from datetime import datetime, date, timezone, timedelta
 import re
 from pathlib import Path
 import numpy as np
 import pandas as pd
 import json
+import zlib
 from decimal import Decimal
+from functools import lru_cache
 
 # Only import Celery if it's available
 try:
@@ -29,11 +30,34 @@ except ImportError:
 
         return decorator
 
+try:
+    from twilio.rest import Client as TwilioClient
+except ImportError:
+    TwilioClient = None
+
 from django.utils import timezone
 from django.conf import settings
+from django.db import transaction
 
 logger = logging.getLogger(__name__)
 
+# Rows formatted per write when streaming result frames to CSV
+CSV_WRITE_CHUNKSIZE = 10_000
+
+# Decimal places kept for floats in OptimizationResult.raw_values. Inputs are
+# measured to 3-4 significant digits, so full float64 expansions only bloat
+# the JSON blob; the typed model columns keep full precision.
+RAW_VALUES_DECIMALS = 4
+
+# Cached payloads larger than this are zlib-compressed before cache.set; the
+# two-byte prefix records which encoding was used.
+CACHE_COMPRESS_THRESHOLD = 64 * 1024
+_CACHE_PLAIN_PREFIX = b'JS'
+_CACHE_COMPRESSED_PREFIX = b'ZL'
+
+# Full YYYY-MM-DD date component required before a string is parsed as a datetime
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
 
 def _format_failure_meta(exc: Exception, error_msg: str) -> dict:
     """Create a Celery-compatible metadata payload for task failures."""
@@ -45,10 +69,60 @@ def _format_failure_meta(exc: Exception, error_msg: str) -> dict:
     }
 
 
+def _pack_cache_payload(payload):
+    """Serialize a JSON-compatible payload for the cache, compressing large ones."""
+    buf = json.dumps(payload, default=str).encode('utf-8')
+    if len(buf) > CACHE_COMPRESS_THRESHOLD:
+        return _CACHE_COMPRESSED_PREFIX + zlib.compress(buf, 1)
+    return _CACHE_PLAIN_PREFIX + buf
+
+
+def _unpack_cache_payload(blob):
+    """Inverse of _pack_cache_payload."""
+    prefix, body = blob[:2], blob[2:]
+    if prefix == _CACHE_COMPRESSED_PREFIX:
+        body = zlib.decompress(body)
+    elif prefix != _CACHE_PLAIN_PREFIX:
+        raise ValueError("Unrecognized cache payload encoding")
+    return json.loads(body)
+
+
+def _cache_set(key, value, timeout):
+    """Store a JSON-compatible value in the Django cache."""
+    from django.core.cache import cache
+
+    cache.set(key, _pack_cache_payload(value), timeout)
+
+
+def _cache_get(key):
+    """Fetch a value stored with _cache_set, or None on a miss or unreadable entry."""
+    from django.core.cache import cache
+
+    blob = cache.get(key)
+    if blob is None:
+        return None
+    try:
+        return _unpack_cache_payload(blob)
+    except (TypeError, ValueError, zlib.error):
+        logger.warning("Discarding unreadable cache entry %s", key)
+        return None
+
+
+def _coerce_json(value):
+    """Walk a structure once, stringifying anything JSON cannot represent."""
+    if isinstance(value, dict):
+        return {k if isinstance(k, str) else str(k): _coerce_json(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_coerce_json(v) for v in value]
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    return str(value)
+
+
 def _serialize_diagnostics(diagnostics):
     """Convert solver diagnostics to a JSON-serializable dict."""
     try:
-        serialized = json.loads(json.dumps(diagnostics, default=str))
+        serialized = _coerce_json(diagnostics)
         # Ensure we always return a dict so callers can safely access .get()
         if isinstance(serialized, dict):
             return serialized
@@ -58,38 +132,53 @@ def _serialize_diagnostics(diagnostics):
         return {}
 
 
+# Engine modules are imported once per worker process and reused by every task
+_optimization_modules = None
+_optimization_modules_lock = threading.Lock()
+
+
 def load_optimization_modules():
     """Safely load abay_opt modules"""
-    try:
-        # Add the parent directory to sys.path
-        current_dir = Path(__file__).resolve().parent
-        project_root = current_dir.parent.parent
-        abay_opt_path = project_root / 'abay_opt'
-        logger.info(f"Looking for modules at: {abay_opt_path}")
-        logger.info(f"Directory exists: {abay_opt_path.exists()}")
-
-        if not abay_opt_path.exists():
-            logger.error(f"abay_opt directory not found at: {abay_opt_path}")
-            return None, None, None, None
+    global _optimization_modules
+
+    if _optimization_modules is not None:
+        return _optimization_modules
+
+    with _optimization_modules_lock:
+        if _optimization_modules is not None:
+            return _optimization_modules
 
-        if str(project_root) not in sys.path:
-            sys.path.insert(0, str(project_root))
+        try:
+            # Add the parent directory to sys.path
+            current_dir = Path(__file__).resolve().parent
+            project_root = current_dir.parent.parent
+            abay_opt_path = project_root / 'abay_opt'
+            logger.info("Looking for modules at: %s", abay_opt_path)
+            logger.info("Directory exists: %s", abay_opt_path.exists())
 
-        # Import the engine modules
-        import abay_opt.build_inputs as build_inputs
-        import abay_opt.optimizer as optimizer
-        import abay_opt.cli as cli
-        import abay_opt.constants as optimization_constants
+            if not abay_opt_path.exists():
+                logger.error("abay_opt directory not found at: %s", abay_opt_path)
+                return None, None, None, None
+
+            if str(project_root) not in sys.path:
+                sys.path.insert(0, str(project_root))
 
-        logger.info("Successfully loaded abay_opt modules")
-        return build_inputs, optimizer, cli, optimization_constants
+            # Import the engine modules
+            import abay_opt.build_inputs as build_inputs
+            import abay_opt.optimizer as optimizer
+            import abay_opt.cli as cli
+            import abay_opt.constants as optimization_constants
 
-    except ImportError as e:
-        logger.warning(f"Could not import optimization modules: {e}")
-        return None, None, None, None
-    except Exception as e:
-        logger.error(f"Unexpected error loading optimization modules: {e}")
-        return None, None, None, None
+            _optimization_modules = (build_inputs, optimizer, cli, optimization_constants)
+            logger.info("Successfully loaded abay_opt modules")
+            return _optimization_modules
+
+        except ImportError as e:
+            logger.warning("Could not import optimization modules: %s", e)
+            return None, None, None, None
+        except Exception as e:
+            logger.error("Unexpected error loading optimization modules: %s", e)
+            return None, None, None, None
 
 
 @shared_task(bind=True)
@@ -111,7 +200,7 @@ def run_optimization_task(self, run_id, optimization_ui_params=None):
         # Update status
         run.status = 'running'
         run.started_at = timezone.now()
-        run.save()
+        run.save(update_fields=['status', 'started_at'])
 
         # Update progress
         self.update_state(
@@ -154,15 +243,13 @@ def run_optimization_task(self, run_id, optimization_ui_params=None):
                                 else:
                                     hour, minute, second = map(int, param_value.split(':'))
                                     param_value = time(hour, minute, second)
-                                logger.info(f"Converted {param_name} from string to time: {param_value}")
+                                logger.info("Converted %s from string to time: %s", param_name, param_value)
                             except ValueError as e:
-                                logger.error(f"Failed to convert time string {param_value}: {e}")
+                                logger.error("Failed to convert time string %s: %s", param_value, e)
                                 continue
 
                     setattr(optimization_constants, param_name, param_value)
-                    logger.info(f"Set {param_name} = {param_value} (type: {type(param_value)})")
-
-        run = OptimizationRun.objects.get(id=run_id)
+                    logger.info("Set %s = %s (type: %s)", param_name, param_value, type(param_value))
 
         # Fetch input data for the optimization
         self.update_state(
@@ -296,19 +383,19 @@ def run_optimization_task(self, run_id, optimization_ui_params=None):
             main_results_df = final_output_df
 
             logger.info(
-                f"Processing optimization results with {len(main_results_df)} rows"
+                "Processing optimization results with %d rows", len(main_results_df)
             )
             logger.info(
-                f"Date range: {main_results_df.index[0]} to {main_results_df.index[-1]}"
+                "Date range: %s to %s", main_results_df.index[0], main_results_df.index[-1]
             )
 
         except Exception as opt_error:
             error_msg = f"Optimization pipeline failed: {str(opt_error)}"
-            logger.error(f"{error_msg}\n{traceback.format_exc()}")
+            logger.exception(error_msg)
             run.status = 'failed'
             run.error_message = error_msg
             run.completed_at = timezone.now()
-            run.save()
+            run.save(update_fields=['status', 'error_message', 'completed_at'])
             return {'error': error_msg}
 
         # Process results
@@ -340,32 +427,32 @@ def run_optimization_task(self, run_id, optimization_ui_params=None):
             output_dir = Path(settings.ABAY_OPTIMIZATION['OUTPUT_DIR'])
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            filename = f"optimization_run_{run.id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            file_path = output_dir / filename
+            stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            file_path = output_dir / f"optimization_run_{run.id}_{stamp}.csv"
 
-            # Save the combined results (historical + forecast)
-            main_results_df.to_csv(file_path)
+            # Save the combined results (historical + forecast). This is the
+            # same frame as final_output_df, so no separate forecast file.
+            main_results_df.to_csv(file_path, chunksize=CSV_WRITE_CHUNKSIZE)
 
-            # Also save separate files for clarity
+            # Raw PI lookback inputs are not part of the combined output and
+            # nothing reads them back, so the CSV formatting runs on the I/O queue
             if not historical_lookback_df.empty:
-                historical_file = output_dir / f"historical_only_{run.id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-                historical_lookback_df.to_csv(historical_file)
-                logger.info(f"Saved historical data to: {historical_file}")
-
-            if not final_output_df.empty:
-                forecast_file = output_dir / f"forecast_only_{run.id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-                final_output_df.to_csv(forecast_file)
-                logger.info(f"Saved forecast data to: {forecast_file}")
+                historical_file = output_dir / f"historical_only_{run.id}_{stamp}.csv"
+                _defer_csv_write(historical_lookback_df, historical_file)
 
             run.result_file_path = str(file_path)
-            logger.info(f"Saved combined optimization results to: {file_path}")
+            logger.info("Saved combined optimization results to: %s", file_path)
 
         # Mark as completed
         run.status = 'completed'
         run.completed_at = timezone.now()
         run.progress_percentage = 100
         run.progress_message = 'Optimization completed successfully'
-        run.save()
+        run.save(update_fields=[
+            'status', 'completed_at', 'progress_percentage', 'progress_message',
+            'total_spillage_af', 'avg_oxph_utilization_pct', 'peak_elevation_ft',
+            'min_elevation_ft', 'r_bias_cfs', 'solver_diagnostics', 'result_file_path',
+        ])
 
         # Final progress update
         self.update_state(
@@ -373,7 +460,7 @@ def run_optimization_task(self, run_id, optimization_ui_params=None):
             meta={'current': 100, 'total': 100, 'status': 'Optimization completed successfully!'}
         )
 
-        logger.info(f"Optimization run {run_id} completed successfully")
+        logger.info("Optimization run %s completed successfully", run_id)
 
         return {
             'status': 'completed',
@@ -385,14 +472,14 @@ def run_optimization_task(self, run_id, optimization_ui_params=None):
 
     except Exception as e:
         error_msg = f"Unexpected error in optimization task: {str(e)}"
-        logger.error(f"{error_msg}\n{traceback.format_exc()}")
+        logger.exception(error_msg)
 
         try:
-            run = OptimizationRun.objects.get(id=run_id)
-            run.status = 'failed'
-            run.error_message = error_msg
-            run.completed_at = timezone.now()
-            run.save()
+            OptimizationRun.objects.filter(id=run_id).update(
+                status='failed',
+                error_message=error_msg,
+                completed_at=timezone.now(),
+            )
         except:
             pass
 
@@ -405,10 +492,39 @@ def run_optimization_task(self, run_id, optimization_ui_params=None):
         return {'error': error_msg}
 
 
+def _defer_csv_write(df, csv_path):
+    """Snapshot a DataFrame to a pickle and queue its CSV conversion on the I/O queue.
+
+    Falls back to writing the CSV inline if the task cannot be queued.
+    """
+    pickle_path = Path(csv_path).with_suffix('.pkl')
+    try:
+        df.to_pickle(pickle_path)
+        write_csv_snapshot_task.delay(str(pickle_path), str(csv_path))
+    except Exception as e:
+        logger.warning("Could not queue CSV write for %s, writing inline: %s", csv_path, e)
+        Path(pickle_path).unlink(missing_ok=True)
+        df.to_csv(csv_path, chunksize=CSV_WRITE_CHUNKSIZE)
+
+
+@shared_task
+def write_csv_snapshot_task(pickle_path, csv_path):
+    """Convert a pickled DataFrame snapshot to CSV (routed to the 'io' queue)."""
+    pickle_path = Path(pickle_path)
+    try:
+        df = pd.read_pickle(pickle_path)
+        df.to_csv(csv_path, chunksize=CSV_WRITE_CHUNKSIZE)
+        logger.info("Saved CSV snapshot to: %s", csv_path)
+        return {'status': 'success', 'path': str(csv_path), 'rows': len(df)}
+    finally:
+        pickle_path.unlink(missing_ok=True)
+
+
 def _run_simulation(task, run):
     """Run a simulation when optimization modules aren't available"""
     try:
-        # Simulate optimization steps
+        # Report the simulated pipeline stages back to back; sleeping between
+        # them only held a worker slot without doing any work
         steps = [
             (10, 'Fetching PI data...'),
             (20, 'Loading forecast data...'),
@@ -425,7 +541,6 @@ def _run_simulation(task, run):
                     meta={'current': progress, 'total': 100, 'status': message}
                 )
             run.update_progress(message, progress)
-            time.sleep(1)  # Simulate work
 
         # Generate fake summary statistics
         import random
@@ -447,7 +562,11 @@ def _run_simulation(task, run):
         run.completed_at = timezone.now()
         run.progress_percentage = 100
         run.progress_message = 'Simulation completed successfully'
-        run.save()
+        run.save(update_fields=[
+            'status', 'completed_at', 'progress_percentage', 'progress_message',
+            'total_spillage_af', 'avg_oxph_utilization_pct', 'peak_elevation_ft',
+            'min_elevation_ft', 'r_bias_cfs',
+        ])
 
         if CELERY_AVAILABLE and hasattr(task, 'update_state'):
             task.update_state(
@@ -455,7 +574,7 @@ def _run_simulation(task, run):
                 meta={'current': 100, 'total': 100, 'status': 'Simulation completed!'}
             )
 
-        logger.info(f"Simulation run {run.id} completed")
+        logger.info("Simulation run %s completed", run.id)
 
         return {
             'status': 'completed',
@@ -470,10 +589,111 @@ def _run_simulation(task, run):
         run.status = 'failed'
         run.error_message = error_msg
         run.completed_at = timezone.now()
-        run.save()
+        run.save(update_fields=['status', 'error_message', 'completed_at'])
         return {'error': error_msg}
 
 
+# OptimizationResult float fields and the DataFrame columns that feed them,
+# in priority order (the first column present in the frame wins).
+RESULT_COLUMN_ALIASES = {
+    'r4_flow_cfs': ('R4_Forecast_CFS', 'R4_Flow'),
+    'r30_flow_cfs': ('R30_Forecast_CFS', 'R30_Flow'),
+    'mfra_mw': ('MFRA_MW_forecast', 'MFRA_Forecast_MW', 'MFRA_MW'),
+    'r5l_flow_cfs': ('R5L_Flow',),
+    'r26_flow_cfs': ('R26_Flow',),
+    'abay_float_ft': ('FLOAT_FT',),
+    'oxph_generation_mw': ('OXPH_generation_MW',),
+    'abay_elev_ft': ('ABAY_ft',),
+    'abay_af': ('ABAY_af',),
+    'mf1_2_mw': ('MF1_2_MW_Sim', 'MF_1_2_MW'),
+    'mf1_2_cfs': ('MF1_2_CFS_Sim', 'MF_1_2_cfs'),
+    'oxph_outflow_cfs': ('OXPH_CFS_Sim', 'OXPH_outflow_cfs'),
+    'abay_delta_af': ('ABAY_Delta_AF_Sim', 'abay_error_af'),
+    'abay_net_flow_cfs': (
+        'ABAY_Net_Flow_CFS_Recalc',
+        'ABAY_NET_actual_cfs',
+        'ABAY_NET_expected_cfs_with_bias',
+    ),
+    'spill_volume_af': ('Spill_Volume_AF_Recalc',),
+    'abay_net_expected_cfs': ('ABAY_NET_expected_cfs',),
+    'abay_net_actual_cfs': ('ABAY_NET_actual_cfs',),
+    'head_limit_mw': ('Head_limit_MW',),
+    'regulated_component_cfs': ('Regulated_component_cfs',),
+    'mfra_side_reduction_mw': ('MFRA_side_reduction_MW',),
+    'bias_cfs': ('bias_cfs',),
+    'expected_abay_ft': ('Expected_ABAY_ft',),
+    'expected_abay_af': ('Expected_ABAY_af',),
+    'abay_net_expected_cfs_no_bias': ('ABAY_NET_expected_cfs_no_bias',),
+    'abay_net_expected_cfs_with_bias': ('ABAY_NET_expected_cfs_with_bias',),
+    'oxph_setpoint_target': ('OXPH_setpoint_MW', 'OXPH_Setpoint_Target'),
+    'actual_oxph_mw': ('Oxbow_Power_Actual', 'OXPH_generation_MW_hist'),
+    'actual_abay_elev_ft': ('Afterbay_Elevation_Actual',),
+    'abay_error_af': ('ABAY_Error_AF', 'abay_error_af'),
+    'abay_error_cfs': ('ABAY_Error_CFS', 'abay_error_cfs'),
+}
+
+
+# Non-float OptimizationResult fields that are also fed through aliases
+RESULT_EXTRA_ALIASES = {
+    'r20_flow_cfs': ('R20_Flow',),
+    'ccs_mode': ('Mode',),
+    'setpoint_adjust_time_pt': ('setpoint_change_time', 'Setpoint_Adjust_Time_PT'),
+}
+
+
+def _resolve_columns(df, alias_table):
+    """Map each key of ``alias_table`` to its first alias present in ``df`` (or None).
+
+    Done once per DataFrame so field extraction never re-scans alias lists.
+    """
+    present = set(df.columns)
+    return {
+        key: next((c for c in aliases if c in present), None)
+        for key, aliases in alias_table.items()
+    }
+
+
+def _numeric_column(df, column):
+    """Return ``df[column]`` as a float64 array (all NaN if the column is None/absent)."""
+    if column is None or column not in df.columns:
+        return np.full(len(df), np.nan)
+    return pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=np.float64)
+
+
+def _nullable_floats(values):
+    """Convert a float array to a list of Python floats with NaN mapped to None."""
+    return np.where(np.isnan(values), None, values).tolist()
+
+
+def _bool_column(df, column):
+    """Coerce a column to a bool array with _safe_bool semantics (missing/NaN -> False)."""
+    if column not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+    series = df[column]
+    if pd.api.types.is_bool_dtype(series):
+        return series.fillna(False).to_numpy(dtype=bool)
+    if pd.api.types.is_numeric_dtype(series):
+        return series.fillna(0).to_numpy() != 0
+    return np.fromiter((_safe_bool(v) for v in series), dtype=bool, count=len(series))
+
+
+def _datetime_column(df, column):
+    """Parse a column to UTC datetimes (None where unparseable or the column is None).
+
+    Strings without a full YYYY-MM-DD date component (e.g. bare clock times)
+    are treated as missing.
+    """
+    if column is None:
+        return [None] * len(df)
+
+    series = df[column]
+    if not pd.api.types.is_datetime64_any_dtype(series):
+        text = series.astype('string')
+        series = text.where(text.str.contains(_DATE_RE, na=False))
+    parsed = pd.DatetimeIndex(pd.to_datetime(series, errors='coerce', utc=True))
+    return np.where(parsed.isna(), None, parsed.to_pydatetime()).tolist()
+
+
 def _save_optimization_results(run, results_df):
     """
     Save optimization results to the database
@@ -481,179 +701,252 @@ def _save_optimization_results(run, results_df):
     """
     from .models import OptimizationResult
 
-    logger.info(f"Saving {len(results_df)} optimization result records to database")
+    logger.info("Saving %s optimization result records to database", len(results_df))
 
-    # Clear any existing results for this run
-    OptimizationResult.objects.filter(optimization_run=run).delete()
+    # Resolve every alias group to a concrete column once for this frame
+    float_sources = _resolve_columns(results_df, RESULT_COLUMN_ALIASES)
+    extra_sources = _resolve_columns(results_df, RESULT_EXTRA_ALIASES)
 
-    # Prepare batch insert
-    result_objects = []
-
-    for idx, (timestamp, row) in enumerate(results_df.iterrows()):
-        # Convert timestamp to UTC if needed
-        if hasattr(timestamp, 'tz_convert'):
-            timestamp_utc = timestamp.tz_convert('UTC')
-        else:
-            timestamp_utc = timestamp
+    # Coerce every float field once per column rather than once per cell
+    float_columns = {
+        field: _nullable_floats(_numeric_column(results_df, column))
+        for field, column in float_sources.items()
+    }
+    # Missing R20/R5L readings count as zero flow in the difference
+    r20 = _numeric_column(results_df, extra_sources['r20_flow_cfs'])
+    r5l = _numeric_column(results_df, float_sources['r5l_flow_cfs'])
+    r20_minus_r5l = (np.where(np.isnan(r20), 0.0, r20) - np.where(np.isnan(r5l), 0.0, r5l)).tolist()
+    # ccs_mode is NOT NULL, so missing modes fall back to the model default of 0
+    ccs_mode = np.nan_to_num(
+        _numeric_column(results_df, extra_sources['ccs_mode']), nan=0.0
+    ).astype(int).tolist()
+    is_forecast = _bool_column(results_df, 'is_forecast').tolist()
+    is_head_loss_limited = _bool_column(results_df, 'Is_Head_Loss_Limited').tolist()
+    setpoint_times = _datetime_column(results_df, extra_sources['setpoint_adjust_time_pt'])
+    if 'Adjust_OXPH_Needed' in results_df.columns:
+        adjust_needed = results_df['Adjust_OXPH_Needed'].fillna('').astype(str).tolist()
+    else:
+        adjust_needed = [''] * len(results_df)
+    # Convert the whole index to UTC datetimes at once (naive means UTC)
+    index = pd.DatetimeIndex(results_df.index)
+    index_utc = index.tz_convert('UTC') if index.tz is not None else index.tz_localize('UTC')
+    timestamps_utc = index_utc.to_pydatetime()
+    raw_values = _serialize_result_frame(results_df, timestamps_utc)
 
-        # Create result object
-        r20_val = _safe_float(row.get('R20_Flow'))
-        r5l_val = _safe_float(row.get('R5L_Flow'))
-        r20_minus_r5l = (r20_val or 0) - (r5l_val or 0)
+    result_objects = []
 
-        result_obj = OptimizationResult(
+    for idx, timestamp_utc in enumerate(timestamps_utc):
+        result_objects.append(OptimizationResult(
             optimization_run=run,
             timestamp_utc=timestamp_utc,
+            r20_minus_r5l_cfs=r20_minus_r5l[idx],
+            ccs_mode=ccs_mode[idx],
+            is_forecast=is_forecast[idx],
+            adjust_oxph_needed=adjust_needed[idx],
+            setpoint_adjust_time_pt=setpoint_times[idx],
+            is_head_loss_limited=is_head_loss_limited[idx],
+            raw_values=raw_values[idx],
+            **{field: values[idx] for field, values in float_columns.items()},
+        ))
+
+    # Replace any existing results in one transaction so SQLite commits once
+    # rather than once per insert batch, and readers never see a partial run
+    with transaction.atomic():
+        # Nothing references OptimizationResult and no delete signals are
+        # registered, so skip the deletion collector and issue one DELETE
+        stale = OptimizationResult.objects.filter(optimization_run=run)
+        stale._raw_delete(stale.db)
+        OptimizationResult.objects.bulk_create(result_objects, batch_size=1000)
+
+    logger.info("Saved all %s optimization result records", len(results_df))
+
+
+# PIDatum field -> column in the PI lookback DataFrame
+PI_DATUM_COLUMNS = {
+    'abay_elevation_ft': 'Afterbay_Elevation',
+    'abay_float_ft': 'Afterbay_Elevation_Setpoint',
+    'oxph_generation_mw': 'Oxbow_Power',
+    'oxph_setpoint_mw': 'OXPH_ADS',
+    'r4_flow_cfs': 'R4_Flow',
+    'r30_flow_cfs': 'R30_Flow',
+    'r20_flow_cfs': 'R20_Flow',
+    'r5l_flow_cfs': 'R5L_Flow',
+    'r26_flow_cfs': 'R26_Flow',
+    'mfp_total_gen_mw': 'MFP_Total_Gen_GEN_MDFK_and_RA',
+    'ccs_mode': 'CCS_Mode',
+}
+
+
+def _bulk_ingest_pi(df):
+    """Insert PI lookback rows as PIDatum records; returns the number of rows submitted.
+
+    Columns are converted once per frame and rows are written with batched
+    bulk_create. Timestamps that already exist are left untouched.
+    """
+    from .models import PIDatum
+
+    if df is None or df.empty:
+        return 0
+
+    index = pd.DatetimeIndex(df.index)
+    index = index.tz_localize('UTC') if index.tz is None else index.tz_convert('UTC')
+
+    fields = list(PI_DATUM_COLUMNS)
+    columns = [_nullable_floats(_numeric_column(df, PI_DATUM_COLUMNS[field])) for field in fields]
+    rows = [
+        PIDatum(timestamp_utc=timestamp, **dict(zip(fields, values)))
+        for timestamp, *values in zip(index.to_pydatetime(), *columns)
+    ]
+
+    PIDatum.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+    return len(rows)
 
-            # Input data
-            r4_flow_cfs=_safe_float(row.get('R4_Forecast_CFS') or row.get('R4_Flow')),
-            r30_flow_cfs=_safe_float(row.get('R30_Forecast_CFS') or row.get('R30_Flow')),
-            mfra_mw=_safe_float(
-                row.get('MFRA_MW_forecast')
-                or row.get('MFRA_Forecast_MW')
-                or row.get('MFRA_MW')
-            ),
-            r20_minus_r5l_cfs=r20_minus_r5l,
-            r5l_flow_cfs=r5l_val,
-            r26_flow_cfs=_safe_float(row.get('R26_Flow')),
-            ccs_mode=_safe_int(row.get('Mode', 0)),
-            abay_float_ft=_safe_float(row.get('FLOAT_FT')),
-
-            # Optimization results
-            oxph_generation_mw=_safe_float(row.get('OXPH_generation_MW')),
-            abay_elev_ft=_safe_float(row.get('ABAY_ft')),
-            abay_af=_safe_float(row.get('ABAY_af')),
-
-            # Diagnostic data
-            mf1_2_mw=_safe_float(row.get('MF1_2_MW_Sim') or row.get('MF_1_2_MW')),
-            mf1_2_cfs=_safe_float(row.get('MF1_2_CFS_Sim') or row.get('MF_1_2_cfs')),
-            oxph_outflow_cfs=_safe_float(row.get('OXPH_CFS_Sim') or row.get('OXPH_outflow_cfs')),
-            abay_delta_af=_safe_float(row.get('ABAY_Delta_AF_Sim') or row.get('abay_error_af')),
-            abay_net_flow_cfs=_safe_float(
-                row.get('ABAY_Net_Flow_CFS_Recalc')
-                or row.get('ABAY_NET_actual_cfs')
-                or row.get('ABAY_NET_expected_cfs_with_bias')
-            ),
-            spill_volume_af=_safe_float(row.get('Spill_Volume_AF_Recalc')),
-            abay_net_expected_cfs=_safe_float(row.get('ABAY_NET_expected_cfs')),
-            abay_net_actual_cfs=_safe_float(row.get('ABAY_NET_actual_cfs')),
-            head_limit_mw=_safe_float(row.get('Head_limit_MW')),
-            regulated_component_cfs=_safe_float(row.get('Regulated_component_cfs')),
-            mfra_side_reduction_mw=_safe_float(row.get('MFRA_side_reduction_MW')),
-            bias_cfs=_safe_float(row.get('bias_cfs')),
-            expected_abay_ft=_safe_float(row.get('Expected_ABAY_ft')),
-            expected_abay_af=_safe_float(row.get('Expected_ABAY_af')),
-            abay_net_expected_cfs_no_bias=_safe_float(row.get('ABAY_NET_expected_cfs_no_bias')),
-            abay_net_expected_cfs_with_bias=_safe_float(row.get('ABAY_NET_expected_cfs_with_bias')),
-            is_forecast=_safe_bool(row.get('is_forecast')),
-
-            # Setpoint guidance
-            adjust_oxph_needed=str(row.get('Adjust_OXPH_Needed', '')),
-            oxph_setpoint_target=_safe_float(
-                row.get('OXPH_setpoint_MW') or row.get('OXPH_Setpoint_Target')
-            ),
-            setpoint_adjust_time_pt=_safe_datetime(
-                row.get('setpoint_change_time') or row.get('Setpoint_Adjust_Time_PT')
-            ),
-            is_head_loss_limited=bool(row.get('Is_Head_Loss_Limited', False)),
-
-            # Historical comparison (if available)
-            actual_oxph_mw=_safe_float(row.get('Oxbow_Power_Actual') or row.get('OXPH_generation_MW_hist')),
-            actual_abay_elev_ft=_safe_float(row.get('Afterbay_Elevation_Actual')),
-            abay_error_af=_safe_float(row.get('ABAY_Error_AF') or row.get('abay_error_af')),
-            abay_error_cfs=_safe_float(row.get('ABAY_Error_CFS') or row.get('abay_error_cfs')),
-            raw_values=_serialize_result_row(row, timestamp_utc),
-        )
 
-        result_objects.append(result_obj)
+# Summary statistic groups and their candidate columns
+SUMMARY_STAT_COLUMNS = {
+    'spill': ('Spill_Volume_AF_Recalc',),
+    'oxph': ('OXPH_generation_MW', 'OXPH_Schedule_MW'),
+    'elev': ('ABAY_ft', 'Simulated_ABAY_Elev_FT'),
+    'flow': ('ABAY_Net_Flow_CFS_Recalc',),
+    'error': ('ABAY_Error_CFS',),
+}
+# Groups where missing samples count as zero instead of being dropped
+SUMMARY_ZERO_FILLED = frozenset({'spill', 'oxph'})
 
-        # Batch insert every 1000 records to avoid memory issues
-        if len(result_objects) >= 1000:
-            OptimizationResult.objects.bulk_create(result_objects)
-            result_objects = []
-            logger.info(f"Saved batch of results (processed {idx + 1}/{len(results_df)} records)")
 
-    # Insert remaining records
-    if result_objects:
-        OptimizationResult.objects.bulk_create(result_objects)
+def _block_stats(block):
+    """Compute NaN-aware sum/min/max/mean/RMS for every column of a 2-D float array.
 
-    logger.info(f"Saved all {len(results_df)} optimization result records")
+    All columns are reduced together in one pass per statistic. Returns one
+    dict per column, or None for columns without any finite samples.
+    """
+    valid = ~np.isnan(block)
+    count = valid.sum(axis=0)
+    filled = np.where(valid, block, 0.0)
+    total = filled.sum(axis=0)
+    sum_sq = np.einsum('ij,ij->j', filled, filled)
+    col_max = np.where(valid, block, -np.inf).max(axis=0, initial=-np.inf)
+    col_min = np.where(valid, block, np.inf).min(axis=0, initial=np.inf)
+
+    stats = []
+    for j in range(block.shape[1]):
+        n = int(count[j])
+        if not n:
+            stats.append(None)
+            continue
+        stats.append({
+            'sum': float(total[j]),
+            'max': float(col_max[j]),
+            'min': float(col_min[j]),
+            'mean': float(total[j]) / n,
+            'rms': float(np.sqrt(sum_sq[j] / n)),
+        })
+    return stats
 
 
 def _calculate_summary_statistics(results_df):
     """Calculate summary statistics from optimization results"""
     try:
-        import pandas as pd
-
         # Make sure we have a DataFrame with data
         if results_df is None or results_df.empty:
             logger.warning("Cannot calculate statistics from empty DataFrame")
             return {}
 
         if not hasattr(results_df, 'columns'):
-            logger.error(f"Expected DataFrame for statistics, got {type(results_df)}")
+            logger.error("Expected DataFrame for statistics, got %s", type(results_df))
             return {}
 
-        logger.info(f"Calculating statistics from DataFrame with columns: {list(results_df.columns)}")
+        logger.info("Calculating statistics from DataFrame with columns: %s", list(results_df.columns))
+
+        # Resolve each statistic group to a column, then reduce them all at once
+        sources = {
+            name: column
+            for name, column in _resolve_columns(results_df, SUMMARY_STAT_COLUMNS).items()
+            if column is not None
+        }
+        names = list(sources)
+        fill_zero = [name in SUMMARY_ZERO_FILLED for name in names]
+
+        grouped = {}
+        if names:
+            block = np.column_stack([_numeric_column(results_df, sources[name]) for name in names])
+            block[:, fill_zero] = np.nan_to_num(block[:, fill_zero], nan=0.0)
+            grouped = dict(zip(names, _block_stats(block)))
 
         stats = {}
 
         # Spillage statistics (if available)
-        if 'Spill_Volume_AF_Recalc' in results_df.columns:
-            spill_data = results_df['Spill_Volume_AF_Recalc'].fillna(0)
-            stats['total_spillage_af'] = float(spill_data.sum())
-            stats['max_hourly_spillage_af'] = float(spill_data.max())
+        spill = grouped.get('spill')
+        if spill:
+            stats['total_spillage_af'] = spill['sum']
+            stats['max_hourly_spillage_af'] = spill['max']
 
         # OXPH utilization
-        oxph_col = None
-        if 'OXPH_generation_MW' in results_df.columns:
-            oxph_col = 'OXPH_generation_MW'
-        elif 'OXPH_Schedule_MW' in results_df.columns:
-            oxph_col = 'OXPH_Schedule_MW'
-        if oxph_col:
-            oxph_data = results_df[oxph_col].fillna(0)
+        oxph = grouped.get('oxph')
+        if oxph:
             max_mw = 5.8  # Could get from constants
-            avg_utilization = (oxph_data.mean() / max_mw) * 100
-            stats['avg_oxph_utilization_pct'] = float(avg_utilization)
-            stats['max_oxph_mw'] = float(oxph_data.max())
-            stats['min_oxph_mw'] = float(oxph_data.min())
+            stats['avg_oxph_utilization_pct'] = (oxph['mean'] / max_mw) * 100
+            stats['max_oxph_mw'] = oxph['max']
+            stats['min_oxph_mw'] = oxph['min']
 
         # Elevation statistics
-        elev_col = None
-        if 'ABAY_ft' in results_df.columns:
-            elev_col = 'ABAY_ft'
-        elif 'Simulated_ABAY_Elev_FT' in results_df.columns:
-            elev_col = 'Simulated_ABAY_Elev_FT'
-        if elev_col:
-            elev_data = results_df[elev_col].dropna()
-            if not elev_data.empty:
-                stats['peak_elevation_ft'] = float(elev_data.max())
-                stats['min_elevation_ft'] = float(elev_data.min())
-                stats['avg_elevation_ft'] = float(elev_data.mean())
+        elev = grouped.get('elev')
+        if elev:
+            stats['peak_elevation_ft'] = elev['max']
+            stats['min_elevation_ft'] = elev['min']
+            stats['avg_elevation_ft'] = elev['mean']
 
         # Flow statistics
-        if 'ABAY_Net_Flow_CFS_Recalc' in results_df.columns:
-            flow_data = results_df['ABAY_Net_Flow_CFS_Recalc'].dropna()
-            if not flow_data.empty:
-                stats['avg_net_flow_cfs'] = float(flow_data.mean())
-                stats['max_net_flow_cfs'] = float(flow_data.max())
-                stats['min_net_flow_cfs'] = float(flow_data.min())
+        flow = grouped.get('flow')
+        if flow:
+            stats['avg_net_flow_cfs'] = flow['mean']
+            stats['max_net_flow_cfs'] = flow['max']
+            stats['min_net_flow_cfs'] = flow['min']
 
         # Error statistics (for historical runs)
-        if 'ABAY_Error_CFS' in results_df.columns:
-            error_data = results_df['ABAY_Error_CFS'].dropna()
-            if not error_data.empty:
-                stats['r_bias_cfs'] = float(error_data.mean())
-                stats['rmse_cfs'] = float((error_data ** 2).mean() ** 0.5)
+        error = grouped.get('error')
+        if error:
+            stats['r_bias_cfs'] = error['mean']
+            stats['rmse_cfs'] = error['rms']
 
-        logger.info(f"Calculated summary statistics: {stats}")
+        logger.info("Calculated summary statistics: %s", stats)
         return stats
 
     except Exception as e:
-        logger.error(f"Error calculating summary statistics: {e}")
+        logger.error("Error calculating summary statistics: %s", e)
         return {}
 
 
+def _price_records(price_df):
+    """Convert a YES Energy price DataFrame into JSON-ready records, one column at a time."""
+    timestamps = [ts.isoformat() for ts in price_df.index]
+    day_ahead = _nullable_floats(_numeric_column(price_df, 'Day_Ahead_Price'))
+    real_time = _nullable_floats(_numeric_column(price_df, 'Real_Time_Price'))
+    fifteen_min = _nullable_floats(_numeric_column(price_df, 'Fifteen_Min_Price'))
+    return [
+        {
+            'timestamp': ts,
+            'day_ahead_price': da,
+            'real_time_price': rt,
+            'fifteen_min_price': fm,
+        }
+        for ts, da, rt, fm in zip(timestamps, day_ahead, real_time, fifteen_min)
+    ]
+
+
+def _price_cache_key(node_id, now=None):
+    """Cache key for a node's price payload. Keys are bucketed by day so a
+    long timeout can never serve the previous day's prices."""
+    return f"price_data_{node_id}_{timezone.localdate(now).isoformat()}"
+
+
+@lru_cache(maxsize=1)
+def _yes_energy_cache_timeout():
+    """Seconds to cache YES Energy price payloads (read from settings once)."""
+    return getattr(settings, 'ABAY_OPTIMIZATION', {}).get('YES_ENERGY', {}).get(
+        'CACHE_TIMEOUT_SECONDS', 300)
+
+
 # Add this function to your existing tasks.py
 
 @shared_task(bind=True)
@@ -665,16 +958,15 @@ def fetch_price_data_task(self, node_id='20000002064', use_cache=True):
         logger.warning("Celery not available - returning simulated price data")
         return _get_simulated_price_data_sync(node_id)
 
+    now = timezone.now()
     try:
-        from django.core.cache import cache
-
         # Check cache first if enabled
-        cache_key = f"price_data_{node_id}"
+        cache_key = _price_cache_key(node_id, now)
         if use_cache:
-            cached_data = cache.get(cache_key)
-            if cached_data:
-                logger.info(f"Returning cached price data for node {node_id}")
-                return cached_data
+            cached_result = _cache_get(cache_key)
+            if cached_result:
+                logger.info("Returning cached price data for node %s", node_id)
+                return cached_result
 
         # Update progress
         self.update_state(
@@ -697,7 +989,7 @@ def fetch_price_data_task(self, node_id='20000002064', use_cache=True):
 
             import abay_opt.yes_energy_grab as yes_energy
         except ImportError as e:
-            logger.warning(f"Could not import YES Energy module: {e}")
+            logger.warning("Could not import YES Energy module: %s", e)
             return _get_simulated_price_data_sync(node_id)
 
         # Update progress
@@ -724,14 +1016,7 @@ def fetch_price_data_task(self, node_id='20000002064', use_cache=True):
         )
 
         # Convert to JSON-serializable format
-        price_data = []
-        for idx, row in price_data_df.iterrows():
-            price_data.append({
-                'timestamp': idx.isoformat(),
-                'day_ahead_price': _safe_float(row.get('Day_Ahead_Price')),
-                'real_time_price': _safe_float(row.get('Real_Time_Price')),
-                'fifteen_min_price': _safe_float(row.get('Fifteen_Min_Price')),
-            })
+        price_data = _price_records(price_data_df)
 
         # Calculate statistics
         stats = yes_energy.get_price_statistics(price_data_df)
@@ -748,15 +1033,14 @@ def fetch_price_data_task(self, node_id='20000002064', use_cache=True):
                 'start': price_data_df.index.min().isoformat(),
                 'end': price_data_df.index.max().isoformat()
             },
-            'fetched_at': timezone.now().isoformat()
+            'fetched_at': now.isoformat()
         }
 
         # Cache the result
         if use_cache:
-            cache_timeout = getattr(settings, 'ABAY_OPTIMIZATION', {}).get('YES_ENERGY', {}).get(
-                'CACHE_TIMEOUT_SECONDS', 300)
-            cache.set(cache_key, result, cache_timeout)
-            logger.info(f"Cached price data for node {node_id} for {cache_timeout} seconds")
+            cache_timeout = _yes_energy_cache_timeout()
+            _cache_set(cache_key, result, cache_timeout)
+            logger.info("Cached price data for node %s for %s seconds", node_id, cache_timeout)
 
         # Final progress update
         self.update_state(
@@ -764,12 +1048,12 @@ def fetch_price_data_task(self, node_id='20000002064', use_cache=True):
             meta={'current': 100, 'total': 100, 'status': f'Successfully fetched {len(price_data)} price points'}
         )
 
-        logger.info(f"Successfully fetched price data for node {node_id}")
+        logger.info("Successfully fetched price data for node %s", node_id)
         return result
 
     except Exception as e:
         error_msg = f"Failed to fetch price data for node {node_id}: {str(e)}"
-        logger.error(f"{error_msg}\n{traceback.format_exc()}")
+        logger.exception(error_msg)
 
         if CELERY_AVAILABLE:
             self.update_state(
@@ -782,44 +1066,56 @@ def fetch_price_data_task(self, node_id='20000002064', use_cache=True):
         return _get_simulated_price_data_sync(node_id)
 
 
+# Diurnal price shape for the simulated 48-hour horizon, indexed by hour
+# offset from midnight; rolled by the current hour on each call.
+_SIMULATED_PRICE_HOURS = 48
+_SIMULATED_TIME_FACTOR = 1.0 + 0.3 * np.sin((np.arange(_SIMULATED_PRICE_HOURS) - 6) / 24 * 2 * np.pi)
+
+
 def _get_simulated_price_data_sync(node_id):
     """Generate simulated price data synchronously"""
-    import random
-    import math
-    from datetime import timedelta
-
-    logger.info(f"Generating simulated price data for node {node_id}")
+    logger.info("Generating simulated price data for node %s", node_id)
 
     now = timezone.now()
-    price_data = []
-
-    for i in range(48):  # 48 hours
-        timestamp = now + timedelta(hours=i)
-
-        # Simulate realistic price patterns
-        base_price = 45.0
-        time_factor = 1.0 + 0.3 * math.sin((timestamp.hour - 6) / 24 * 2 * math.pi)
-        volatility = random.uniform(0.8, 1.2)
-
-        day_ahead = base_price * time_factor * volatility
-        real_time = day_ahead * random.uniform(0.9, 1.1)
-        fifteen_min = real_time * random.uniform(0.95, 1.05)
-
-        price_data.append({
+    rng = np.random.default_rng()
+
+    # Simulate realistic price patterns over the next 48 hours
+    hours = _SIMULATED_PRICE_HOURS
+    timestamps = pd.Timestamp(now) + pd.to_timedelta(np.arange(hours), unit='h')
+    base_price = 45.0
+    time_factor = np.roll(_SIMULATED_TIME_FACTOR, -now.hour)
+    volatility = rng.uniform(0.8, 1.2, hours)
+
+    day_ahead = base_price * time_factor * volatility
+    real_time = day_ahead * rng.uniform(0.9, 1.1, hours)
+    fifteen_min = real_time * rng.uniform(0.95, 1.05, hours)
+
+    day_ahead = np.round(day_ahead, 2)
+    real_time = np.round(real_time, 2)
+    price_data = [
+        {
             'timestamp': timestamp.isoformat(),
-            'day_ahead_price': round(day_ahead, 2),
-            'real_time_price': round(real_time, 2),
-            'fifteen_min_price': round(fifteen_min, 2),
-        })
+            'day_ahead_price': da,
+            'real_time_price': rt,
+            'fifteen_min_price': fm,
+        }
+        for timestamp, da, rt, fm in zip(
+            timestamps,
+            day_ahead.tolist(),
+            real_time.tolist(),
+            np.round(fifteen_min, 2).tolist(),
+        )
+    ]
 
     stats = {
-        'Day_Ahead_Price': {
-            'current': price_data[-1]['day_ahead_price'],
-            'min': min(p['day_ahead_price'] for p in price_data),
-            'max': max(p['day_ahead_price'] for p in price_data),
-            'mean': sum(p['day_ahead_price'] for p in price_data) / len(price_data),
+        name: {
+            'current': float(values[-1]),
+            'min': float(values.min()),
+            'max': float(values.max()),
+            'mean': float(values.mean()),
             'count': len(price_data)
         }
+        for name, values in (('Day_Ahead_Price', day_ahead), ('Real_Time_Price', real_time))
     }
 
     return {
@@ -830,7 +1126,7 @@ def _get_simulated_price_data_sync(node_id):
         'price_data': price_data,
         'statistics': stats,
         'message': 'Using simulated data - YES Energy API not available',
-        'fetched_at': timezone.now().isoformat()
+        'fetched_at': now.isoformat()
     }
 
 
@@ -844,48 +1140,103 @@ def _enhance_optimization_with_prices(run, optimization_params):
         if optimization_params.get('include_price_optimization', False):
             node_id = optimization_params.get('electricity_node_id', '20000002064')
 
-            logger.info(f"Fetching price data for revenue optimization (node: {node_id})")
+            # Prefer real prices already cached by fetch_price_data_task and
+            # only simulate on a miss
+            price_result = _cache_get(_price_cache_key(node_id))
+            if price_result and price_result.get('status') == 'success':
+                logger.info("Using cached price data for revenue optimization (node: %s)", node_id)
+            else:
+                logger.info("Fetching price data for revenue optimization (node: %s)", node_id)
 
-            # Fetch price data synchronously within the optimization task
-            price_result = _get_simulated_price_data_sync(node_id)  # Could be enhanced to call real API
+                # Fetch price data synchronously within the optimization task
+                price_result = _get_simulated_price_data_sync(node_id)  # Could be enhanced to call real API
 
             if price_result and price_result['status'] == 'success':
                 # Add price data to the optimization context
                 optimization_params['price_data'] = price_result['price_data']
                 optimization_params['price_statistics'] = price_result['statistics']
 
-                logger.info(f"Added {price_result['data_count']} price points to optimization")
+                logger.info("Added %s price points to optimization", price_result['data_count'])
                 return True
             else:
                 logger.warning("Could not fetch price data for optimization")
                 return False
 
     except Exception as e:
-        logger.error(f"Error enhancing optimization with price data: {e}")
+        logger.error("Error enhancing optimization with price data: %s", e)
         return False
 
     return False
 
 
 # Helper functions for safe data conversion
-def _serialize_result_row(row, timestamp_utc=None):
-    """Convert a pandas Series row into JSON-serializable primitives."""
-    payload = {}
+def _serialize_result_frame(df, timestamps_utc):
+    """Convert a results DataFrame into JSON-serializable record dicts, one per row.
 
-    if timestamp_utc is not None:
-        payload['timestamp'] = _normalize_for_json(timestamp_utc)
+    Columns are encoded in bulk by pandas' C JSON encoder (numpy scalars,
+    NaN -> null, ISO timestamps). Only object columns holding values that
+    encoder cannot represent are normalized value by value.
+    """
+    json_native = (str, bool, int, float, type(None))
+    fallback_columns = [
+        column for column in df.columns
+        if df[column].dtype == object
+        and not all(isinstance(value, json_native) for value in df[column])
+    ]
+
+    # Let the encoder emit the timestamp as the leading key rather than
+    # copying every record dict afterwards to prepend it
+    frame = df.drop(columns=fallback_columns)
+    if 'timestamp' not in df.columns:
+        frame.insert(0, 'timestamp', [timestamp.isoformat() for timestamp in timestamps_utc])
+
+    records = json.loads(frame.to_json(
+        orient='records',
+        date_format='iso',
+        date_unit='s',
+        double_precision=RAW_VALUES_DECIMALS,
+    ))
+    for column in fallback_columns:
+        key = str(column)
+        for record, value in zip(records, df[column]):
+            record[key] = _normalize_for_json(value)
+
+    return records
+
+
+def _normalize_float(value):
+    """Plain float for finite values, None for NaN."""
+    return None if value != value else float(value)
+
+
+def _normalize_passthrough(value):
+    return value
 
-    if hasattr(row, 'items'):
-        for key, value in row.items():
-            payload[str(key)] = _normalize_for_json(value)
 
-    return payload
+# Exact-type dispatch for the common scalar leaves; anything else (including
+# subclasses of these types) goes through the isinstance chain below.
+_JSON_NORMALIZERS = {
+    type(None): _normalize_passthrough,
+    str: _normalize_passthrough,
+    bool: _normalize_passthrough,
+    int: _normalize_passthrough,
+    float: _normalize_float,
+    np.float64: _normalize_float,
+    np.float32: _normalize_float,
+    np.int64: int,
+    np.int32: int,
+    np.bool_: bool,
+    Decimal: float,
+    pd.Timestamp: lambda value: value.to_pydatetime().isoformat(),
+    datetime: lambda value: value.isoformat(),
+}
 
 
 def _normalize_for_json(value):
     """Normalize values so they can be persisted in a JSONField."""
-    if value is None:
-        return None
+    normalizer = _JSON_NORMALIZERS.get(type(value))
+    if normalizer is not None:
+        return normalizer(value)
 
     if isinstance(value, dict):
         return {str(k): _normalize_for_json(v) for k, v in value.items()}
@@ -905,6 +1256,8 @@ def _normalize_for_json(value):
         return value.to_pydatetime().isoformat()
 
     if isinstance(value, datetime):
+        if value is pd.NaT:
+            return None
         return value.isoformat()
 
     if isinstance(value, np.datetime64):
@@ -935,64 +1288,25 @@ def _normalize_for_json(value):
         return float(value)
 
     if isinstance(value, float):
-        if pd.isna(value):
-            return None
-        return value
+        return None if value != value else value
 
-    try:
-        if pd.isna(value):
-            return None
-    except Exception:
-        pass
-
-    return value
-
-
-def _safe_float(value):
-    """Safely convert value to float, returning None if not possible"""
-    if value is None or str(value).lower() in ['nan', 'none', '']:
-        return None
-    try:
-        return float(value)
-    except (ValueError, TypeError):
-        return None
-
-
-def _safe_int(value):
-    """Safely convert value to int, returning None if not possible"""
-    if value is None or str(value).lower() in ['nan', 'none', '']:
-        return None
-    try:
-        return int(float(value))  # Convert through float first to handle decimal strings
-    except (ValueError, TypeError):
+    # Every other NaN-capable type is handled above; only the pandas missing
+    # sentinels remain, so skip the generic pd.isna dispatch
+    if value is pd.NA:
         return None
 
+    return value
 
-def _safe_datetime(value):
-    """Safely convert value to datetime, returning None if not possible"""
-    if value is None or str(value).strip().lower() in ['nan', 'none', '', 'nat']:
-        return None
-    try:
-        # Handle pandas/NumPy timestamp objects
-        if hasattr(value, 'to_pydatetime'):
-            return value.to_pydatetime()
-        if hasattr(value, 'tz_convert'):
-            return value.tz_convert('UTC').to_pydatetime()
-
-        # Parse string values – require a full date component
-        if isinstance(value, str):
-            if not re.search(r'\d{4}-\d{2}-\d{2}', value):
-                return None
-            parsed = pd.to_datetime(value, errors='coerce')
-            if pd.isna(parsed):
-                return None
-            if hasattr(parsed, 'to_pydatetime'):
-                return parsed.to_pydatetime()
-            return parsed
 
-        return value
-    except (ValueError, TypeError, AttributeError):
-        return None
+@lru_cache(maxsize=64)
+def _parse_bool_str(text):
+    """Map a boolean-like string to True/False, or None when it is not recognised."""
+    lowered = text.strip().lower()
+    if lowered in {'', '0', 'false', 'no', 'off', 'n'}:
+        return False
+    if lowered in {'1', 'true', 'yes', 'on', 'y'}:
+        return True
+    return None
 
 
 def _safe_bool(value):
@@ -1000,12 +1314,13 @@ def _safe_bool(value):
     if value is None:
         return False
 
+    if isinstance(value, (bool, int, np.bool_, np.integer)):
+        return bool(value)
+
     if isinstance(value, str):
-        lowered = value.strip().lower()
-        if lowered in {'', '0', 'false', 'no', 'off', 'n'}:
-            return False
-        if lowered in {'1', 'true', 'yes', 'on', 'y'}:
-            return True
+        parsed = _parse_bool_str(value)
+        if parsed is not None:
+            return parsed
 
     try:
         if pd.isna(value):
@@ -1024,6 +1339,7 @@ def check_system_alerts(self):
     Periodic task to check system alerts
     This should run every minute or few minutes
     """
+    now = timezone.now()
     try:
         from .alerting import alerting_service
 
@@ -1044,7 +1360,7 @@ def check_system_alerts(self):
             return {
                 'status': 'error',
                 'message': 'No PI data available',
-                'timestamp': timezone.now().isoformat()
+                'timestamp': now.isoformat()
             }
 
         # Update task state
@@ -1059,11 +1375,11 @@ def check_system_alerts(self):
 
         # Log results
         if triggered_alerts:
-            logger.info(f"Triggered {len(triggered_alerts)} alerts")
+            logger.info("Triggered %s alerts", len(triggered_alerts))
             for alert in triggered_alerts:
                 logger.info(
-                    f"Alert: {alert['alert_name']} ({alert['severity']}) "
-                    f"for user {alert['username']}"
+                    "Alert: %s (%s) for user %s",
+                    alert['alert_name'], alert['severity'], alert['username'],
                 )
 
         # Update system status
@@ -1073,7 +1389,7 @@ def check_system_alerts(self):
             pi_data_available=True,
             alert_system_active=True,
             status_message=f"Checked {len(system_data)} parameters, triggered {len(triggered_alerts)} alerts",
-            last_pi_update=timezone.now()
+            last_pi_update=now
         )
 
         return {
@@ -1087,11 +1403,11 @@ def check_system_alerts(self):
                     'severity': alert['severity']
                 } for alert in triggered_alerts
             ],
-            'timestamp': timezone.now().isoformat()
+            'timestamp': now.isoformat()
         }
 
     except Exception as e:
-        logger.error(f"Error in check_system_alerts task: {str(e)}")
+        logger.error("Error in check_system_alerts task: %s", e)
 
         # Update system status
         try:
@@ -1108,7 +1424,7 @@ def check_system_alerts(self):
         return {
             'status': 'error',
             'error': str(e),
-            'timestamp': timezone.now().isoformat()
+            'timestamp': now.isoformat()
         }
 
 
@@ -1118,28 +1434,30 @@ def cleanup_old_alert_logs():
     Clean up old alert logs (run daily)
     Keep logs for 30 days by default
     """
+    now = timezone.now()
     try:
         from .models import AlertLog
 
-        cutoff_date = timezone.now() - timedelta(days=30)
-        deleted_count, _ = AlertLog.objects.filter(
-            created_at__lt=cutoff_date
-        ).delete()
+        cutoff_date = now - timedelta(days=30)
+        # AlertLog has no dependents or delete signals, so skip the collector
+        # and issue a single DELETE
+        expired = AlertLog.objects.filter(created_at__lt=cutoff_date)
+        deleted_count = expired._raw_delete(expired.db)
 
-        logger.info(f"Cleaned up {deleted_count} old alert logs")
+        logger.info("Cleaned up %s old alert logs", deleted_count)
 
         return {
             'status': 'success',
             'deleted_count': deleted_count,
-            'timestamp': timezone.now().isoformat()
+            'timestamp': now.isoformat()
         }
 
     except Exception as e:
-        logger.error(f"Error in cleanup_old_alert_logs task: {str(e)}")
+        logger.error("Error in cleanup_old_alert_logs task: %s", e)
         return {
             'status': 'error',
             'error': str(e),
-            'timestamp': timezone.now().isoformat()
+            'timestamp': now.isoformat()
         }
 
 
@@ -1148,56 +1466,70 @@ def send_alert_summary_email(user_id):
     """
     Send daily/weekly alert summary email to user
     """
+    now = timezone.now()
     try:
         from django.contrib.auth.models import User
         from django.core.mail import send_mail
         from django.conf import settings
+        from django.db.models import Count, Q
         from .models import AlertLog
 
         user = User.objects.get(id=user_id)
 
         # Get alerts from last 24 hours
-        since = timezone.now() - timedelta(hours=24)
+        since = now - timedelta(hours=24)
         recent_alerts = AlertLog.objects.filter(
             user=user,
             created_at__gte=since
-        ).order_by('-severity', '-created_at')
+        )
+
+        # Count every severity in a single query
+        counts = recent_alerts.aggregate(
+            total=Count('id'),
+            critical=Count('id', filter=Q(severity='critical')),
+            warning=Count('id', filter=Q(severity='warning')),
+            info=Count('id', filter=Q(severity='info')),
+        )
+        total_count = counts['total']
 
-        if not recent_alerts.exists():
-            logger.info(f"No alerts to summarize for user {user.username}")
+        if not total_count:
+            logger.info("No alerts to summarize for user %s", user.username)
             return {
                 'status': 'success',
                 'message': 'No alerts in period'
             }
 
         # Build summary
-        critical_count = recent_alerts.filter(severity='critical').count()
-        warning_count = recent_alerts.filter(severity='warning').count()
-        info_count = recent_alerts.filter(severity='info').count()
+        critical_count = counts['critical']
+        warning_count = counts['warning']
+        info_count = counts['info']
 
         subject = f"ABAY Alert Summary - {critical_count} Critical, {warning_count} Warnings"
 
         body = f"""
 ABAY Reservoir Optimization - Daily Alert Summary
 
-Period: {since.strftime('%Y-%m-%d %H:%M')} to {timezone.now().strftime('%Y-%m-%d %H:%M')} PT
+Period: {since.strftime('%Y-%m-%d %H:%M')} to {now.strftime('%Y-%m-%d %H:%M')} PT
 
 Summary:
 - Critical Alerts: {critical_count}
 - Warnings: {warning_count}
 - Info Alerts: {info_count}
-- Total: {recent_alerts.count()}
+- Total: {total_count}
 
 Recent Alerts:
 """
 
-        for alert in recent_alerts[:20]:  # Show top 20
+        top_alerts = recent_alerts.order_by('-severity', '-created_at').values(
+            'created_at', 'severity', 'message'
+        )[:20]
+        for alert in top_alerts:  # Show top 20
             body += f"""
-{alert.created_at.strftime('%H:%M')} - {alert.severity.upper()}: {alert.message}
+{alert['created_at'].strftime('%H:%M')} - {alert['severity'].upper()}: {alert['message']}
 """
 
-        if recent_alerts.count() > 20:
-            body += f"\n... and {recent_alerts.count() - 20} more alerts"
+        if total_count > 20:
+            body += f"\n... and {total_count - 20} more alerts"
 
         body += f"""
 
@@ -1214,30 +1546,39 @@ To update your notification preferences: {getattr(settings, 'SITE_URL', 'http://
             fail_silently=False
         )
 
-        logger.info(f"Alert summary sent to {user.email}")
+        logger.info("Alert summary sent to %s", user.email)
 
         return {
             'status': 'success',
-            'alerts_summarized': recent_alerts.count(),
+            'alerts_summarized': total_count,
             'sent_to': user.email
         }
 
     except Exception as e:
-        logger.error(f"Error sending alert summary: {str(e)}")
+        logger.error("Error sending alert summary: %s", e)
         return {
             'status': 'error',
             'error': str(e)
         }
 
 
+@lru_cache(maxsize=1)
+def _twilio_client():
+    """Twilio REST client shared by every call in this worker process."""
+    return TwilioClient(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+
+
 @shared_task
 def test_twilio_connection():
     """
     Test Twilio configuration and connection
     """
     try:
-        from django.conf import settings
-        from twilio.rest import Client
+        if TwilioClient is None:
+            return {
+                'status': 'error',
+                'message': 'Twilio library not installed'
+            }
 
         if not hasattr(settings, 'TWILIO_ACCOUNT_SID'):
             return {
@@ -1245,7 +1586,7 @@ def test_twilio_connection():
                 'message': 'Twilio credentials not configured'
             }
 
-        client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+        client = _twilio_client()
 
         # Test by fetching account info
         account = client.api.accounts(settings.TWILIO_ACCOUNT_SID).fetch()
@@ -1258,7 +1599,7 @@ def test_twilio_connection():
         }
 
     except Exception as e:
-        logger.error(f"Twilio test failed: {str(e)}")
+        logger.error("Twilio test failed: %s", e)
         return {
             'status': 'error',
             'error': str(e)
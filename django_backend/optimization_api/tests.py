@@ -96,3 +96,266 @@ def test_refresh_pi_data_and_latest_results(tmp_path, settings, monkeypatch):
     chart = latest_resp.data['chart_data']
     assert chart['elevation']['actual'][0] == 1.0
     assert chart['elevation']['optimized'][0] == 4.0
+
+
+def test_save_optimization_results_maps_columns():
+    from .models import OptimizationResult
+    from .tasks import _save_optimization_results
+
+    index = pd.date_range('2024-07-01 00:00', periods=3, freq='h', tz='America/Los_Angeles')
+    df = pd.DataFrame({
+        'R4_Forecast_CFS': [100.0, float('nan'), 120.0],
+        'R4_Flow': [1.0, 2.0, 3.0],
+        'R20_Flow': [50.0, float('nan'), 40.0],
+        'R5L_Flow': [10.0, 5.0, float('nan')],
+        'ABAY_ft': [1170.5, 1171.0, 1171.5],
+        'Mode': [1.0, float('nan'), 2.0],
+        'is_forecast': [False, True, True],
+        'setpoint_change_time': ['', '2024-07-01T01:30:00-07:00', ''],
+    }, index=index)
+    run = OptimizationRun.objects.create(status='running')
+
+    _save_optimization_results(run, df)
+
+    results = list(OptimizationResult.objects.filter(optimization_run=run).order_by('timestamp_utc'))
+    assert len(results) == 3
+    assert results[0].timestamp_utc == index[0]
+    assert results[0].r4_flow_cfs == 100.0
+    assert results[1].r4_flow_cfs is None
+    assert results[0].r20_minus_r5l_cfs == 40.0
+    assert results[1].r20_minus_r5l_cfs == -5.0
+    assert results[2].r20_minus_r5l_cfs == 40.0
+    assert results[2].r5l_flow_cfs is None
+    assert results[0].abay_elev_ft == 1170.5
+    assert results[1].ccs_mode == 0
+    assert results[2].ccs_mode == 2
+    assert [r.is_forecast for r in results] == [False, True, True]
+    assert results[0].setpoint_adjust_time_pt is None
+    assert results[1].setpoint_adjust_time_pt == pd.Timestamp('2024-07-01T08:30:00Z')
+    assert results[1].raw_values['R4_Forecast_CFS'] is None
+    assert results[2].raw_values['ABAY_ft'] == 1171.5
+    assert results[0].raw_values['timestamp'].startswith('2024-07-01T07:00:00')
+
+    # Saving again replaces the run's previous rows
+    _save_optimization_results(run, df)
+    assert OptimizationResult.objects.filter(optimization_run=run).count() == 3
+
+
+def test_calculate_summary_statistics():
+    from .tasks import _calculate_summary_statistics
+
+    nan = float('nan')
+    df = pd.DataFrame({
+        'Spill_Volume_AF_Recalc': [1.0, nan, 3.0],
+        'OXPH_generation_MW': [2.0, nan, 4.0],
+        'ABAY_ft': [nan, 1170.0, 1171.0],
+        'ABAY_Error_CFS': [1.0, -3.0, nan],
+    })
+
+    stats = _calculate_summary_statistics(df)
+
+    assert stats['total_spillage_af'] == 4.0
+    assert stats['max_hourly_spillage_af'] == 3.0
+    # Missing generation counts as zero MW
+    assert stats['min_oxph_mw'] == 0.0
+    assert stats['avg_oxph_utilization_pct'] == pytest.approx(2.0 / 5.8 * 100)
+    assert stats['peak_elevation_ft'] == 1171.0
+    assert stats['min_elevation_ft'] == 1170.0
+    assert stats['r_bias_cfs'] == -1.0
+    assert stats['rmse_cfs'] == pytest.approx(5.0 ** 0.5)
+    assert 'avg_net_flow_cfs' not in stats
+    assert _calculate_summary_statistics(pd.DataFrame()) == {}
+
+
+def test_prepare_chart_data_forecast_rows(monkeypatch):
+    from . import views
+
+    nan = float('nan')
+    index = pd.date_range('2024-07-01 07:00', periods=4, freq='h', tz='UTC')
+    results_df = pd.DataFrame({
+        'R4_Forecast_CFS': [100.0, nan, 120.0, nan],
+        'R30_Forecast_CFS': [nan, 200.0, nan, nan],
+        'MFRA_MW_forecast': [nan, 50.0, 60.0, nan],
+        'OXPH_generation_MW': [5.0, nan, 5.5, 6.0],
+        'OXPH_setpoint_MW': [3.0, 5.0, 5.0, 6.0],
+        'Mode': ['GEN ', ' ', 'GEN', nan],
+    }, index=index)
+    for position, timestamp in enumerate(index):
+        PIDatum.objects.create(
+            timestamp_utc=timestamp,
+            oxph_generation_mw=4.0 + position / 10,
+            r4_flow_cfs=10.0 + position,
+            r30_flow_cfs=20.0 + position,
+            mfp_total_gen_mw=1.0 + position,
+            ccs_mode=1.0,
+        )
+
+    # Hydro forecasts sit 20 minutes off the results index and stop an hour
+    # early, so only the first three rows find a match within 30 minutes
+    hydro_index = index[:3] + pd.Timedelta(minutes=20)
+    hydro_df = pd.DataFrame({
+        'R4_Forecast_CFS': [1000.0, 1001.0, 1002.0],
+        'R30_Forecast_CFS': [2000.0, 2001.0, 2002.0],
+    }, index=hydro_index)
+
+    def fake_forecasts(forecast_source, fallback_to_cnrfc=False):
+        return hydro_df if forecast_source == 'hydroforecast-short-term' else None
+
+    monkeypatch.setattr(views, 'get_combined_r4_r30_forecasts', fake_forecasts)
+    run = OptimizationRun.objects.create(status='completed', forecast_source='hydroforecast-short-term')
+
+    rows = views._prepare_chart_data(run, results_df=results_df)['forecast_data']
+
+    assert len(rows) == 4
+    # Forecast gaps fall back to the PI actual
+    assert [row['r4_forecast'] for row in rows] == [100.0, 11.0, 120.0, 13.0]
+    assert [row['r30_forecast'] for row in rows] == [20.0, 200.0, 22.0, 23.0]
+    assert [row['mfra_forecast'] for row in rows] == [1.0, 50.0, 60.0, 4.0]
+    assert [row['oxph'] for row in rows] == [5.0, 4.1, 5.5, 6.0]
+    assert [row['mfra_actual'] for row in rows] == [1.0, 2.0, 3.0, 4.0]
+    # A setpoint change is only flagged once the next row has settled on it
+    assert [row['setpoint'] for row in rows] == [3.0, 5.0, 5.0, 6.0]
+    assert [row['setpoint_change'] is not None for row in rows] == [False, True, False, True]
+    assert rows[1]['setpoint_change'] == rows[1]['datetime']
+    assert rows[1]['datetime'].startswith('2024-07-01T01:00:00')
+    # Modes are stripped and blanks become None
+    assert [row['mode_forecast'] for row in rows] == ['GEN', None, 'GEN', None]
+    assert [row['mode_actual'] for row in rows] == [1.0] * 4
+    # Nearest match within 30 minutes, then the run's own source fills the gap
+    assert [row['r4_hydro_forecast'] for row in rows] == [1000.0, 1001.0, 1002.0, 13.0]
+    assert [row['r30_hydro_forecast'] for row in rows] == [2000.0, 2001.0, 2002.0, 23.0]
+    assert [row['r4_cnrfc_forecast'] for row in rows] == [None] * 4
+
+
+def test_profile_post_writes_user_and_profile_once(client):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    user = User.objects.create_user(username='profile-user', password='old-pass')
+    client.force_login(user)
+
+    with CaptureQueriesContext(connection) as ctx:
+        resp = client.post(reverse('profile'), {
+            'first_name': 'Pat',
+            'last_name': 'Lee',
+            'email': 'pat@example.com',
+            'phone_number': '+15305550100',
+            'sms_notifications': 'on',
+            'dark_mode': 'on',
+            'default_tab': 'prices',
+            'refresh_interval': '120',
+        })
+
+    assert resp.status_code == 302
+    updates = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('UPDATE')]
+    assert len([sql for sql in updates if '"auth_user"' in sql]) == 1
+    assert len([sql for sql in updates if '"dark_mode"' in sql]) == 1
+
+    user.refresh_from_db()
+    profile = user.optimization_profile
+    assert user.first_name == 'Pat'
+    assert profile.phone_number == '+15305550100'
+    assert profile.sms_notifications is True
+    assert profile.dark_mode is True
+    assert profile.default_tab == 'prices'
+    assert profile.refresh_interval == 120
+
+
+def test_price_task_status_batch(monkeypatch):
+    from celery import Celery
+    from celery.backends.cache import CacheBackend
+    from . import views
+
+    backend = CacheBackend(app=Celery(set_as_current=False), backend='memory')
+    backend.store_result('task-progress', {'current': 40, 'total': 100, 'status': 'Fetching DA prices'}, 'PROGRESS')
+    backend.store_result('task-done', {'rows': 24}, 'SUCCESS')
+    monkeypatch.setattr(views, 'AsyncResult', lambda task_id: SimpleNamespace(backend=backend))
+
+    client = APIClient()
+    url = reverse('price_task_status_batch')
+    resp = client.post(url, {'task_ids': ['task-pending', 'task-progress', 'task-done', 'task-progress']}, format='json')
+    assert resp.status_code == 200
+    statuses = resp.data['statuses']
+    assert list(statuses) == ['task-pending', 'task-progress', 'task-done']
+    assert statuses['task-pending']['status'] == 'pending'
+    assert statuses['task-progress'] == {
+        'status': 'progress',
+        'message': 'Fetching DA prices',
+        'progress': 40,
+        'total': 100,
+    }
+    assert statuses['task-done'] == {'status': 'completed', 'result': {'rows': 24}}
+
+    too_many = [f'task-{i}' for i in range(views._PRICE_TASK_STATUS_BATCH_LIMIT + 1)]
+    assert client.post(url, {'task_ids': too_many}, format='json').status_code == 400
+    assert client.post(url, {'task_ids': 'task-done'}, format='json').status_code == 400
+
+
+def test_recalculate_coalesces_mixed_inputs(monkeypatch):
+    import warnings
+    from . import views
+
+    # Echo the input frame back so the response shows what the view parsed
+    monkeypatch.setattr(views, 'recalc_abay_path', lambda df, **kwargs: df.copy())
+
+    payload = {'forecastData': [
+        {'datetime': '2024-07-01T07:00:00Z', 'mode': 2, 'oxph': True, 'r4': '150'},
+        {'datetime': '2024-07-01T08:00:00Z', 'Mode': 'GEN', 'oxph': None, 'r4_forecast': 160},
+        {'datetime': '2024-07-01T09:00:00Z', 'oxph_forecast': 4.5, 'r4': 'bad'},
+        {'datetime': '2024-07-01T10:00:00Z', 'mode': 0, 'mfra': 120},
+    ]}
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', FutureWarning)
+        resp = APIClient().post(reverse('recalculate'), payload, format='json')
+
+    assert resp.status_code == 200
+    rows = resp.data['recalculated_data']
+    # Numeric modes come back as sent, not from a float-upcast column
+    assert [row['mode'] for row in rows] == ['2', 'GEN', 'GEN', 'GEN']
+    assert [row['oxph'] for row in rows] == [1.0, 0.0, 4.5, 0.0]
+    assert [row['r4'] for row in rows] == [150.0, 160.0, 0.0, 0.0]
+    assert [row['mfra'] for row in rows] == [0.0, 0.0, 0.0, 120.0]
+    assert [row['float_level'] for row in rows] == [1173.0] * 4
+
+
+def test_orjson_renderer_matches_drf_formats():
+    pytest.importorskip('orjson')
+    import datetime
+    from decimal import Decimal
+    from rest_framework.renderers import JSONRenderer
+    from .renderers import OrjsonRenderer
+
+    data = {
+        'created_at': datetime.datetime(2024, 7, 1, 7, 0, 0, 123456, tzinfo=datetime.timezone.utc),
+        'day': datetime.date(2024, 7, 1),
+        'at': datetime.time(7, 30, 0, 500),
+        'price': Decimal('41.25'),
+        'values': [1, 2.5, None, 'x y'],
+    }
+
+    assert OrjsonRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_parse_utc_timestamps_iso_only():
+    from .views import _parse_utc_timestamps
+
+    values = [
+        '2024-07-01T07:00:00Z',
+        '2024-07-01T00:00:00-07:00',
+        '2024-07-01 07:00',
+        'now',
+        'today',
+        '07/01/2024 07:00',
+        ' 2024-07-01T07:00:00Z ',
+        None,
+    ]
+
+    strict = _parse_utc_timestamps(values, iso_only=True)
+    expected = pd.Timestamp('2024-07-01T07:00:00Z')
+    assert list(strict[:3]) == [expected] * 3
+    assert strict[3:].isna().all()
+
+    # The recalc path keeps pandas' flexible parsing
+    lenient = _parse_utc_timestamps(values)
+    assert lenient[5] == expected
+    assert lenient[6] == expected
@@ -49,6 +49,7 @@ urlpatterns = [
     # Price data endpoints
     path('electricity-prices/', views.ElectricityPriceView.as_view(), name='electricity_prices'),
     path('price-analysis/', views.PriceAnalysisView.as_view(), name='price_analysis'),
+    path('price-task-status/', views.PriceTaskStatusBatchView.as_view(), name='price_task_status_batch'),
     path('price-task-status/<str:task_id>/', views.PriceTaskStatusView.as_view(), name='price_task_status'),
     path('activity/', activity_ping, name='activity_ping'),
 
@@ -1,28 +1,38 @@
 # django_backend/optimization_api/views.py
 
+import csv
 import os
 import sys
-import json
 import logging
 import re
 from copy import deepcopy
-from datetime import datetime, timedelta, time, date
+from datetime import datetime, timedelta, date
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
+from zoneinfo import ZoneInfo
+import numpy as np
 import pandas as pd
-import math, random
+import math
 
 from abay_opt import constants as abay_constants
+from abay_opt import data_fetcher
+from abay_opt import schedule as abay_schedule
+from abay_opt.caiso_da import fetch_mfp1_da_awards, aggregate_hourly_mw
 from abay_opt.data_fetcher import get_combined_r4_r30_forecasts
 from abay_opt.recalc import recalc_abay_path
 from abay_opt.utils import AF_PER_CFS_HOUR
 
 from django.shortcuts import render
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q
 from django.http import JsonResponse
 from django.utils import timezone  # Add this line
-from django.utils.dateparse import parse_datetime
+from celery.result import AsyncResult
 from django.contrib.auth.models import User
-from rest_framework import viewsets, status, permissions
+from rest_framework import viewsets, status, permissions, serializers
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.decorators import action
@@ -31,9 +41,14 @@ from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth import update_session_auth_hash, logout
 from django.contrib import messages
-from django.views.decorators.http import require_http_methods
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import conditional_page, require_http_methods
 
-from .tasks import run_optimization_task
+from .tasks import (
+    run_optimization_task, _bulk_ingest_pi, _price_records, _get_simulated_price_data_sync,
+    _cache_get, _cache_set, _price_cache_key, _yes_energy_cache_timeout,
+)
 from .models import (
     OptimizationRun, ParameterSet, OptimizationResult, UserPreferences,
     UserProfile, PIDatum, CAISODAAward, CAISODAAwardSummary,
@@ -46,10 +61,44 @@ from .serializers import (
 
 logger = logging.getLogger(__name__)
 
+# CAISO trade dates and chart labels are in Pacific time
+TZ_PT = ZoneInfo('America/Los_Angeles')
+
+# Shared generator for simulated data; draws whole arrays per call
+_rng = np.random.default_rng()
+
+# Result CSVs are written through a 1 MiB buffer so to_csv's many small
+# writes are flushed in a handful of write() syscalls
+_CSV_WRITE_BUFFER = 1 << 20
+
+# Resolve the project root and make abay_opt importable once at import time
+# rather than on every request
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+_YES_ENERGY_CONFIG = str(_PROJECT_ROOT / 'abay_opt' / 'config')
+
+try:
+    from abay_opt import yes_energy_grab as _yes_energy
+except ImportError as e:
+    logger.warning(f"Could not import YES Energy module: {e}")
+    _yes_energy = None
+
 # Global variable to track if optimization modules are loaded
 _optimization_modules_loaded = False
 _optimization_constants = None
 
+# OptimizationSettingsView payloads, keyed by id() of the constants module they were built from
+_optimization_settings_cache = {}
+
+# RaftingConfigView payloads, keyed by id() of the constants module they were built from
+_rafting_config_cache = {}
+
+# Early-release Saturdays as dates, for O(1) membership tests in RaftingTimesView
+_EARLY_RELEASE_DATES = frozenset(
+    date(year, month, day) for month, day, year in abay_constants.EARLY_RELEASE_SATURDAYS
+)
+
 
 def load_optimization_modules():
     """Dynamically load optimization modules"""
@@ -59,18 +108,13 @@ def load_optimization_modules():
         return True
 
     try:
-        current_dir = Path(__file__).resolve().parent
-        project_root = current_dir.parent.parent
-        
-        if str(project_root) not in sys.path:
-            sys.path.insert(0, str(project_root))
-
         import abay_opt.constants as constants
         # We might also want to ensure optimizer is importable
         import abay_opt.optimizer
 
         _optimization_constants = constants
         _optimization_modules_loaded = True
+        _optimization_settings_cache.clear()
         logger.info("Optimization modules loaded successfully")
         return True
 
@@ -101,61 +145,46 @@ class ElectricityPriceView(APIView):
                 logger.info("USE_SIMULATED_DATA is True - returning simulated price data")
                 return self._get_simulated_price_data(node_id)
 
-            # Dynamic import of YES Energy module
-            current_dir = Path(__file__).resolve().parent
-            project_root = current_dir.parent.parent
-            abay_opt_path = project_root / 'abay_opt'
+            # Serve real prices cached by this view or fetch_price_data_task
+            cached = _cache_get(_price_cache_key(node_id))
+            if cached:
+                logger.info(f"Returning cached price data for node {node_id}")
+                return Response(cached)
 
-            if str(project_root) not in sys.path:
-                sys.path.insert(0, str(project_root))
+            if _yes_energy is None:
+                logger.warning("YES Energy module unavailable, using simulation")
+                return self._get_simulated_price_data(node_id)
 
-            # Import YES Energy module
-            try:
-                import abay_opt.yes_energy_grab as yes_energy
-                logger.info("Successfully imported YES Energy module")
+            # Fetch real price data
+            price_data_df = _yes_energy.get_current_electricity_prices(
+                node_id=node_id,
+                config_file=_YES_ENERGY_CONFIG
+            )
 
-                # Fetch real price data
-                price_data_df = yes_energy.get_current_electricity_prices(
-                    node_id=node_id,
-                    config_file=str(project_root / 'abay_opt' / 'config')
-                )
+            if price_data_df.empty:
+                logger.warning("YES Energy API returned empty data, using simulation")
+                return self._get_simulated_price_data(node_id)
 
-                if price_data_df.empty:
-                    logger.warning("YES Energy API returned empty data, using simulation")
-                    return self._get_simulated_price_data(node_id)
-
-                # Convert DataFrame to JSON-serializable format
-                price_data = []
-                for idx, row in price_data_df.iterrows():
-                    price_data.append({
-                        'timestamp': idx.isoformat(),
-                        'day_ahead_price': float(row.get('Day_Ahead_Price', 0)) if pd.notna(
-                            row.get('Day_Ahead_Price')) else None,
-                        'real_time_price': float(row.get('Real_Time_Price', 0)) if pd.notna(
-                            row.get('Real_Time_Price')) else None,
-                        'fifteen_min_price': float(row.get('Fifteen_Min_Price', 0)) if pd.notna(
-                            row.get('Fifteen_Min_Price')) else None,
-                    })
-
-                # Get price statistics
-                stats = yes_energy.get_price_statistics(price_data_df)
+            # Convert DataFrame to JSON-serializable format column-wise
+            price_data = _price_records(price_data_df)
 
-                return Response({
-                    'status': 'success',
-                    'node_id': node_id,
-                    'data_source': 'yes_energy_api',
-                    'data_count': len(price_data),
-                    'price_data': price_data,
-                    'statistics': stats,
-                    'data_range': {
-                        'start': price_data_df.index.min().isoformat() if not price_data_df.empty else None,
-                        'end': price_data_df.index.max().isoformat() if not price_data_df.empty else None
-                    }
-                })
+            # Get price statistics
+            stats = _yes_energy.get_price_statistics(price_data_df)
 
-            except ImportError as e:
-                logger.warning(f"Could not import YES Energy module: {e}")
-                return self._get_simulated_price_data(node_id)
+            payload = {
+                'status': 'success',
+                'node_id': node_id,
+                'data_source': 'yes_energy_api',
+                'data_count': len(price_data),
+                'price_data': price_data,
+                'statistics': stats,
+                'data_range': {
+                    'start': price_data_df.index.min().isoformat() if not price_data_df.empty else None,
+                    'end': price_data_df.index.max().isoformat() if not price_data_df.empty else None
+                }
+            }
+            _cache_set(_price_cache_key(node_id), payload, _yes_energy_cache_timeout())
+            return Response(payload)
 
         except Exception as e:
             logger.error(f"Error in ElectricityPriceView: {e}")
@@ -168,58 +197,8 @@ class ElectricityPriceView(APIView):
 
     def _get_simulated_price_data(self, node_id):
         """Generate simulated price data when real data is not available"""
-        logger.info(f"Generating simulated price data for node {node_id}")
-
         try:
-            now = timezone.now()
-            price_data = []
-
-            for i in range(48):  # 48 hours of data
-                timestamp = now + timedelta(hours=i)
-
-                # Simulate realistic price patterns
-                base_price = 45.0  # Base price in $/MWh
-                time_factor = 1.0 + 0.3 * math.sin((timestamp.hour - 6) / 24 * 2 * math.pi)
-                volatility = random.uniform(0.8, 1.2)
-
-                day_ahead = base_price * time_factor * volatility
-                real_time = day_ahead * random.uniform(0.9, 1.1)
-                fifteen_min = real_time * random.uniform(0.95, 1.05)
-
-                price_data.append({
-                    'timestamp': timestamp.isoformat(),
-                    'day_ahead_price': round(day_ahead, 2),
-                    'real_time_price': round(real_time, 2),
-                    'fifteen_min_price': round(fifteen_min, 2),
-                })
-
-            stats = {
-                'Day_Ahead_Price': {
-                    'current': price_data[-1]['day_ahead_price'],
-                    'min': min(p['day_ahead_price'] for p in price_data),
-                    'max': max(p['day_ahead_price'] for p in price_data),
-                    'mean': sum(p['day_ahead_price'] for p in price_data) / len(price_data),
-                    'count': len(price_data)
-                },
-                'Real_Time_Price': {
-                    'current': price_data[-1]['real_time_price'],
-                    'min': min(p['real_time_price'] for p in price_data),
-                    'max': max(p['real_time_price'] for p in price_data),
-                    'mean': sum(p['real_time_price'] for p in price_data) / len(price_data),
-                    'count': len(price_data)
-                }
-            }
-
-            return Response({
-                'status': 'success',
-                'node_id': node_id,
-                'data_source': 'simulation',
-                'data_count': len(price_data),
-                'price_data': price_data,
-                'statistics': stats,
-                'message': 'Using simulated data - YES Energy API not available',
-                'fetched_at': timezone.now().isoformat()
-            })
+            return Response(_get_simulated_price_data_sync(node_id))
 
         except Exception as e:
             logger.error(f"Error generating simulated price data: {e}")
@@ -234,35 +213,74 @@ class ElectricityPriceView(APIView):
 class CAISODAAwardsView(APIView):
     """API endpoint for CAISO Day Ahead awards for Middle Fork (MFP1)"""
 
+    # Stored awards only change when post() refetches a date, which clears
+    # that date's entries
+    cache_timeout = 3600
+
+    @staticmethod
+    def _cache_key(trade_dt, include_detail):
+        return f"caiso_da_awards_{trade_dt.isoformat()}_{'detail' if include_detail else 'summary'}"
+
     def get(self, request):
         """Return stored DA awards for a given trade date.
 
         Query params:
           - trade_date: ISO date string (default: next delivery day)
           - detail: if "true", include per-resource breakdown from CAISODAAward
+          - limit / offset: optional page of the detail rows (default: all rows)
         """
         try:
-            import pytz
-            tz_pt = pytz.timezone('America/Los_Angeles')
-
             trade_date_str = request.query_params.get('trade_date')
             if trade_date_str:
                 trade_dt = date.fromisoformat(trade_date_str)
             else:
                 # Default to next delivery day
-                now_pt = timezone.now().astimezone(tz_pt)
+                now_pt = timezone.now().astimezone(TZ_PT)
                 trade_dt = (now_pt + timedelta(days=1)).date() if now_pt.hour >= 13 else now_pt.date()
 
-            summaries = CAISODAAwardSummary.objects.filter(trade_date=trade_dt).order_by('interval_start_utc')
-            has_awards = summaries.exists()
+            include_detail = request.query_params.get('detail', '').lower() == 'true'
+
+            # Optional paging of the detail rows, applied as SQL LIMIT/OFFSET
+            limit = request.query_params.get('limit')
+            offset = request.query_params.get('offset')
+            paginated = include_detail and (limit is not None or offset is not None)
+            if paginated:
+                try:
+                    offset = int(offset) if offset is not None else 0
+                    limit = int(limit) if limit is not None else None
+                except ValueError:
+                    return Response({
+                        'error': 'limit and offset must be integers',
+                    }, status=status.HTTP_400_BAD_REQUEST)
+                if offset < 0 or (limit is not None and limit < 1):
+                    return Response({
+                        'error': 'offset must be >= 0 and limit must be >= 1',
+                    }, status=status.HTTP_400_BAD_REQUEST)
+
+            # Pages are not cached; only the two full responses are invalidated on refetch
+            cache_key = self._cache_key(trade_dt, include_detail)
+            cached = None if paginated else _cache_get(cache_key)
+            if cached:
+                return Response(cached)
+
+            # One query for the summary rows; existence and fetched_at come from the same list
+            summaries = list(CAISODAAwardSummary.objects.filter(
+                trade_date=trade_dt
+            ).order_by('interval_start_utc').values(
+                'interval_start_utc', 'total_mw', 'resource_count', 'fetched_at'
+            ))
+            has_awards = bool(summaries)
 
             hourly = []
-            for s in summaries:
-                hourly.append({
-                    'interval_start_utc': s.interval_start_utc.isoformat(),
-                    'total_mw': s.total_mw,
-                    'resource_count': s.resource_count,
-                })
+            if has_awards:
+                # Columnar conversion; timestamps are UTC so the offset is fixed
+                hourly_df = pd.DataFrame.from_records(
+                    summaries, columns=['interval_start_utc', 'total_mw', 'resource_count']
+                )
+                hourly_df['interval_start_utc'] = pd.to_datetime(
+                    hourly_df['interval_start_utc'], utc=True
+                ).dt.strftime('%Y-%m-%dT%H:%M:%S+00:00')
+                hourly = hourly_df.to_dict('records')
 
             response_data = {
                 'status': 'success',
@@ -270,35 +288,54 @@ class CAISODAAwardsView(APIView):
                 'has_awards': has_awards,
                 'hours': len(hourly),
                 'hourly_data': hourly,
-                'fetched_at': summaries.first().fetched_at.isoformat() if has_awards else None,
+                'fetched_at': summaries[0]['fetched_at'].isoformat() if has_awards else None,
             }
 
             # Include per-resource detail when requested
-            include_detail = request.query_params.get('detail', '').lower() == 'true'
             if include_detail and has_awards:
-                raw_awards = CAISODAAward.objects.filter(
+                awards_qs = CAISODAAward.objects.filter(
                     trade_date=trade_dt
-                ).order_by('interval_start_utc', 'resource')
-
-                resources = sorted(
-                    raw_awards.values_list('resource', flat=True).distinct()
+                ).order_by('interval_start_utc', 'resource').values(
+                    'interval_start_utc', 'resource', 'mw', 'product_type', 'schedule_type'
                 )
 
-                detail_rows = []
-                for award in raw_awards:
-                    hour_pt = award.interval_start_utc.astimezone(tz_pt)
-                    detail_rows.append({
-                        'hour_pt': hour_pt.strftime('%I:%M %p'),
-                        'hour_utc': award.interval_start_utc.strftime('%H:%M'),
-                        'resource': award.resource,
-                        'mw': award.mw,
-                        'product_type': award.product_type,
-                        'schedule_type': award.schedule_type,
-                    })
+                if paginated:
+                    end = offset + limit if limit is not None else None
+                    raw_awards = list(awards_qs[offset:end])
+                    # A page may not cover every resource, so list them separately
+                    resources = list(CAISODAAward.objects.filter(
+                        trade_date=trade_dt
+                    ).order_by('resource').values_list('resource', flat=True).distinct())
+                    response_data['detail_offset'] = offset
+                    response_data['detail_limit'] = limit
+                else:
+                    # One query; the resource list is derived from the same rows
+                    raw_awards = list(awards_qs)
+                    resources = sorted({award['resource'] for award in raw_awards})
+
+                # Format all hour labels in one vectorized pass
+                starts = pd.to_datetime([award['interval_start_utc'] for award in raw_awards], utc=True)
+                hours_pt = starts.tz_convert(TZ_PT).strftime('%I:%M %p')
+                hours_utc = starts.strftime('%H:%M')
+
+                detail_rows = [
+                    {
+                        'hour_pt': hour_pt,
+                        'hour_utc': hour_utc,
+                        'resource': award['resource'],
+                        'mw': award['mw'],
+                        'product_type': award['product_type'],
+                        'schedule_type': award['schedule_type'],
+                    }
+                    for hour_pt, hour_utc, award in zip(hours_pt, hours_utc, raw_awards)
+                ]
 
                 response_data['resources'] = resources
                 response_data['detail'] = detail_rows
 
+            # Only cache published awards so a later fetch shows up immediately
+            if has_awards and not paginated:
+                _cache_set(cache_key, response_data, self.cache_timeout)
             return Response(response_data)
 
         except Exception as e:
@@ -308,6 +345,52 @@ class CAISODAAwardsView(APIView):
                 'detail': str(e),
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    @staticmethod
+    def _store_raw_awards(trade_dt, raw_df):
+        """Upsert raw award rows for one trade date in batched INSERTs."""
+        if not {'intervalStartTime', 'intervalEndTime'}.issubset(raw_df.columns):
+            logger.warning(f"Skipping raw awards: missing interval columns in {list(raw_df.columns)}")
+            return
+
+        awards = pd.DataFrame({
+            'ist': pd.to_datetime(raw_df['intervalStartTime'], utc=True, errors='coerce'),
+            'iet': pd.to_datetime(raw_df['intervalEndTime'], utc=True, errors='coerce'),
+            'resource': raw_df['resource'].fillna('UNKNOWN') if 'resource' in raw_df else 'UNKNOWN',
+            'product_type': raw_df['productType'].fillna('EN') if 'productType' in raw_df else 'EN',
+            'mw': pd.to_numeric(raw_df['MW'], errors='coerce') if 'MW' in raw_df else 0.0,
+            'schedule_type': raw_df['scheduleType'].fillna('FINAL') if 'scheduleType' in raw_df else 'FINAL',
+        })
+        valid = awards.dropna(subset=['ist', 'iet', 'mw'])
+        if len(valid) < len(awards):
+            logger.warning(f"Skipping {len(awards) - len(valid)} raw award rows with unparseable times or MW")
+        valid = valid.drop_duplicates(subset=['ist', 'resource', 'product_type'], keep='last')
+
+        CAISODAAward.objects.bulk_create(
+            [
+                CAISODAAward(
+                    trade_date=trade_dt,
+                    interval_start_utc=ist,
+                    interval_end_utc=iet,
+                    resource=resource,
+                    product_type=product_type,
+                    mw=mw,
+                    schedule_type=schedule_type,
+                )
+                for ist, iet, resource, product_type, mw, schedule_type in zip(
+                    pd.DatetimeIndex(valid['ist']).to_pydatetime(),
+                    pd.DatetimeIndex(valid['iet']).to_pydatetime(),
+                    valid['resource'].tolist(),
+                    valid['product_type'].tolist(),
+                    valid['mw'].astype(float).tolist(),
+                    valid['schedule_type'].tolist(),
+                )
+            ],
+            update_conflicts=True,
+            unique_fields=['trade_date', 'interval_start_utc', 'resource', 'product_type'],
+            update_fields=['interval_end_utc', 'mw', 'schedule_type'],
+            batch_size=500,
+        )
+
     @staticmethod
     def _fetch_and_store_date(trade_dt, fetch_fn, agg_fn):
         """Fetch DA awards for one trade date, store raw + summary in DB.
@@ -318,63 +401,62 @@ class CAISODAAwardsView(APIView):
         if raw_df is None or raw_df.empty:
             return 0, [], None
 
-        # Store raw award records (all resources/schedule types for diagnostics)
-        for _, row in raw_df.iterrows():
-            try:
-                ist = pd.Timestamp(row['intervalStartTime']).to_pydatetime()
-                iet = pd.Timestamp(row['intervalEndTime']).to_pydatetime()
-                CAISODAAward.objects.update_or_create(
-                    trade_date=trade_dt,
-                    interval_start_utc=ist,
-                    resource=row.get('resource', 'UNKNOWN'),
-                    product_type=row.get('productType', 'EN'),
-                    defaults={
-                        'interval_end_utc': iet,
-                        'mw': float(row.get('MW', 0)),
-                        'schedule_type': row.get('scheduleType', 'FINAL'),
-                    },
-                )
-            except Exception as row_err:
-                logger.warning(f"Skipping raw award row: {row_err}")
-
-        # Aggregate MDFKRL_2_PROJCT CLEARED awards and store summaries
+        # Aggregate MDFKRL_2_PROJCT CLEARED awards before touching the DB
         hourly_series = agg_fn(raw_df)
         summary_records = []
-        pacific = __import__('pytz').timezone('America/Los_Angeles')
         if hourly_series is not None:
-            for ts, mw_val in hourly_series.items():
-                CAISODAAwardSummary.objects.update_or_create(
-                    trade_date=trade_dt,
-                    interval_start_utc=ts.to_pydatetime(),
-                    defaults={
-                        'total_mw': float(mw_val),
-                        'resource_count': 1,  # filtered to MDFKRL_2_PROJCT
-                    },
-                )
-                # Include chart-compatible label (matches _prepare_chart_data format)
-                ts_pt = ts.tz_convert(pacific)
-                summary_records.append({
+            hours = hourly_series.index
+            totals = hourly_series.astype(float).tolist()
+            # Include chart-compatible label (matches _prepare_chart_data format)
+            labels = hours.tz_convert(TZ_PT).strftime('%a %b %d, %H')
+            summary_records = [
+                {
                     'interval_start_utc': ts.isoformat(),
-                    'total_mw': float(mw_val),
-                    'label': ts_pt.strftime('%a %b %d, %H'),
-                })
+                    'total_mw': mw_val,
+                    'label': label,
+                }
+                for ts, mw_val, label in zip(hours, totals, labels)
+            ]
+
+        # Raw awards and summaries for the date commit together in one transaction
+        with transaction.atomic():
+            # Store raw award records (all resources/schedule types for diagnostics)
+            CAISODAAwardsView._store_raw_awards(trade_dt, raw_df)
+
+            if hourly_series is not None:
+                CAISODAAwardSummary.objects.bulk_create(
+                    [
+                        CAISODAAwardSummary(
+                            trade_date=trade_dt,
+                            interval_start_utc=ts,
+                            total_mw=mw_val,
+                            resource_count=1,  # filtered to MDFKRL_2_PROJCT
+                        )
+                        for ts, mw_val in zip(hours.to_pydatetime(), totals)
+                    ],
+                    update_conflicts=True,
+                    unique_fields=['trade_date', 'interval_start_utc'],
+                    update_fields=['total_mw', 'resource_count', 'fetched_at'],
+                    batch_size=500,
+                )
+
+        # Drop cached GET responses for this date now that it has been rewritten
+        cache.delete_many([
+            CAISODAAwardsView._cache_key(trade_dt, include_detail) for include_detail in (False, True)
+        ])
 
         return len(raw_df), summary_records, hourly_series
 
     def post(self, request):
         """Fetch fresh DA awards from CAISO for today AND tomorrow, store in DB."""
         try:
-            import pytz
-            tz_pt = pytz.timezone('America/Los_Angeles')
-            from abay_opt.caiso_da import fetch_mfp1_da_awards, aggregate_hourly_mw
-
             # If a specific date was requested, fetch only that date
             trade_date_str = request.data.get('trade_date')
             if trade_date_str:
                 dates_to_fetch = [date.fromisoformat(trade_date_str)]
             else:
                 # Fetch BOTH today and tomorrow
-                now_pt = timezone.now().astimezone(tz_pt)
+                now_pt = timezone.now().astimezone(TZ_PT)
                 today = now_pt.date()
                 tomorrow = today + timedelta(days=1)
                 dates_to_fetch = [today, tomorrow]
@@ -431,48 +513,112 @@ class PriceAnalysisView(APIView):
         return Response({'status': 'success', 'message': 'Price analysis placeholder'})
 
 
+def _price_task_status(state, info):
+    """Build the polling payload for a price fetch task state and info/result."""
+    if state == 'PENDING':
+        return {
+            'status': 'pending',
+            'message': 'Price data fetch is queued'
+        }
+    if state == 'PROGRESS':
+        return {
+            'status': 'progress',
+            'message': info.get('status', 'Fetching price data...'),
+            'progress': info.get('current', 0),
+            'total': info.get('total', 100)
+        }
+    if state == 'SUCCESS':
+        return {
+            'status': 'completed',
+            'result': info
+        }
+    if state == 'FAILURE':
+        return {
+            'status': 'failed',
+            'error': str(info)
+        }
+    return {
+        'status': 'unknown',
+        'state': state
+    }
+
+
 class PriceTaskStatusView(APIView):
     """Check the status of a background price data fetch task"""
 
     def get(self, request, task_id):
         """Get the current status of a price data fetch task"""
         try:
-            from celery.result import AsyncResult
+            task_result = AsyncResult(task_id)
+            return Response(_price_task_status(task_result.state, task_result.info))
+
+        except Exception as e:
+            logger.error(f"Error checking task status: {e}")
+            return Response({
+                'error': 'Failed to check task status',
+                'detail': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+# Upper bound on task ids per batch status request
+_PRICE_TASK_STATUS_BATCH_LIMIT = 100
+
+
+class PriceTaskStatusBatchView(APIView):
+    """Check the status of several background price data fetch tasks at once"""
 
+    @staticmethod
+    def _task_metas(task_ids):
+        """Return {task_id: (state, info)} using one backend round trip when possible."""
+        backend = AsyncResult(task_ids[0]).backend
+
+        # Key/value result backends (Redis, memcached, ...) can read all keys in one MGET
+        if hasattr(backend, 'mget') and hasattr(backend, 'get_key_for_task'):
+            keys = [backend.get_key_for_task(task_id) for task_id in task_ids]
+            values = backend.mget(keys)
+            if hasattr(values, 'get'):
+                # memcached-style clients return {key: value} for the keys they found
+                values = [values.get(key) for key in keys]
+            metas = {}
+            for task_id, value in zip(task_ids, values):
+                if value:
+                    meta = backend.decode_result(value)
+                    metas[task_id] = (meta['status'], meta['result'])
+                else:
+                    metas[task_id] = ('PENDING', None)
+            return metas
+
+        metas = {}
+        for task_id in task_ids:
             task_result = AsyncResult(task_id)
+            metas[task_id] = (task_result.state, task_result.info)
+        return metas
 
-            if task_result.state == 'PENDING':
-                response_data = {
-                    'status': 'pending',
-                    'message': 'Price data fetch is queued'
-                }
-            elif task_result.state == 'PROGRESS':
-                response_data = {
-                    'status': 'progress',
-                    'message': task_result.info.get('status', 'Fetching price data...'),
-                    'progress': task_result.info.get('current', 0),
-                    'total': task_result.info.get('total', 100)
-                }
-            elif task_result.state == 'SUCCESS':
-                response_data = {
-                    'status': 'completed',
-                    'result': task_result.result
-                }
-            elif task_result.state == 'FAILURE':
-                response_data = {
-                    'status': 'failed',
-                    'error': str(task_result.info)
-                }
-            else:
-                response_data = {
-                    'status': 'unknown',
-                    'state': task_result.state
+    def post(self, request):
+        """Get the current status of every task in ``task_ids``"""
+        task_ids = request.data.get('task_ids', [])
+        if not isinstance(task_ids, list) or not all(isinstance(task_id, str) for task_id in task_ids):
+            return Response({
+                'error': 'task_ids must be a list of task id strings'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        if len(task_ids) > _PRICE_TASK_STATUS_BATCH_LIMIT:
+            return Response({
+                'error': f'task_ids may list at most {_PRICE_TASK_STATUS_BATCH_LIMIT} tasks'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            # Preserve order, drop duplicates
+            task_ids = list(dict.fromkeys(task_ids))
+            metas = self._task_metas(task_ids) if task_ids else {}
+            return Response({
+                'statuses': {
+                    task_id: _price_task_status(state, info)
+                    for task_id, (state, info) in metas.items()
                 }
-            
-            return Response(response_data)
+            })
 
         except Exception as e:
-            logger.error(f"Error checking task status: {e}")
+            logger.error(f"Error checking task statuses: {e}")
             return Response({
                 'error': 'Failed to check task status',
                 'detail': str(e)
@@ -535,6 +681,33 @@ class OptimizationRunViewSet(viewsets.ModelViewSet):
             return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+# UI priority fields -> optimizer priority keys (integers clamped to 1-5)
+_PRIORITY_FIELDS = (
+    ('smoothOperation', 'smooth_operation'),
+    ('midpointElevation', 'midpoint_elevation'),
+)
+
+# UI advanced settings -> optimizer constant overrides (floats)
+_FLOAT_OVERRIDES = (
+    ('abayMinElevation', 'ABAY_MIN_ELEV_FT'),
+    ('abayMaxElevationBuffer', 'ABAY_MAX_ELEV_BUFFER_FT'),
+    ('oxphMinMW', 'OXPH_MIN_MW'),
+)
+
+
+def _ui_number(value, cast):
+    """Convert a UI value with ``cast``; values already of that type pass through.
+
+    Returns None when the value cannot be converted.
+    """
+    if type(value) is cast:
+        return value
+    try:
+        return cast(value)
+    except (ValueError, TypeError):
+        return None
+
+
 class RunOptimizationView(APIView):
     """API endpoint to start a new optimization run"""
 
@@ -636,26 +809,16 @@ class RunOptimizationView(APIView):
         }
 
         if 'avoidSpill' in ui_params:
-            try:
-                avoid = bool(ui_params['avoidSpill'])
-                processed['priorities']['avoid_spill'] = 1 if avoid else 5
-            except (ValueError, TypeError):
-                logger.warning(f"Invalid avoidSpill value: {ui_params['avoidSpill']}")
+            processed['priorities']['avoid_spill'] = 1 if bool(ui_params['avoidSpill']) else 5
 
         # Process priorities (ensure they're integers between 1-5)
-        priority_mapping = {
-            'smoothOperation': 'smooth_operation',
-            'midpointElevation': 'midpoint_elevation'
-        }
-
-        for ui_key, internal_key in priority_mapping.items():
+        for ui_key, internal_key in _PRIORITY_FIELDS:
             if ui_key in ui_params:
-                try:
-                    value = int(ui_params[ui_key])
-                    value = max(1, min(5, value))
-                    processed['priorities'][internal_key] = value
-                except (ValueError, TypeError):
+                value = _ui_number(ui_params[ui_key], int)
+                if value is None:
                     logger.warning(f"Invalid priority value for {ui_key}: {ui_params[ui_key]}")
+                else:
+                    processed['priorities'][internal_key] = max(1, min(5, value))
 
         # Process enable flags
         if 'enableSmoothing' in ui_params:
@@ -666,35 +829,21 @@ class RunOptimizationView(APIView):
 
         # Process custom weights (if provided directly)
         if 'smoothingWeight' in ui_params and ui_params.get('enableSmoothing', True):
-            try:
-                weight = float(ui_params['smoothingWeight'])
-                # Clamp to reasonable range
-                weight = max(0, min(10000, weight))
-                processed['custom_weights']['smoothing_weight'] = weight
-            except (ValueError, TypeError):
+            weight = _ui_number(ui_params['smoothingWeight'], float)
+            if weight is None:
                 logger.warning(f"Invalid smoothing weight: {ui_params['smoothingWeight']}")
+            else:
+                # Clamp to reasonable range
+                processed['custom_weights']['smoothing_weight'] = max(0, min(10000, weight))
 
         # Process advanced settings
-        if 'abayMinElevation' in ui_params:
-            try:
-                val = float(ui_params['abayMinElevation'])
-                processed['constants_overrides']['ABAY_MIN_ELEV_FT'] = val
-            except (ValueError, TypeError):
-                logger.warning(f"Invalid abayMinElevation: {ui_params['abayMinElevation']}")
-
-        if 'abayMaxElevationBuffer' in ui_params:
-            try:
-                val = float(ui_params['abayMaxElevationBuffer'])
-                processed['constants_overrides']['ABAY_MAX_ELEV_BUFFER_FT'] = val
-            except (ValueError, TypeError):
-                logger.warning(f"Invalid abayMaxElevationBuffer: {ui_params['abayMaxElevationBuffer']}")
-
-        if 'oxphMinMW' in ui_params:
-            try:
-                val = float(ui_params['oxphMinMW'])
-                processed['constants_overrides']['OXPH_MIN_MW'] = val
-            except (ValueError, TypeError):
-                logger.warning(f"Invalid oxphMinMW: {ui_params['oxphMinMW']}")
+        for ui_key, const_key in _FLOAT_OVERRIDES:
+            if ui_key in ui_params:
+                value = _ui_number(ui_params[ui_key], float)
+                if value is None:
+                    logger.warning(f"Invalid {ui_key}: {ui_params[ui_key]}")
+                else:
+                    processed['constants_overrides'][const_key] = value
 
         return processed if any(processed.values()) else None
 
@@ -730,16 +879,24 @@ class RunOptimizationView(APIView):
             run.completed_at = timezone.now()
             
             # Generate some fake stats
-            run.total_spillage_af = random.uniform(0, 100)
-            run.avg_oxph_utilization_pct = random.uniform(80, 100)
-            run.peak_elevation_ft = 1175.0 + random.uniform(-1, 1)
-            run.min_elevation_ft = 1170.0 + random.uniform(-1, 1)
+            spillage, utilization, peak_offset, min_offset = _rng.uniform(
+                [0, 80, -1, -1], [100, 100, 1, 1]
+            ).tolist()
+            run.total_spillage_af = spillage
+            run.avg_oxph_utilization_pct = utilization
+            run.peak_elevation_ft = 1175.0 + peak_offset
+            run.min_elevation_ft = 1170.0 + min_offset
             run.r_bias_cfs = 0.0
             
             # Create a dummy CSV file for the simulation
             self._generate_simulation_results_file(run)
-            
-            run.save()
+
+            # One UPDATE for the simulated outcome and the results file path
+            run.save(update_fields=[
+                'task_id', 'status', 'progress_percentage', 'progress_message', 'completed_at',
+                'total_spillage_af', 'avg_oxph_utilization_pct', 'peak_elevation_ft',
+                'min_elevation_ft', 'r_bias_cfs', 'result_file_path',
+            ])
 
             return Response({
                 'run_id': run.id,
@@ -765,28 +922,34 @@ class RunOptimizationView(APIView):
             filename = f'simulation_run_{run.id}.csv'
             file_path = Path(output_dir) / filename
             
-            # Generate 48 hours of data
+            # Generate 48 hours of data as whole columns, formatted to text up front
+            hours = 48
             start_time = timezone.now().replace(minute=0, second=0, microsecond=0)
-            data = []
-            
-            for i in range(48):
-                ts = start_time + timedelta(hours=i)
-                data.append({
-                    'timestamp_end': ts.isoformat(),
-                    'ABAY_ft': 1173.0 + math.sin(i/10),
-                    'OXPH_generation_MW': 4.0 + math.cos(i/10),
-                    'R4_Flow': 800 + random.uniform(-50, 50),
-                    'R30_Flow': 1200 + random.uniform(-50, 50),
-                    'FLOAT_FT': 1173.0,
-                    'Mode': 'GEN',
-                    'is_forecast': True
-                })
-                
-            df = pd.DataFrame(data)
-            df.to_csv(file_path)
+            i = np.arange(hours)
+
+            # timezone.now() is UTC, so the isoformat offset is fixed
+            timestamps = pd.date_range(start_time, periods=hours, freq='h').strftime('%Y-%m-%dT%H:%M:%S+00:00')
+            abay_ft = np.char.mod('%.4f', 1173.0 + np.sin(i / 10))
+            oxph_mw = np.char.mod('%.4f', 4.0 + np.cos(i / 10))
+            r4_flow = np.char.mod('%.4f', 800 + _rng.uniform(-50, 50, hours))
+            r30_flow = np.char.mod('%.4f', 1200 + _rng.uniform(-50, 50, hours))
+
+            # Streamed row by row with csv.writer; no DataFrame is built. The
+            # header has no index column: timestamp_end leads, which is what the
+            # index_col=0 reader in _load_run_results_from_csv expects.
+            with open(file_path, 'w', buffering=_CSV_WRITE_BUFFER, newline='') as f:
+                writer = csv.writer(f, lineterminator='\n')
+                writer.writerow([
+                    'timestamp_end', 'ABAY_ft', 'OXPH_generation_MW', 'R4_Flow', 'R30_Flow',
+                    'FLOAT_FT', 'Mode', 'is_forecast',
+                ])
+                writer.writerows(zip(
+                    timestamps, abay_ft, oxph_mw, r4_flow, r30_flow,
+                    repeat('1173.0000'), repeat('GEN'), repeat('True'),
+                ))
+            # Saved by the caller together with the rest of the simulated run
             run.result_file_path = str(file_path)
-            run.save()
-            
+
         except Exception as e:
             logger.error(f"Failed to generate simulation file: {e}")
 
@@ -806,6 +969,11 @@ class OptimizationSettingsView(APIView):
             global _optimization_constants
             constants = _optimization_constants
 
+            # Constants are fixed for the life of the process; build the payload once
+            cached = _optimization_settings_cache.get(id(constants))
+            if cached is not None:
+                return Response(cached)
+
             settings = {
                 'priorities': {
                     'smoothOperation': constants.PRIORITY_SMOOTH_OPERATION,
@@ -840,10 +1008,12 @@ class OptimizationSettingsView(APIView):
                 }
             }
 
-            return Response({
+            payload = {
                 'status': 'success',
                 'settings': settings
-            })
+            }
+            _optimization_settings_cache[id(constants)] = payload
+            return Response(payload)
 
         except Exception as e:
             logger.error(f"Error getting optimization settings: {e}")
@@ -855,8 +1025,62 @@ class OptimizationSettingsView(APIView):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+# Suggested client poll interval for OptimizationStatusView: doubles while a
+# run reports no new progress and resets to the minimum when it moves
+STATUS_POLL_MIN_MS = 500
+STATUS_POLL_MAX_MS = 10_000
+_STATUS_POLL_TRACK_LIMIT = 1024
+
+# task_id -> (last seen (status, progress, message), current interval in ms)
+_status_poll_state = {}
+
+
+def _next_poll_ms(task_id, progress_key, finished):
+    """Return the suggested delay before the next status poll for ``task_id``."""
+    if finished:
+        _status_poll_state.pop(task_id, None)
+        return STATUS_POLL_MIN_MS
+
+    previous = _status_poll_state.get(task_id)
+    if previous is None or previous[0] != progress_key:
+        interval = STATUS_POLL_MIN_MS
+    else:
+        interval = min(previous[1] * 2, STATUS_POLL_MAX_MS)
+
+    # Abandoned runs never reach a terminal poll; keep the table bounded
+    if previous is None and len(_status_poll_state) >= _STATUS_POLL_TRACK_LIMIT:
+        _status_poll_state.clear()
+    _status_poll_state[task_id] = (progress_key, interval)
+    return interval
+
+
 class OptimizationStatusView(APIView):
-    """Check the status of a running optimization"""
+    """Check the status of a running optimization.
+
+    Responses include ``next_poll_ms``, the suggested delay before polling
+    again. It grows while the run makes no progress (up to
+    ``STATUS_POLL_MAX_MS``) and drops back to ``STATUS_POLL_MIN_MS`` as soon
+    as the status, percentage or message changes.
+    """
+
+    # Columns read by get(); everything else (custom_parameters, file paths, ...) is left unloaded
+    _SIMULATION_FIELDS = (
+        'id', 'status', 'progress_message', 'progress_percentage',
+        'created_at', 'started_at', 'completed_at',
+        'total_spillage_af', 'avg_oxph_utilization_pct', 'peak_elevation_ft',
+        'min_elevation_ft', 'r_bias_cfs',
+    )
+    _STATUS_FIELDS = _SIMULATION_FIELDS + ('error_message', 'solver_diagnostics')
+    # Run metrics reported as the summary of a completed run; all are in _SIMULATION_FIELDS
+    _SUMMARY_FIELDS = (
+        'total_spillage_af', 'avg_oxph_utilization_pct', 'peak_elevation_ft',
+        'min_elevation_ft', 'r_bias_cfs',
+    )
+
+    @classmethod
+    def _summary_dict(cls, run):
+        """Summary metrics of a completed run, shared by the simulation and Celery paths"""
+        return {field: getattr(run, field) for field in cls._SUMMARY_FIELDS}
 
     def get(self, request, task_id):
         """Get the current status of an optimization task"""
@@ -864,7 +1088,7 @@ class OptimizationStatusView(APIView):
             # Handle simulation tasks
             if task_id.startswith('simulation-'):
                 run_id = int(task_id.split('-')[1])
-                run = OptimizationRun.objects.get(id=run_id)
+                run = OptimizationRun.objects.only(*self._SIMULATION_FIELDS).get(id=run_id)
 
                 return Response({
                     'run_id': run.id,
@@ -877,17 +1101,16 @@ class OptimizationStatusView(APIView):
                     'completed_at': run.completed_at,
                     'task_status': 'SUCCESS' if run.status == 'completed' else 'PROGRESS',
                     'simulation_mode': True,
-                    'summary': {
-                        'total_spillage_af': run.total_spillage_af,
-                        'avg_oxph_utilization_pct': run.avg_oxph_utilization_pct,
-                        'peak_elevation_ft': run.peak_elevation_ft,
-                        'min_elevation_ft': run.min_elevation_ft,
-                        'r_bias_cfs': run.r_bias_cfs,
-                    } if run.status == 'completed' else None
+                    'next_poll_ms': _next_poll_ms(
+                        task_id,
+                        (run.status, run.progress_percentage, run.progress_message),
+                        run.status in ('completed', 'failed'),
+                    ),
+                    'summary': self._summary_dict(run) if run.status == 'completed' else None
                 })
 
             # Get the optimization run
-            run = OptimizationRun.objects.get(task_id=task_id)
+            run = OptimizationRun.objects.only(*self._STATUS_FIELDS).get(task_id=task_id)
 
             response_data = {
                 'run_id': run.id,
@@ -901,9 +1124,12 @@ class OptimizationStatusView(APIView):
                 'error_message': run.error_message,
             }
 
-            # Try to get task status from Celery if available
-            try:
-                from celery.result import AsyncResult
+            # Finished runs already carry their outcome; skip the result backend lookup
+            if run.status == 'completed':
+                response_data['task_status'] = 'SUCCESS'
+            elif run.status == 'failed':
+                response_data['task_status'] = 'FAILURE'
+            else:
                 task_result = AsyncResult(task_id)
 
                 if task_result.state == 'PENDING':
@@ -934,18 +1160,15 @@ class OptimizationStatusView(APIView):
                     response_data['task_status'] = 'FAILURE'
                     response_data['task_error'] = str(task_result.info)
 
-            except ImportError:
-                response_data['task_status'] = 'SUCCESS' if run.status == 'completed' else 'PROGRESS'
+            response_data['next_poll_ms'] = _next_poll_ms(
+                task_id,
+                (run.status, response_data['progress_percentage'], response_data['progress_message']),
+                response_data.get('task_status') in ('SUCCESS', 'FAILURE'),
+            )
 
             # Add summary statistics if completed
             if run.status == 'completed':
-                response_data['summary'] = {
-                    'total_spillage_af': run.total_spillage_af,
-                    'avg_oxph_utilization_pct': run.avg_oxph_utilization_pct,
-                    'peak_elevation_ft': run.peak_elevation_ft,
-                    'min_elevation_ft': run.min_elevation_ft,
-                    'r_bias_cfs': run.r_bias_cfs,
-                }
+                response_data['summary'] = self._summary_dict(run)
 
             # Include solver status when available
             if run.solver_diagnostics:
@@ -1004,39 +1227,47 @@ class OptimizationStatusView(APIView):
 
     def _get_suggestions(self, diagnostics):
         """Provide actionable suggestions"""
-        suggestions = []
-
         if not diagnostics:
-            return suggestions
+            return []
 
         status = diagnostics.get('status', 'Unknown')
+        warnings = tuple(str(w) for w in diagnostics.get('warnings', [])) if status == 'Infeasible' else ()
+        return list(_suggestions_for(status, warnings))
+
+
+# Keyword in the solver warnings -> suggestions for an infeasible run
+_INFEASIBLE_WARNING_SUGGESTIONS = (
+    ('summer prep', ("Reduce the summer preparation buffer in parameters",
+                     "Check if the forecast provides enough inflow")),
+    ('head loss', ("Consider disabling head loss constraints",
+                   "Check if minimum OXPH MW is too high")),
+    ('initial volume', ("Initial reservoir level may be too low/high",
+                        "Adjust elevation buffer constraints")),
+)
 
-        if status == 'Infeasible':
-            # Check specific warnings
-            warnings_str = ' '.join(diagnostics.get('warnings', []))
-
-            if 'summer prep' in warnings_str.lower():
-                suggestions.append("Reduce the summer preparation buffer in parameters")
-                suggestions.append("Check if the forecast provides enough inflow")
 
-            if 'head loss' in warnings_str.lower():
-                suggestions.append("Consider disabling head loss constraints")
-                suggestions.append("Check if minimum OXPH MW is too high")
+@lru_cache(maxsize=256)
+def _suggestions_for(status, warnings):
+    """Suggestions for a solver status and its warnings; a failed run is polled repeatedly."""
+    suggestions = []
 
-            if 'initial volume' in warnings_str.lower():
-                suggestions.append("Initial reservoir level may be too low/high")
-                suggestions.append("Adjust elevation buffer constraints")
+    if status == 'Infeasible':
+        # Check specific warnings
+        warnings_str = ' '.join(warnings).lower()
+        for keyword, keyword_suggestions in _INFEASIBLE_WARNING_SUGGESTIONS:
+            if keyword in warnings_str:
+                suggestions.extend(keyword_suggestions)
 
-            # General suggestions
-            suggestions.append("Try reducing spillage penalty weight")
-            suggestions.append("Verify input flow forecasts are reasonable")
+        # General suggestions
+        suggestions.append("Try reducing spillage penalty weight")
+        suggestions.append("Verify input flow forecasts are reasonable")
 
-        elif status == 'Unbounded':
-            suggestions.append("Increase smoothing penalty weight")
-            suggestions.append("Check that spillage penalty is positive")
-            suggestions.append("Verify all weights are reasonable values")
+    elif status == 'Unbounded':
+        suggestions.append("Increase smoothing penalty weight")
+        suggestions.append("Check that spillage penalty is positive")
+        suggestions.append("Verify all weights are reasonable values")
 
-        return suggestions[:4]  # Limit to 4 suggestions
+    return tuple(suggestions[:4])  # Limit to 4 suggestions
 
 
 class OptimizationDiagnosticsView(APIView):
@@ -1128,40 +1359,134 @@ class HistoricalDataView(APIView):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     def _generate_historical_data(self, start_date, end_date):
-        """Generate simulated historical data"""
-        import math
-        import random
-
-        data = []
-        current_date = start_date
-
-        while current_date <= end_date:
-            # Generate hourly data points
-            for hour in range(24):
-                timestamp = current_date.replace(hour=hour)
-
-                # Simulate realistic data patterns
-                base_elevation = 1170 + math.sin(hour / 12 * math.pi) * 2
-                actual_elevation = base_elevation + random.uniform(-0.5, 0.5)
-                expected_elevation = base_elevation + 0.2 + random.uniform(-0.3, 0.3)
-                bias_corrected = base_elevation + 0.1 + random.uniform(-0.2, 0.2)
-
-                oxph_power = max(0, 2 + math.sin(hour / 6 * math.pi) * 1.5 + random.uniform(-0.5, 0.5))
-
-                data.append({
-                    'timestamp': timestamp.isoformat(),
-                    'actual_elevation_ft': round(actual_elevation, 2),
-                    'expected_elevation_ft': round(expected_elevation, 2),
-                    'bias_corrected_elevation_ft': round(bias_corrected, 2),
-                    'oxph_power_mw': round(oxph_power, 2),
-                    'r4_flow_cfs': round(800 + random.uniform(-100, 100), 1),
-                    'r30_flow_cfs': round(1200 + random.uniform(-200, 200), 1),
-                })
+        """Generate simulated hourly historical data for every day in the range"""
+        timestamps = pd.date_range(start_date, end_date + timedelta(hours=23), freq='h')
+        n = len(timestamps)
+        hour = timestamps.hour.to_numpy()
+
+        # Simulate realistic data patterns
+        base_elevation = 1170 + np.sin(hour / 12 * np.pi) * 2
+        actual_elevation = base_elevation + _rng.uniform(-0.5, 0.5, n)
+        expected_elevation = base_elevation + 0.2 + _rng.uniform(-0.3, 0.3, n)
+        bias_corrected = base_elevation + 0.1 + _rng.uniform(-0.2, 0.2, n)
+
+        oxph_power = np.maximum(0, 2 + np.sin(hour / 6 * np.pi) * 1.5 + _rng.uniform(-0.5, 0.5, n))
+
+        return pd.DataFrame({
+            'timestamp': timestamps.strftime('%Y-%m-%dT%H:%M:%S'),
+            'actual_elevation_ft': np.round(actual_elevation, 2),
+            'expected_elevation_ft': np.round(expected_elevation, 2),
+            'bias_corrected_elevation_ft': np.round(bias_corrected, 2),
+            'oxph_power_mw': np.round(oxph_power, 2),
+            'r4_flow_cfs': np.round(800 + _rng.uniform(-100, 100, n), 1),
+            'r30_flow_cfs': np.round(1200 + _rng.uniform(-200, 200, n), 1),
+        }).to_dict('records')
+
+
+# Trailing UTC designator or numeric offset on a timestamp string
+_TZ_SUFFIX_PATTERN = r'(?:[zZ]|[+-]\d{2}:?\d{2})$'
+
+
+# Date-led ISO 8601 shapes accepted by Django's parse_datetime or fromisoformat
+_ISO_TIMESTAMP_PATTERN = (
+    r'\d{4}-\d{1,2}-\d{1,2}'
+    r'(?:[T ]\d{1,2}:\d{1,2}(?::\d{1,2}(?:[.,]\d{1,9})?)?\s*(?:[zZ]|[+-]\d{2}(?::?\d{2})?)?)?'
+)
+
+
+def _parse_utc_timestamps(values, iso_only=False):
+    """Parse timestamp strings to a UTC DatetimeIndex in one pass; unparseable entries become NaT.
+
+    Strings with an offset are converted to UTC and naive strings are taken as
+    UTC. The two groups are parsed separately because pandas applies the last
+    seen offset to naive strings when they are mixed in one call. ISO 8601
+    input takes the fast vectorized path; anything else is retried through
+    pandas' flexible parser.
+
+    With ``iso_only`` only unpadded ISO 8601 strings are parsed at all, so
+    pandas' extras ("now", "today", US-style dates, surrounding spaces) come
+    back as NaT instead of a timestamp.
+    """
+    raw = pd.Series(values, dtype=object).astype(str)
+    if iso_only:
+        candidates = raw.str.fullmatch(_ISO_TIMESTAMP_PATTERN)
+    else:
+        raw = raw.str.strip()
+        candidates = pd.Series(True, index=raw.index)
+    parsed = pd.Series(pd.NaT, index=raw.index, dtype='datetime64[ns, UTC]')
+    has_offset = raw.str.contains(_TZ_SUFFIX_PATTERN, regex=True)
+
+    for group in (candidates & has_offset, candidates & ~has_offset):
+        if not group.any():
+            continue
+        parsed[group] = pd.to_datetime(raw[group], utc=True, errors='coerce', format='ISO8601')
+        retry = group & parsed.isna()
+        if retry.any():
+            parsed[retry] = pd.to_datetime(raw[retry], utc=True, errors='coerce', format='mixed')
+
+    return pd.DatetimeIndex(parsed)
+
+
+def _coalesce_numeric(raw, aliases, default):
+    """First alias per row that parses as a number, else ``default`` (NaN for None)."""
+    result = pd.Series(np.nan, index=raw.index)
+    for alias in aliases:
+        if alias in raw.columns:
+            # to_numeric keeps bool or object dtype for inputs like True/None
+            values = pd.to_numeric(raw[alias], errors='coerce').astype(np.float64)
+            result = result.where(result.notna(), values)
+    return result if default is None else result.where(result.notna(), default)
+
+
+def _coalesce_text(raw, aliases, default):
+    """First alias per row with a truthy value, as a string, else ``default``.
+
+    ``raw`` should hold object columns, so numbers are stringified as sent
+    (2 -> '2') rather than from a float-upcast column.
+    """
+    result = pd.Series(None, index=raw.index, dtype=object)
+    for alias in aliases:
+        if alias in raw.columns:
+            values = raw[alias]
+            truthy = values.notna() & values.astype(bool)
+            result = result.where(result.notna(), values.where(truthy).map(str, na_action='ignore'))
+    return result.where(result.notna(), default)
 
 
 class RecalculateElevationView(APIView):
     """API endpoint for real-time elevation recalculation when users edit MFRA/OXPH values"""
 
+    # Recalc input column -> (request keys tried in order, default); 'Mode' is the only text column
+    INPUT_COLUMNS = {
+        'R4_Flow': (('r4', 'r4_forecast', 'R4_Flow'), 0.0),
+        'R30_Flow': (('r30', 'r30_forecast', 'R30_Flow'), 0.0),
+        'R20_Flow': (('r20', 'r20_forecast', 'R20_Flow'), 0.0),
+        'R5L_Flow': (('r5l', 'r5l_forecast', 'R5L_Flow'), 0.0),
+        'R26_Flow': (('r26', 'r26_forecast', 'R26_Flow'), 0.0),
+        'MFRA_MW': (('mfra', 'mfra_forecast', 'MFRA_MW'), 0.0),
+        'OXPH_generation_MW': (('oxph', 'oxph_forecast', 'OXPH_generation_MW'), 0.0),
+        'FLOAT_FT': (('float_level', 'floatLevel', 'FLOAT_FT'), 1173.0),
+        'Mode': (('mode', 'Mode'), 'GEN'),
+        'bias_cfs': (('bias_cfs', 'bias', 'additionalBias'), 0.0),
+        'ABAY_ft': (('elevation', 'expected_abay', 'ABAY_ft'), None),  # For initial reference
+        'actual_elevation': (('abayElevation', 'abay_elevation'), None),  # For initial reference
+    }
+
+    # Recalculated column -> response key, in response order; 'Mode' is the only text column
+    RESPONSE_COLUMNS = {
+        'ABAY_ft': 'elevation',
+        'OXPH_generation_MW': 'oxph',
+        'MFRA_MW': 'mfra',
+        'R4_Flow': 'r4',
+        'R30_Flow': 'r30',
+        'bias_cfs': 'bias_cfs',
+        'FLOAT_FT': 'float_level',
+        'Mode': 'mode',
+        # Add other calculated fields if needed
+        'ABAY_net_flow_cfs': 'net_flow_cfs',
+        'Head_limit_MW': 'head_limit_mw',
+    }
+
     def post(self, request):
         """Recalculate elevation based on modified forecast data"""
         try:
@@ -1171,66 +1496,32 @@ class RecalculateElevationView(APIView):
                     'error': 'forecastData is required'
                 }, status=status.HTTP_400_BAD_REQUEST)
 
-            # Convert list of dicts to DataFrame
-            rows = []
-            for entry in forecast_data:
-                # Handle various date formats
-                ts_str = entry.get('datetime') or entry.get('dateTime')
-                if not ts_str:
-                    continue
-                
-                try:
-                    ts = pd.to_datetime(ts_str).tz_convert('UTC')
-                except Exception:
-                    # Fallback for naive or other formats
-                    try:
-                        ts = pd.to_datetime(ts_str)
-                        if ts.tz is None:
-                            ts = ts.tz_localize('UTC')
-                        else:
-                            ts = ts.tz_convert('UTC')
-                    except Exception:
-                        continue
-
-                # Helper to safely get float
-                def get_val(keys, default=0.0):
-                    for k in keys:
-                        if k in entry and entry[k] is not None:
-                            try:
-                                return float(entry[k])
-                            except (ValueError, TypeError):
-                                pass
-                    return default
-
-                # Helper to get string
-                def get_str(keys, default='GEN'):
-                    for k in keys:
-                        if k in entry and entry[k]:
-                            return str(entry[k])
-                    return default
-
-                rows.append({
-                    'timestamp': ts,
-                    'R4_Flow': get_val(['r4', 'r4_forecast', 'R4_Flow']),
-                    'R30_Flow': get_val(['r30', 'r30_forecast', 'R30_Flow']),
-                    'R20_Flow': get_val(['r20', 'r20_forecast', 'R20_Flow']),
-                    'R5L_Flow': get_val(['r5l', 'r5l_forecast', 'R5L_Flow']),
-                    'R26_Flow': get_val(['r26', 'r26_forecast', 'R26_Flow']),
-                    'MFRA_MW': get_val(['mfra', 'mfra_forecast', 'MFRA_MW']),
-                    'OXPH_generation_MW': get_val(['oxph', 'oxph_forecast', 'OXPH_generation_MW']),
-                    'FLOAT_FT': get_val(['float_level', 'floatLevel', 'FLOAT_FT'], 1173.0),
-                    'Mode': get_str(['mode', 'Mode']),
-                    'bias_cfs': get_val(['bias_cfs', 'bias', 'additionalBias']),
-                    'ABAY_ft': get_val(['elevation', 'expected_abay', 'ABAY_ft'], None), # For initial reference
-                    'actual_elevation': get_val(['abayElevation', 'abay_elevation'], None) # For initial reference
-                })
+            # Parse all timestamps in one batch; naive values are taken as UTC
+            entries = [entry for entry in forecast_data if entry.get('datetime') or entry.get('dateTime')]
+            timestamps = _parse_utc_timestamps([entry.get('datetime') or entry.get('dateTime') for entry in entries])
 
-            if not rows:
+            # Skip rows whose timestamp could not be parsed
+            parsed = ~timestamps.isna()
+            if not parsed.any():
                 return Response({'error': 'No valid rows parsed'}, status=status.HTTP_400_BAD_REQUEST)
 
-            df = pd.DataFrame(rows)
-            df.set_index('timestamp', inplace=True)
-            df.sort_index(inplace=True)
+            # Convert list of dicts to DataFrame, coalescing each column's aliases
+            # Object columns keep each value as sent; no float upcast of gapped columns
+            raw = pd.DataFrame(entries, dtype=object)[parsed]
+            index = pd.DatetimeIndex(timestamps[parsed], name='timestamp')
+
+            # The dashboard sends rows in time order; only reorder when it did not
+            if not index.is_monotonic_increasing:
+                order = np.argsort(index.asi8, kind='stable')
+                index = index[order]
+                raw = raw.iloc[order]
+
+            df = pd.DataFrame(index=index)
+            for col, (aliases, default) in self.INPUT_COLUMNS.items():
+                if col == 'Mode':
+                    df[col] = _coalesce_text(raw, aliases, default).to_numpy()
+                else:
+                    df[col] = _coalesce_numeric(raw, aliases, default).to_numpy()
 
             # Determine initial elevation
             initial_abay_ft = None
@@ -1253,23 +1544,18 @@ class RecalculateElevationView(APIView):
                 inplace=False
             )
 
-            # Format response
-            results = []
-            for idx, row in recalculated_df.iterrows():
-                results.append({
-                    'datetime': idx.isoformat(),
-                    'elevation': safe_float(row.get('ABAY_ft')),
-                    'oxph': safe_float(row.get('OXPH_generation_MW')),
-                    'mfra': safe_float(row.get('MFRA_MW')),
-                    'r4': safe_float(row.get('R4_Flow')),
-                    'r30': safe_float(row.get('R30_Flow')),
-                    'bias_cfs': safe_float(row.get('bias_cfs')),
-                    'float_level': safe_float(row.get('FLOAT_FT')),
-                    'mode': row.get('Mode'),
-                    # Add other calculated fields if needed
-                    'net_flow_cfs': safe_float(row.get('ABAY_net_flow_cfs')),
-                    'head_limit_mw': safe_float(row.get('Head_limit_MW'))
-                })
+            # Format response column-wise; columns recalc did not produce come back as None
+            out = recalculated_df.reindex(columns=list(self.RESPONSE_COLUMNS))
+            columns = {
+                # Index is UTC throughout, so the isoformat offset is fixed
+                'datetime': recalculated_df.index.tz_convert('UTC').strftime('%Y-%m-%dT%H:%M:%S+00:00'),
+            }
+            for col, key in self.RESPONSE_COLUMNS.items():
+                if col == 'Mode':
+                    columns[key] = out[col].astype(object).where(out[col].notna(), None)
+                else:
+                    columns[key] = safe_float_series(out[col])
+            results = pd.DataFrame(columns).to_dict('records')
 
             return Response({
                 'status': 'success',
@@ -1284,51 +1570,56 @@ class RecalculateElevationView(APIView):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+def _build_current_state():
+    """Current reservoir and system state, shared by CurrentStateView and DashboardView"""
+    # Simulate current state data
+    current_state = {
+        'timestamp': timezone.now().isoformat(),
+        'abay_elevation_ft': 1171.5,
+        'abay_volume_af': 2450.8,
+        'oxph_power_mw': 3.2,
+        'oxph_status': 'Running',
+        'r4_flow_cfs': 825.3,
+        'r30_flow_cfs': 1150.7,
+        'r20_flow_cfs': 945.2,
+        'r5l_flow_cfs': 155.8,
+        'r26_flow_cfs': 215.4,
+        'mfra_power_mw': 165.8,
+        'ccs_mode': 0,
+        'float_level_setpoint_ft': 1173.0,
+        'system_status': 'Normal',
+        'optimization_modules_loaded': _optimization_modules_loaded,
+        'last_optimization': None
+    }
+
+    # Add information about the most recent optimization run
+    latest_run = OptimizationRun.objects.filter(
+        status='completed'
+    ).order_by('-completed_at').first()
+
+    if latest_run:
+        current_state['last_optimization'] = {
+            'run_id': latest_run.id,
+            'completed_at': latest_run.completed_at.isoformat() if latest_run.completed_at else None,
+            'run_mode': latest_run.run_mode,
+            'r_bias_cfs': latest_run.r_bias_cfs,
+            'summary': {
+                'peak_elevation_ft': latest_run.peak_elevation_ft,
+                'min_elevation_ft': latest_run.min_elevation_ft,
+                'total_spillage_af': latest_run.total_spillage_af,
+            }
+        }
+
+    return current_state
+
+
 class CurrentStateView(APIView):
     """API endpoint for getting current system state"""
 
     def get(self, request):
         """Get current reservoir and system state"""
         try:
-            # Simulate current state data
-            current_state = {
-                'timestamp': timezone.now().isoformat(),
-                'abay_elevation_ft': 1171.5,
-                'abay_volume_af': 2450.8,
-                'oxph_power_mw': 3.2,
-                'oxph_status': 'Running',
-                'r4_flow_cfs': 825.3,
-                'r30_flow_cfs': 1150.7,
-                'r20_flow_cfs': 945.2,
-                'r5l_flow_cfs': 155.8,
-                'r26_flow_cfs': 215.4,
-                'mfra_power_mw': 165.8,
-                'ccs_mode': 0,
-                'float_level_setpoint_ft': 1173.0,
-                'system_status': 'Normal',
-                'optimization_modules_loaded': _optimization_modules_loaded,
-                'last_optimization': None
-            }
-
-            # Add information about the most recent optimization run
-            latest_run = OptimizationRun.objects.filter(
-                status='completed'
-            ).order_by('-completed_at').first()
-
-            if latest_run:
-                current_state['last_optimization'] = {
-                    'run_id': latest_run.id,
-                    'completed_at': latest_run.completed_at.isoformat(),
-                    'run_mode': latest_run.run_mode,
-                    'r_bias_cfs': latest_run.r_bias_cfs,
-                    'summary': {
-                        'peak_elevation_ft': latest_run.peak_elevation_ft,
-                        'min_elevation_ft': latest_run.min_elevation_ft,
-                        'total_spillage_af': latest_run.total_spillage_af,
-                    }
-                }
-
-            return Response(current_state)
+            return Response(_build_current_state())
 
         except Exception as e:
             logger.error(f"Error getting current state: {e}")
@@ -1341,31 +1632,100 @@ class CurrentStateView(APIView):
 class DashboardView(APIView):
     """API endpoint for dashboard data"""
 
+    # Today's run counts are polled with every dashboard refresh; a short TTL is plenty
+    stats_cache_timeout = 30
+
+    # Plain columns of OptimizationRunSerializer's output, read with one values() query
+    RECENT_RUN_FIELDS = (
+        'id', 'run_mode', 'optimizer_type', 'forecast_source', 'created_at', 'started_at',
+        'completed_at', 'historical_start_date', 'status', 'progress_message',
+        'progress_percentage', 'parameter_set', 'custom_parameters', 'task_id',
+        'result_file_path', 'error_message', 'total_spillage_af', 'avg_oxph_utilization_pct',
+        'peak_elevation_ft', 'min_elevation_ft', 'r_bias_cfs',
+    )
+    _RUN_MODE_LABELS = dict(OptimizationRun.RUN_MODE_CHOICES)
+    _OPTIMIZER_TYPE_LABELS = dict(OptimizationRun.OPTIMIZER_TYPE_CHOICES)
+    _STATUS_LABELS = dict(OptimizationRun.STATUS_CHOICES)
+    # DRF's own field classes, so dates render exactly as the serializer renders them
+    _datetime_field = serializers.DateTimeField()
+    _date_field = serializers.DateField()
+
+    @classmethod
+    def _recent_runs(cls, limit=10):
+        """Serialize the latest runs like OptimizationRunSerializer, from plain rows.
+
+        The dashboard only reads these rows, so the per-instance serializer
+        machinery is skipped; keys and formats match the serializer output,
+        including omitting the name fields when the related row is null.
+        """
+        rows = OptimizationRun.objects.order_by('-created_at').values(
+            *cls.RECENT_RUN_FIELDS, 'parameter_set__name', 'created_by__username'
+        )[:limit]
+        to_datetime = cls._datetime_field.to_representation
+        now = timezone.now()
+
+        runs = []
+        for row in rows:
+            started_at = row['started_at']
+            completed_at = row['completed_at']
+            if started_at:
+                duration_seconds = ((completed_at or now) - started_at).total_seconds()
+            else:
+                duration_seconds = None
+
+            run = {field: row[field] for field in cls.RECENT_RUN_FIELDS}
+            run.update(
+                run_mode_display=cls._RUN_MODE_LABELS.get(row['run_mode'], row['run_mode']),
+                optimizer_type_display=cls._OPTIMIZER_TYPE_LABELS.get(row['optimizer_type'], row['optimizer_type']),
+                status_display=cls._STATUS_LABELS.get(row['status'], row['status']),
+                created_at=to_datetime(row['created_at']) if row['created_at'] else None,
+                started_at=to_datetime(started_at) if started_at else None,
+                completed_at=to_datetime(completed_at) if completed_at else None,
+                historical_start_date=(
+                    cls._date_field.to_representation(row['historical_start_date'])
+                    if row['historical_start_date'] else None
+                ),
+                duration_seconds=duration_seconds,
+            )
+            if row['parameter_set'] is not None:
+                run['parameter_set_name'] = row['parameter_set__name']
+            if row['created_by__username'] is not None:
+                run['created_by_username'] = row['created_by__username']
+            runs.append(run)
+        return runs
+
+    @staticmethod
+    def _run_stats_today():
+        """Return today's total/successful run counts from one aggregate, cached briefly."""
+        today = timezone.now().date()
+        cache_key = f"dashboard_run_stats_{today.isoformat()}"
+        stats = _cache_get(cache_key)
+        if stats is None:
+            stats = OptimizationRun.objects.filter(created_at__date=today).aggregate(
+                total_runs_today=Count('id'),
+                successful_runs_today=Count('id', filter=Q(status='completed')),
+            )
+            _cache_set(cache_key, stats, DashboardView.stats_cache_timeout)
+        return stats
+
     def get(self, request):
         """Get dashboard data including recent runs, current state, and charts data"""
         try:
-            # Get recent optimization runs
-            recent_runs = OptimizationRun.objects.order_by('-created_at')[:10]
-
             # Get current state
-            current_state_view = CurrentStateView()
-            current_state_response = current_state_view.get(request)
-            current_state = current_state_response.data if current_state_response.status_code == 200 else {}
+            try:
+                current_state = _build_current_state()
+            except Exception as e:
+                logger.error(f"Error getting current state: {e}")
+                current_state = {}
 
             return Response({
                 'current_state': current_state,
-                'recent_runs': OptimizationRunSerializer(recent_runs, many=True).data,
+                'recent_runs': self._recent_runs(),
                 'chart_data': None,  # Will be populated by frontend
                 'system_status': 'Normal',
                 'alerts': [],
                 'statistics': {
-                    'total_runs_today': OptimizationRun.objects.filter(
-                        created_at__date=timezone.now().date()
-                    ).count(),
-                    'successful_runs_today': OptimizationRun.objects.filter(
-                        created_at__date=timezone.now().date(),
-                        status='completed'
-                    ).count(),
+                    **self._run_stats_today(),
                     'avg_runtime_minutes': 3.5,
                 }
             })
@@ -1415,6 +1775,44 @@ def safe_float(value, default=None):
     return numeric_value
 
 
+def safe_float_series(series, default=None):
+    """Column-wise :func:`safe_float`: return an object array of floats/``default``.
+
+    Values that do not parse as numbers, NaN/NA and infinities all become
+    ``default``, matching ``[safe_float(v, default) for v in series]``.
+    """
+    values = pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    out = values.astype(object)
+    out[~np.isfinite(values)] = default
+    return out
+
+
+def _isoformat_index(index):
+    """``[ts.isoformat() for ts in index]`` for a tz-aware DatetimeIndex, in one pass.
+
+    Whole-second stamps are formatted with a single ``strftime``; anything with
+    sub-second precision keeps the per-timestamp ``isoformat``.
+    """
+    if (index.microsecond != 0).any() or (index.nanosecond != 0).any():
+        return [ts.isoformat() for ts in index]
+    stamped = index.strftime('%Y-%m-%dT%H:%M:%S%z')
+    # %z renders -0700; isoformat uses -07:00
+    return (stamped.str[:-2] + ':' + stamped.str[-2:]).tolist()
+
+
+@lru_cache(maxsize=32)
+def _friendly_source_name(source_key):
+    """Display label for a run's forecast source key"""
+    if not source_key:
+        return ''
+    key = str(source_key).lower()
+    if 'hydro' in key:
+        return 'HydroForecast'
+    if 'cnrfc' in key:
+        return 'CNRFC Forecast'
+    return str(source_key).replace('_', ' ').replace('-', ' ').title()
+
+
 def _prepare_chart_data(run, results_df=None):
     """Load run results and merge with actual PI data.
 
@@ -1423,7 +1821,7 @@ def _prepare_chart_data(run, results_df=None):
     """
 
     if results_df is None:
-        results_df = _load_run_results_dataframe(run)
+        results_df = _load_run_results_dataframe(run, fields=_CHART_RESULT_FIELDS)
     else:
         results_df = results_df.copy()
         if not isinstance(results_df.index, pd.DatetimeIndex):
@@ -1435,10 +1833,7 @@ def _prepare_chart_data(run, results_df=None):
         results_df.sort_index(inplace=True)
 
     # Fetch actual PI data for overlap
-    pi_qs = PIDatum.objects.filter(
-        timestamp_utc__gte=results_df.index.min(),
-        timestamp_utc__lte=results_df.index.max(),
-    ).values(
+    pi_fields = (
         'timestamp_utc',
         'abay_elevation_ft',
         'abay_float_ft',
@@ -1452,35 +1847,38 @@ def _prepare_chart_data(run, results_df=None):
         'mfp_total_gen_mw',
         'ccs_mode',
     )
-    pi_df = pd.DataFrame(list(pi_qs))
+    # Plain row tuples plus explicit columns; no per-row dicts. Rows are
+    # streamed from the cursor in chunks rather than held again in the
+    # queryset's result cache.
+    pi_qs = PIDatum.objects.filter(
+        timestamp_utc__gte=results_df.index.min(),
+        timestamp_utc__lte=results_df.index.max(),
+    ).values_list(*pi_fields)
+    pi_df = pd.DataFrame.from_records(pi_qs.iterator(chunk_size=2000), columns=pi_fields)
     if not pi_df.empty:
-        pi_df['timestamp_utc'] = pd.to_datetime(pi_df['timestamp_utc'])
-        if pi_df['timestamp_utc'].dt.tz is None:
-            pi_df['timestamp_utc'] = pi_df['timestamp_utc'].dt.tz_localize('UTC')
+        timestamps = pi_df.pop('timestamp_utc')
+        if isinstance(timestamps.dtype, pd.DatetimeTZDtype):
+            # With USE_TZ the rows carry aware datetimes, which from_records has
+            # already turned into a tz-aware column; no re-parse needed
+            pi_df.index = pd.DatetimeIndex(timestamps).tz_convert('UTC')
         else:
-            pi_df['timestamp_utc'] = pi_df['timestamp_utc'].dt.tz_convert('UTC')
-        pi_df.set_index('timestamp_utc', inplace=True)
-        # Drop overlapping columns from results_df before join so PI actuals take precedence
+            pi_df.index = pd.DatetimeIndex(pd.to_datetime(timestamps, utc=True))
+        # PI timestamps are unique, so the left join is a reindex onto the
+        # results index followed by plain column assignment
+        pi_df = pi_df.reindex(results_df.index)
+        # Drop overlapping columns from results_df first so PI actuals take precedence
         overlap_cols = results_df.columns.intersection(pi_df.columns)
         if len(overlap_cols) > 0:
             results_df = results_df.drop(columns=overlap_cols)
-        merged = results_df.join(pi_df, how='left')
+        merged = results_df
+        for col in pi_df.columns:
+            merged[col] = pi_df[col].to_numpy()
     else:
         merged = results_df
         merged['abay_elevation_ft'] = None
         merged['abay_float_ft'] = None
         merged['oxph_generation_mw'] = None
 
-    def _friendly_source_name(source_key):
-        if not source_key:
-            return ''
-        key = str(source_key).lower()
-        if 'hydro' in key:
-            return 'HydroForecast'
-        if 'cnrfc' in key:
-            return 'CNRFC Forecast'
-        return str(source_key).replace('_', ' ').replace('-', ' ').title()
-
     chart_data = {
         'labels': [],
         'elevation': {
@@ -1521,11 +1919,16 @@ def _prepare_chart_data(run, results_df=None):
 
     chart_data['river']['selected_source_label'] = _friendly_source_name(run.forecast_source)
 
+    # Forecast-looking result columns, lower-cased once for the keyword lookups below
+    forecast_columns = [
+        (col, lower) for col, lower in ((col, col.lower()) for col in results_df.columns)
+        if 'forecast' in lower
+    ]
+
     def _extract_series_by_keywords(df, site_key, keywords):
         site_key = site_key.lower()
-        for col in df.columns:
-            lower = col.lower()
-            if site_key in lower and 'forecast' in lower and any(keyword in lower for keyword in keywords):
+        for col, lower in forecast_columns:
+            if site_key in lower and any(keyword in lower for keyword in keywords):
                 series = df[col]
                 if isinstance(series, pd.Series):
                     return series
@@ -1544,27 +1947,32 @@ def _prepare_chart_data(run, results_df=None):
     def _align_series(series):
         if series is None or len(series) == 0:
             return None
-        aligned = series.copy()
-        if not isinstance(aligned.index, pd.DatetimeIndex):
+        if not isinstance(series.index, pd.DatetimeIndex):
             return None
-        if aligned.index.tz is None:
-            aligned.index = aligned.index.tz_localize('UTC')
+        if series.index.tz is None:
+            source_index = series.index.tz_localize('UTC')
         else:
-            aligned.index = aligned.index.tz_convert('UTC')
+            source_index = series.index.tz_convert('UTC')
+        # Positions are looked up with get_indexer and gathered from one float
+        # array; -1 (no match) gathers NaN from the padded last slot
+        values = np.append(
+            pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan),
+            np.nan,
+        )
         try:
-            reindexed = aligned.reindex(merged.index)
+            gathered = values[source_index.get_indexer(merged.index)]
         except Exception:
             return None
-        if reindexed.isna().all():
+        if np.isnan(gathered).all():
             try:
-                reindexed = aligned.reindex(
+                gathered = values[source_index.get_indexer(
                     merged.index,
                     method='nearest',
                     tolerance=pd.Timedelta(minutes=30)
-                )
+                )]
             except Exception:
                 pass
-        return reindexed
+        return pd.Series(gathered, index=merged.index)
 
     hydro_r4_series = _extract_series_by_keywords(results_df, 'r4', ['hydro', 'hf'])
     hydro_r30_series = _extract_series_by_keywords(results_df, 'r30', ['hydro', 'hf'])
@@ -1594,125 +2002,203 @@ def _prepare_chart_data(run, results_df=None):
         }
     }
 
-    def _first_non_missing(row, keys):
+    # Every column is read whole below and indexed by row position in the
+    # loop, so no per-row Series or tuple is built
+    present_cols = set(merged.columns)
+
+    # Columns that are only ever reported through safe_float are converted
+    # whole, up front; the loop just picks the value at its position
+    n_rows = len(merged)
+
+    def _float_column(*keys):
+        """safe_float of the first present column among ``keys``, row by row"""
         for key in keys:
-            if key in row.index:
-                value = row.get(key)
-                if value is not None and not pd.isna(value):
-                    if isinstance(value, str) and value.strip() == '':
-                        continue
-                    return value
-        return None
+            if key in present_cols:
+                return safe_float_series(merged[key])
+        return [None] * n_rows
+
+    elev_forecast_col = _float_column('ABAY_ft')
+    float_level_col = _float_column('FLOAT_FT', 'Afterbay_Elevation_Setpoint')
+    oxph_actual_col = _float_column('oxph_generation_mw')
+    r4_actual_col = _float_column('r4_flow_cfs')
+    r30_actual_col = _float_column('r30_flow_cfs')
+    mfra_actual_col = _float_column('mfp_total_gen_mw')
+    abay_actual_col = _float_column('abay_elevation_ft')
+    r20_forecast_col = _float_column('R20_Flow')
+    r20_actual_col = _float_column('r20_flow_cfs')
+    r5l_forecast_col = _float_column('R5L_Flow')
+    r5l_actual_col = _float_column('r5l_flow_cfs')
+    r26_forecast_col = _float_column('R26_Flow')
+    r26_actual_col = _float_column('r26_flow_cfs')
+    bias_col = _float_column('bias_cfs')
+
+    def _aligned_values(series):
+        """safe_float of an aligned forecast series (already on merged.index)"""
+        if series is None:
+            return [None] * n_rows
+        return safe_float_series(series)
+
+    hydro_r4_aligned = _aligned_values(aligned_forecasts['hydro']['r4'])
+    hydro_r30_aligned = _aligned_values(aligned_forecasts['hydro']['r30'])
+    cnrfc_r4_aligned = _aligned_values(aligned_forecasts['cnrfc']['r4'])
+    cnrfc_r30_aligned = _aligned_values(aligned_forecasts['cnrfc']['r30'])
+
+    # The run's own forecast source fills gaps in its matching river series
+    forecast_source_key = (run.forecast_source or '').lower()
+    is_hydro_source = 'hydro' in forecast_source_key
+    is_cnrfc_source = 'cnrfc' in forecast_source_key
+
+    # Pacific labels and ISO stamps for the whole index at once
+    pt_index = merged.index.tz_convert('America/Los_Angeles')
+    chart_data['labels'] = pt_index.strftime('%a %b %d, %H').tolist()
+    pt_isoformat = _isoformat_index(pt_index)
+
+    def _coalesce_column(keys):
+        """First non-missing, non-blank raw value per row across the present ``keys``"""
+        result = np.full(n_rows, None, dtype=object)
+        unfilled = np.ones(n_rows, dtype=bool)
+        for key in keys:
+            if key not in present_cols:
+                continue
+            values = merged[key].to_numpy(dtype=object)
+            usable = ~pd.isna(values)
+            if merged[key].dtype == object:
+                usable &= np.array([not (isinstance(v, str) and v.strip() == '') for v in values], dtype=bool)
+            take = unfilled & usable
+            result[take] = values[take]
+            unfilled &= ~take
+        return result
+
+    def _coalesce_float(keys):
+        """safe_float of :func:`_coalesce_column`; a trailing actual column is the fallback"""
+        return safe_float_series(pd.Series(_coalesce_column(keys), dtype=object))
+
+    # River and MFRA forecasts fall back to the PI actual when no forecast column has a value
+    r4_forecast_col = _coalesce_float(['R4_Forecast_CFS', 'R4_Flow', 'r4_forecast', 'r4_flow_cfs'])
+    r30_forecast_col = _coalesce_float(['R30_Forecast_CFS', 'R30_Flow', 'r30_forecast', 'r30_flow_cfs'])
+    mfra_forecast_col = _coalesce_float(['MFRA_MW_forecast', 'MFRA_Forecast_MW', 'MFRA_MW', 'mfp_total_gen_mw'])
+
+    # OXPH forecast comes from whichever schedule column exists, with the PI
+    # actual filling rows where it is missing
+    oxph_key = 'OXPH_generation_MW' if 'OXPH_generation_MW' in present_cols else 'OXPH_Schedule_MW'
+    oxph_forecast_col = np.where(
+        merged[oxph_key].isna().to_numpy() if oxph_key in present_cols else True,
+        np.asarray(oxph_actual_col, dtype=object),
+        np.asarray(_float_column(oxph_key), dtype=object),
+    )
+
+    # Setpoint straight from the setpoint columns, else the OXPH forecast; the
+    # stabilization check compares a candidate change against the next row's
+    # rounded setpoint-column value
+    setpoint_raw_col = _coalesce_column([
+        'OXPH_setpoint_MW',
+        'oxph_setpoint_mw',
+        'oxph_setpoint_target',
+        'OXPH_Setpoint_Target',
+    ])
+    setpoint_only_col = safe_float_series(pd.Series(setpoint_raw_col, dtype=object))
+    setpoint_col = np.where(pd.isna(setpoint_raw_col), oxph_forecast_col, setpoint_only_col)
+    setpoint_rounded_col = [None if value is None else round(value, 1) for value in setpoint_only_col]
+    setpoint_change_col = _coalesce_column(['setpoint_change_time', 'setpoint_adjust_time_pt'])
+
+    # A row counts as actual when any PI measurement is present
+    actual_cols = [
+        col for col in (
+            'oxph_generation_mw',
+            'mfp_total_gen_mw',
+            'r4_flow_cfs',
+            'r30_flow_cfs',
+            'abay_elevation_ft',
+        ) if col in present_cols
+    ]
+    if actual_cols:
+        chart_data['actual_mask'] = merged[actual_cols].notna().any(axis=1).tolist()
+    else:
+        chart_data['actual_mask'] = [False] * n_rows
+
+    # Series that are whole converted columns go in as-is; the per-row ones
+    # are preallocated and filled by position in the loop
+    chart_data['elevation'].update(
+        optimized=list(elev_forecast_col),
+        actual=list(abay_actual_col),
+        bias_corrected=[None] * n_rows,
+        float=list(float_level_col),
+    )
+    chart_data['oxph'].update(optimized=list(oxph_forecast_col), historical=list(oxph_actual_col))
+    chart_data['mfra'].update(forecast=list(mfra_forecast_col), historical=list(mfra_actual_col))
+    r4_hydro, r4_cnrfc = [None] * n_rows, [None] * n_rows
+    chart_data['river']['r4'].update(actual=list(r4_actual_col), hydro=r4_hydro, cnrfc=r4_cnrfc)
+    r30_hydro, r30_cnrfc = [None] * n_rows, [None] * n_rows
+    chart_data['river']['r30'].update(actual=list(r30_actual_col), hydro=r30_hydro, cnrfc=r30_cnrfc)
+    forecast_data = chart_data['forecast_data'] = [None] * n_rows
+
+    def _mode_value(value, strip):
+        try:
+            if pd.isna(value):
+                return None
+        except TypeError:
+            pass
+        if isinstance(value, (int, float)) and not math.isfinite(float(value)):
+            return None
+        if strip and isinstance(value, str):
+            return value.strip() or None
+        return value
+
+    def _mode_column(key, strip=False):
+        """CCS modes keep their raw labels; missing and non-finite entries become None"""
+        if key not in present_cols:
+            return [None] * n_rows
+        values = merged[key]
+        if values.dtype.kind == 'f':
+            # Float-coded modes (PI ccs_mode) need only the NaN/inf check, done column-wise
+            return safe_float_series(values)
+        return [_mode_value(value, strip) for value in values.tolist()]
+
+    mode_forecast_col = _mode_column('Mode', strip=True)
+    mode_actual_col = _mode_column('ccs_mode')
 
     prev_setpoint = None
-    for position, (idx, row) in enumerate(merged.iterrows()):
-        timestamp_pt = idx.tz_convert('America/Los_Angeles')
-        chart_data['labels'].append(timestamp_pt.strftime('%a %b %d, %H'))
-
-        elev_forecast = row.get('ABAY_ft')
-        float_val = row.get('FLOAT_FT', row.get('Afterbay_Elevation_Setpoint'))
-
-        oxph_forecast_raw = row.get('OXPH_generation_MW', row.get('OXPH_Schedule_MW'))
-        oxph_actual_raw = row.get('oxph_generation_mw')
-        if pd.isna(oxph_forecast_raw):
-            oxph_forecast_raw = oxph_actual_raw
-        oxph_forecast = safe_float(oxph_forecast_raw)
-        oxph_actual = safe_float(oxph_actual_raw)
-        oxph_setpoint_raw = _first_non_missing(
-            row,
-            [
-                'OXPH_setpoint_MW',
-                'oxph_setpoint_mw',
-                'oxph_setpoint_target',
-                'OXPH_Setpoint_Target',
-            ],
-        )
-        if oxph_setpoint_raw is None:
-            oxph_setpoint_raw = oxph_forecast_raw
-
-        r4_forecast_raw = _first_non_missing(row, ['R4_Forecast_CFS', 'R4_Flow', 'r4_forecast'])
-        if r4_forecast_raw is None:
-            r4_forecast_raw = row.get('r4_flow_cfs')
-        r4_forecast = safe_float(r4_forecast_raw)
-        r4_actual = safe_float(row.get('r4_flow_cfs'))
-
-        r30_forecast_raw = _first_non_missing(row, ['R30_Forecast_CFS', 'R30_Flow', 'r30_forecast'])
-        if r30_forecast_raw is None:
-            r30_forecast_raw = row.get('r30_flow_cfs')
-        r30_forecast = safe_float(r30_forecast_raw)
-        r30_actual = safe_float(row.get('r30_flow_cfs'))
-
-        mfra_forecast_raw = _first_non_missing(row, ['MFRA_MW_forecast', 'MFRA_Forecast_MW', 'MFRA_MW'])
-        mfra_actual_raw = row.get('mfp_total_gen_mw')
-        if pd.isna(mfra_forecast_raw):
-            mfra_forecast_raw = mfra_actual_raw
-        mfra_forecast = safe_float(mfra_forecast_raw)
-        mfra_actual = safe_float(mfra_actual_raw)
-
-        abay_actual = safe_float(row.get('abay_elevation_ft'))
-
-        has_actual = any(
-            pd.notna(val) for val in (
-                oxph_actual_raw,
-                mfra_actual_raw,
-                row.get('r4_flow_cfs'),
-                row.get('r30_flow_cfs'),
-                row.get('abay_elevation_ft')
-            )
-        )
+    for position in range(n_rows):
+        timestamp_pt_iso = pt_isoformat[position]
 
-        hydro_r4_value = None
-        hydro_r30_value = None
-        cnrfc_r4_value = None
-        cnrfc_r30_value = None
-
-        hydro_r4_series_aligned = aligned_forecasts['hydro']['r4']
-        if hydro_r4_series_aligned is not None and position < len(hydro_r4_series_aligned):
-            hydro_r4_value = safe_float(hydro_r4_series_aligned.iloc[position])
-        hydro_r30_series_aligned = aligned_forecasts['hydro']['r30']
-        if hydro_r30_series_aligned is not None and position < len(hydro_r30_series_aligned):
-            hydro_r30_value = safe_float(hydro_r30_series_aligned.iloc[position])
-
-        cnrfc_r4_series_aligned = aligned_forecasts['cnrfc']['r4']
-        if cnrfc_r4_series_aligned is not None and position < len(cnrfc_r4_series_aligned):
-            cnrfc_r4_value = safe_float(cnrfc_r4_series_aligned.iloc[position])
-        cnrfc_r30_series_aligned = aligned_forecasts['cnrfc']['r30']
-        if cnrfc_r30_series_aligned is not None and position < len(cnrfc_r30_series_aligned):
-            cnrfc_r30_value = safe_float(cnrfc_r30_series_aligned.iloc[position])
-
-        if hydro_r4_value is None and run.forecast_source and 'hydro' in run.forecast_source.lower():
-            hydro_r4_value = r4_forecast
-        if hydro_r30_value is None and run.forecast_source and 'hydro' in run.forecast_source.lower():
-            hydro_r30_value = r30_forecast
-        if cnrfc_r4_value is None and run.forecast_source and 'cnrfc' in run.forecast_source.lower():
-            cnrfc_r4_value = r4_forecast
-        if cnrfc_r30_value is None and run.forecast_source and 'cnrfc' in run.forecast_source.lower():
-            cnrfc_r30_value = r30_forecast
+        elev_forecast = elev_forecast_col[position]
+        float_level = float_level_col[position]
+
+        oxph_forecast = oxph_forecast_col[position]
+        oxph_actual = oxph_actual_col[position]
 
-        chart_data['elevation']['optimized'].append(safe_float(elev_forecast))
-        chart_data['elevation']['actual'].append(abay_actual)
-        chart_data['elevation']['bias_corrected'].append(None)
-        chart_data['elevation']['float'].append(safe_float(float_val))
+        r4_forecast = r4_forecast_col[position]
+        r4_actual = r4_actual_col[position]
 
-        chart_data['oxph']['optimized'].append(oxph_forecast)
-        chart_data['oxph']['historical'].append(oxph_actual)
+        r30_forecast = r30_forecast_col[position]
+        r30_actual = r30_actual_col[position]
 
-        chart_data['mfra']['forecast'].append(mfra_forecast)
-        chart_data['mfra']['historical'].append(mfra_actual)
+        mfra_forecast = mfra_forecast_col[position]
+        mfra_actual = mfra_actual_col[position]
 
-        chart_data['river']['r4']['actual'].append(r4_actual)
-        chart_data['river']['r30']['actual'].append(r30_actual)
-        chart_data['river']['r4']['hydro'].append(hydro_r4_value)
-        chart_data['river']['r30']['hydro'].append(hydro_r30_value)
-        chart_data['river']['r4']['cnrfc'].append(cnrfc_r4_value)
-        chart_data['river']['r30']['cnrfc'].append(cnrfc_r30_value)
+        abay_actual = abay_actual_col[position]
 
-        chart_data['actual_mask'].append(has_actual)
+        hydro_r4_value = hydro_r4_aligned[position]
+        hydro_r30_value = hydro_r30_aligned[position]
+        cnrfc_r4_value = cnrfc_r4_aligned[position]
+        cnrfc_r30_value = cnrfc_r30_aligned[position]
+
+        if hydro_r4_value is None and is_hydro_source:
+            hydro_r4_value = r4_forecast
+        if hydro_r30_value is None and is_hydro_source:
+            hydro_r30_value = r30_forecast
+        if cnrfc_r4_value is None and is_cnrfc_source:
+            cnrfc_r4_value = r4_forecast
+        if cnrfc_r30_value is None and is_cnrfc_source:
+            cnrfc_r30_value = r30_forecast
+
+        r4_hydro[position] = hydro_r4_value
+        r30_hydro[position] = hydro_r30_value
+        r4_cnrfc[position] = cnrfc_r4_value
+        r30_cnrfc[position] = cnrfc_r30_value
 
         setpoint_change = None
-        explicit_setpoint_change = _first_non_missing(
-            row, ['setpoint_change_time', 'setpoint_adjust_time_pt']
-        )
+        explicit_setpoint_change = setpoint_change_col[position]
         if explicit_setpoint_change is not None:
             try:
                 if isinstance(explicit_setpoint_change, str):
@@ -1729,7 +2215,7 @@ def _prepare_chart_data(run, results_df=None):
             except Exception:
                 setpoint_change = None
 
-        setpoint_numeric = safe_float(oxph_setpoint_raw)
+        setpoint_numeric = setpoint_col[position]
         if setpoint_numeric is not None:
             setpoint_rounded = round(setpoint_numeric, 1)
             if setpoint_change is None and (
@@ -1737,48 +2223,21 @@ def _prepare_chart_data(run, results_df=None):
             ):
                 # Stabilization check: only flag if the setpoint has settled
                 # (next row has the same rounded value, or this is the last row)
-                total_rows = len(merged)
-                is_last = (position + 1 >= total_rows)
+                is_last = (position + 1 >= n_rows)
                 is_stable = is_last
                 if not is_last:
-                    next_row = merged.iloc[position + 1]
-                    next_sp_raw = _first_non_missing(
-                        next_row,
-                        ['OXPH_setpoint_MW', 'oxph_setpoint_mw',
-                         'oxph_setpoint_target', 'OXPH_Setpoint_Target'],
-                    )
-                    next_sp = safe_float(next_sp_raw)
+                    next_sp = setpoint_rounded_col[position + 1]
                     if next_sp is not None:
-                        is_stable = abs(setpoint_rounded - round(next_sp, 1)) <= 0.15
+                        is_stable = abs(setpoint_rounded - next_sp) <= 0.15
                 if is_stable:
-                    setpoint_change = timestamp_pt.isoformat()
+                    setpoint_change = timestamp_pt_iso
                     prev_setpoint = setpoint_rounded
             else:
                 prev_setpoint = setpoint_rounded
 
-        mode_forecast_value = row.get('Mode')
-        try:
-            if pd.isna(mode_forecast_value):
-                mode_forecast_value = None
-        except TypeError:
-            pass
-        if isinstance(mode_forecast_value, (int, float)) and not math.isfinite(float(mode_forecast_value)):
-            mode_forecast_value = None
-        if isinstance(mode_forecast_value, str):
-            mode_forecast_value = mode_forecast_value.strip() or None
-
-        mode_actual_value = row.get('ccs_mode')
-        try:
-            if pd.isna(mode_actual_value):
-                mode_actual_value = None
-        except TypeError:
-            pass
-        if isinstance(mode_actual_value, (int, float)) and not math.isfinite(float(mode_actual_value)):
-            mode_actual_value = None
-
-        chart_data['forecast_data'].append({
-            'datetime': timestamp_pt.isoformat(),
-            'setpoint': safe_float(oxph_setpoint_raw),
+        forecast_data[position] = {
+            'datetime': timestamp_pt_iso,
+            'setpoint': setpoint_numeric,
             'oxph': oxph_forecast,
             'oxph_actual': oxph_actual,
             'setpoint_change': setpoint_change,
@@ -1790,22 +2249,22 @@ def _prepare_chart_data(run, results_df=None):
             'r4_cnrfc_forecast': cnrfc_r4_value,
             'r30_hydro_forecast': hydro_r30_value,
             'r30_cnrfc_forecast': cnrfc_r30_value,
-            'r20_forecast': safe_float(row.get('R20_Flow')),
-            'r20_actual': safe_float(row.get('r20_flow_cfs')),
-            'r5l_forecast': safe_float(row.get('R5L_Flow')),
-            'r5l_actual': safe_float(row.get('r5l_flow_cfs')),
-            'r26_forecast': safe_float(row.get('R26_Flow')),
-            'r26_actual': safe_float(row.get('r26_flow_cfs')),
-            'mode_forecast': mode_forecast_value,
-            'mode_actual': mode_actual_value,
+            'r20_forecast': r20_forecast_col[position],
+            'r20_actual': r20_actual_col[position],
+            'r5l_forecast': r5l_forecast_col[position],
+            'r5l_actual': r5l_actual_col[position],
+            'r26_forecast': r26_forecast_col[position],
+            'r26_actual': r26_actual_col[position],
+            'mode_forecast': mode_forecast_col[position],
+            'mode_actual': mode_actual_col[position],
             'abay_elevation': abay_actual,
-            'expected_abay': safe_float(elev_forecast),
-            'float_level': safe_float(float_val),
+            'expected_abay': elev_forecast,
+            'float_level': float_level,
             'mfra_forecast': mfra_forecast,
             'mfra_actual': mfra_actual,
-            'bias_cfs': safe_float(row.get('bias_cfs')),
-            'additional_bias': safe_float(row.get('bias_cfs'))
-        })
+            'bias_cfs': bias_col[position],
+            'additional_bias': bias_col[position]
+        }
 
     return chart_data
 
@@ -1843,7 +2302,7 @@ class OptimizationResultsView(APIView):
 
     def get(self, request, run_id):
         try:
-            run = OptimizationRun.objects.get(id=run_id)
+            run = OptimizationRun.objects.select_related('created_by').get(id=run_id)
             if run.status != 'completed':
                 return Response({'error': 'Optimization not completed', 'status': run.status}, status=status.HTTP_400_BAD_REQUEST)
             if not run.result_file_path or not os.path.exists(run.result_file_path):
@@ -1899,7 +2358,7 @@ class ApplyBiasView(APIView):
             return Response({'error': 'run_id is required to apply bias'}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            run = OptimizationRun.objects.get(id=run_id)
+            run = OptimizationRun.objects.select_related('created_by').get(id=run_id)
         except OptimizationRun.DoesNotExist:
             return Response({'error': 'Optimization run not found'}, status=status.HTTP_404_NOT_FOUND)
 
@@ -1978,17 +2437,18 @@ class ApplyBiasView(APIView):
         forecast_df['abay_error_cfs'] = bias_value
         forecast_df['abay_error_af'] = bias_value * AF_PER_CFS_HOUR
 
-        updated_results_df = results_df.copy()
+        # results_df was freshly loaded for this request, so the forecast rows
+        # are written back into it directly rather than into a full copy
         for column in forecast_df.columns:
-            updated_results_df.loc[forecast_df.index, column] = forecast_df[column]
+            results_df.loc[forecast_df.index, column] = forecast_df[column]
 
         run.r_bias_cfs = bias_value
         run.save(update_fields=['r_bias_cfs'])
 
-        chart_data = _prepare_chart_data(run, results_df=updated_results_df)
+        chart_data = _prepare_chart_data(run, results_df=results_df)
 
-        peak_elev = safe_float(updated_results_df['ABAY_ft'].max())
-        min_elev = safe_float(updated_results_df['ABAY_ft'].min())
+        peak_elev = safe_float(results_df['ABAY_ft'].max())
+        min_elev = safe_float(results_df['ABAY_ft'].min())
 
         avg_oxph_util_pct = None
         if 'OXPH_generation_MW' in forecast_df.columns:
@@ -2063,22 +2523,16 @@ class SaveEditedOptimizationView(APIView):
 
         rows = []
 
-        for entry in forecast_data:
-            timestamp_str = entry.get('datetime') or entry.get('dateTime')
-            if not timestamp_str:
-                continue
-
-            timestamp = parse_datetime(timestamp_str)
-            if timestamp is None:
-                try:
-                    timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                except Exception:
-                    continue
+        # Parse every row's timestamp to UTC in one pass; rows without a usable
+        # ISO 8601 timestamp come back as NaT and are skipped
+        timestamps = _parse_utc_timestamps(
+            [entry.get('datetime') or entry.get('dateTime') for entry in forecast_data],
+            iso_only=True,
+        )
 
-            if timezone.is_naive(timestamp):
-                timestamp = timezone.make_aware(timestamp, timezone=timezone.utc)
-            else:
-                timestamp = timestamp.astimezone(timezone.utc)
+        for entry, timestamp, has_timestamp in zip(forecast_data, timestamps, timestamps.notna()):
+            if not has_timestamp:
+                continue
 
             def pick(*keys):
                 for key in keys:
@@ -2123,7 +2577,8 @@ class SaveEditedOptimizationView(APIView):
         os.makedirs(output_dir, exist_ok=True)
         filename = f'optimization_run_{run.id}_{now.strftime("%Y%m%d_%H%M%S")}.csv'
         file_path = Path(output_dir) / filename
-        df.to_csv(file_path)
+        with open(file_path, 'w', buffering=_CSV_WRITE_BUFFER, newline='') as f:
+            df.to_csv(f)
 
         run.result_file_path = str(file_path)
 
@@ -2160,11 +2615,17 @@ class SaveEditedOptimizationView(APIView):
         }, status=status.HTTP_201_CREATED)
 
 
+# The payload also folds in live PI actuals and upstream forecasts, so the ETag
+# is taken from the rendered body rather than the run; a repeat poll with an
+# unchanged body gets a 304 instead of the full JSON
+@method_decorator([cache_control(private=True, no_cache=True), conditional_page], name='dispatch')
 class LatestOptimizationResultsView(APIView):
     """Return most recent completed optimization results for the current user."""
 
     def get(self, request):
-        run = OptimizationRun.objects.filter(created_by=request.user, status='completed').order_by('-created_at').first()
+        run = OptimizationRun.objects.select_related('created_by').filter(
+            created_by=request.user, status='completed'
+        ).order_by('-created_at').first()
         if not run:
             return Response({'error': 'No completed runs found'}, status=status.HTTP_404_NOT_FOUND)
         chart_data = _prepare_chart_data(run)
@@ -2189,8 +2650,6 @@ class RefreshPIDataView(APIView):
 
     def post(self, request):
         try:
-            from abay_opt import data_fetcher
-
             _, lookback = data_fetcher.get_historical_and_current_data()
             if lookback is None or lookback.empty:
                 return Response({'error': 'Failed to fetch PI data'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -2199,25 +2658,7 @@ class RefreshPIDataView(APIView):
             if last_ts:
                 lookback = lookback[lookback.index > pd.Timestamp(last_ts).tz_convert('UTC')]
 
-            created = 0
-            for idx, row in lookback.iterrows():
-                PIDatum.objects.update_or_create(
-                    timestamp_utc=idx.tz_convert('UTC'),
-                    defaults={
-                        'abay_elevation_ft': row.get('Afterbay_Elevation'),
-                        'abay_float_ft': row.get('Afterbay_Elevation_Setpoint'),
-                        'oxph_generation_mw': row.get('Oxbow_Power'),
-                        'oxph_setpoint_mw': row.get('OXPH_ADS'),
-                        'r4_flow_cfs': row.get('R4_Flow'),
-                        'r30_flow_cfs': row.get('R30_Flow'),
-                        'r20_flow_cfs': row.get('R20_Flow'),
-                        'r5l_flow_cfs': row.get('R5L_Flow'),
-                        'r26_flow_cfs': row.get('R26_Flow'),
-                        'mfp_total_gen_mw': row.get('MFP_Total_Gen_GEN_MDFK_and_RA'),
-                        'ccs_mode': row.get('CCS_Mode'),
-                    }
-                )
-                created += 1
+            created = _bulk_ingest_pi(lookback)
 
             return Response({'status': 'success', 'records': created})
         except Exception as e:
@@ -2241,50 +2682,39 @@ class RaftingConfigView(APIView):
     def get(self, request):
         """Get current rafting configuration"""
         try:
-            # Dynamic import of optimization modules (same pattern as your existing views)
-            current_dir = Path(__file__).resolve().parent
-            project_root = current_dir.parent.parent
-            abay_opt_path = project_root / 'abay_opt'
-
-            if str(project_root) not in sys.path:
-                sys.path.insert(0, str(project_root))
-
-            # Import constants
-            try:
-                import abay_opt.constants as constants
-            except ImportError as e:
-                logger.warning(f"Could not import optimization modules: {e}")
-                return Response({
-                    'error': 'Optimization modules not available',
-                    'detail': str(e)
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            # Rafting settings come straight from the constants module; build the payload once
+            cached = _rafting_config_cache.get(id(abay_constants))
+            if cached is not None:
+                return Response(cached)
 
             config = {
-                'current_water_year_type': constants.CURRENT_WATER_YEAR_TYPE,
+                'current_water_year_type': abay_constants.CURRENT_WATER_YEAR_TYPE,
                 'early_release_saturdays': [
                     {
                         'date': f"{month:02d}-{day:02d}-{year}",
                         'formatted': f"{date(year, month, day).strftime('%B %d, %Y')}"
                     }
-                    for month, day, year in constants.EARLY_RELEASE_SATURDAYS
+                    for month, day, year in abay_constants.EARLY_RELEASE_SATURDAYS
                 ],
-                'water_year_types': list(constants.RAFTING_SCHEDULES.keys()),
+                'water_year_types': list(abay_constants.RAFTING_SCHEDULES.keys()),
                 'rafting_season': {
-                    'end_date': f"{constants.RAFTING_SEASON_END_DATE[0]:02d}-{constants.RAFTING_SEASON_END_DATE[1]:02d}",
-                    'min_flow_cfs': constants.RAFTING_MIN_FLOW_CFS,
-                    'optimal_flow_cfs': constants.RAFTING_OPTIMAL_FLOW_CFS,
+                    'end_date': f"{abay_constants.RAFTING_SEASON_END_DATE[0]:02d}-{abay_constants.RAFTING_SEASON_END_DATE[1]:02d}",
+                    'min_flow_cfs': abay_constants.RAFTING_MIN_FLOW_CFS,
+                    'optimal_flow_cfs': abay_constants.RAFTING_OPTIMAL_FLOW_CFS,
                 },
                 'early_release_config': {
-                    'start_time': constants.EARLY_RELEASE_START_TIME.strftime('%H:%M'),
-                    'end_time': constants.EARLY_RELEASE_END_TIME.strftime('%H:%M'),
-                    'target_mw': constants.EARLY_RELEASE_TARGET_MW,
+                    'start_time': abay_constants.EARLY_RELEASE_START_TIME.strftime('%H:%M'),
+                    'end_time': abay_constants.EARLY_RELEASE_END_TIME.strftime('%H:%M'),
+                    'target_mw': abay_constants.EARLY_RELEASE_TARGET_MW,
                 }
             }
 
-            return Response({
+            payload = {
                 'status': 'success',
                 'config': config
-            })
+            }
+            _rafting_config_cache[id(abay_constants)] = payload
+            return Response(payload)
 
         except Exception as e:
             logger.error(f"Error getting rafting configuration: {e}")
@@ -2302,101 +2732,66 @@ class RaftingTimesView(APIView):
     def get(self, request):
         """Get today and tomorrow's rafting times with OXPH adjustment info"""
         try:
-            # Import optimization modules
-            current_dir = Path(__file__).resolve().parent
-            project_root = current_dir.parent.parent
-
-            if str(project_root) not in sys.path:
-                sys.path.insert(0, str(project_root))
-
-            import abay_opt.constants as constants
-            import abay_opt.schedule as schedule
-
-            now_pt = timezone.now().astimezone(constants.PACIFIC_TZ)
+            now_pt = timezone.now().astimezone(abay_constants.PACIFIC_TZ)
             today = now_pt.date()
             tomorrow = today + timedelta(days=1)
 
             def get_rafting_info_for_date(check_date):
                 """Get rafting schedule info for a specific date"""
-                # Check multiple times throughout the day to find rafting periods
-                times_to_check = [
-                    time(4, 0),  # Early release check
-                    time(8, 0),  # Weekend start
-                    time(9, 0),  # Weekday start
-                    time(12, 0),  # Noon
-                ]
+                no_rafting = {
+                    'has_rafting': False,
+                    'start_time': None,
+                    'end_time': None,
+                    'is_early_release': False,
+                    'oxph_adjustment_needed': False,
+                    'oxph_adjustment_time': None,
+                    'current_oxph_setting': None
+                }
 
-                rafting_periods = []
-                for check_time in times_to_check:
-                    timestamp = constants.PACIFIC_TZ.localize(
-                        datetime.combine(check_date, check_time)
-                    )
-                    is_active = schedule.summer_setpoint_required(timestamp)
-                    schedule_type = 'weekend' if timestamp.weekday() >= 5 else 'weekday'
-
-                    if is_active:
-                        rafting_periods.append({
-                            'time': check_time,
-                            'active': True,
-                            'type': schedule_type
-                        })
-
-                if not rafting_periods:
-                    return {
-                        'has_rafting': False,
-                        'start_time': None,
-                        'end_time': None,
-                        'is_early_release': False,
-                        'oxph_adjustment_needed': False,
-                        'oxph_adjustment_time': None,
-                        'current_oxph_setting': None
-                    }
+                # Same season window summer_setpoint_required applies: Memorial Day
+                # weekend through the configured season end date
+                season_start = abay_schedule.memorial_day_weekend_start(check_date.year)
+                season_end = date(check_date.year, *abay_constants.RAFTING_SEASON_END_DATE)
+                if not (season_start <= check_date <= season_end):
+                    return no_rafting
 
                 # Find the actual start and end times from the schedule
                 weekday_name = check_date.strftime('%A')
-                water_year_type = constants.CURRENT_WATER_YEAR_TYPE
+                water_year_type = abay_constants.CURRENT_WATER_YEAR_TYPE
 
                 # Determine if we're in main season or post-Labor Day
-                labor_day_date = schedule.labor_day(check_date.year)
+                labor_day_date = abay_schedule.labor_day(check_date.year)
                 if check_date <= labor_day_date:
                     schedule_period = 'main_season'
                 else:
                     schedule_period = 'post_labor_day'
 
-                sched = constants.RAFTING_SCHEDULES[water_year_type][schedule_period]
+                sched = abay_constants.RAFTING_SCHEDULES[water_year_type][schedule_period]
                 is_weekend = weekday_name in ['Saturday', 'Sunday']
                 schedule_type = 'weekends' if is_weekend else 'weekdays'
                 day_schedule = sched[schedule_type]
 
                 # Check if this day has rafting
-                if weekday_name not in day_schedule['days']:
-                    return {
-                        'has_rafting': False,
-                        'start_time': None,
-                        'end_time': None,
-                        'is_early_release': False,
-                        'oxph_adjustment_needed': False,
-                        'oxph_adjustment_time': None,
-                        'current_oxph_setting': None
-                    }
+                if (weekday_name not in day_schedule.get('days', [])
+                        or day_schedule.get('start_time') is None
+                        or day_schedule.get('end_time') is None):
+                    return no_rafting
 
                 # Get base times
                 base_start_time = day_schedule['start_time']
                 end_time = day_schedule['end_time']
 
                 # Check for early release
-                is_early_release = False
-                actual_start_time = base_start_time
-                for month, day, year in constants.EARLY_RELEASE_SATURDAYS:
-                    if check_date == date(year, month, day):
-                        is_early_release = True
-                        actual_start_time = constants.EARLY_RELEASE_START_TIME
-                        break
+                is_early_release = check_date in _EARLY_RELEASE_DATES
+                if is_early_release:
+                    actual_start_time = abay_constants.EARLY_RELEASE_START_TIME
+                else:
+                    actual_start_time = base_start_time
 
                 # Calculate when OXPH adjustment needs to be made
-                target_mw = constants.SUMMER_OXPH_TARGET_MW
-                min_mw = constants.OXPH_MIN_MW
-                ramp_rate = constants.OXPH_RAMP_RATE_MW_PER_MIN
+                target_mw = abay_constants.SUMMER_OXPH_TARGET_MW
+                min_mw = abay_constants.OXPH_MIN_MW
+                ramp_rate = abay_constants.OXPH_RAMP_RATE_MW_PER_MIN
 
                 # Calculate ramp time needed
                 ramp_minutes = (target_mw - min_mw) / ramp_rate if ramp_rate > 0 else 0
@@ -2424,7 +2819,7 @@ class RaftingTimesView(APIView):
             return Response({
                 'status': 'success',
                 'current_time': now_pt.strftime('%H:%M'),
-                'water_year_type': constants.CURRENT_WATER_YEAR_TYPE,
+                'water_year_type': abay_constants.CURRENT_WATER_YEAR_TYPE,
                 'today': {
                     'date': today.strftime('%Y-%m-%d'),
                     'day_name': today.strftime('%A'),
@@ -2436,9 +2831,9 @@ class RaftingTimesView(APIView):
                     **tomorrow_info
                 },
                 'ramp_settings': {
-                    'target_mw': constants.SUMMER_OXPH_TARGET_MW,
-                    'min_mw': constants.OXPH_MIN_MW,
-                    'ramp_rate_mw_per_min': constants.OXPH_RAMP_RATE_MW_PER_MIN
+                    'target_mw': abay_constants.SUMMER_OXPH_TARGET_MW,
+                    'min_mw': abay_constants.OXPH_MIN_MW,
+                    'ramp_rate_mw_per_min': abay_constants.OXPH_RAMP_RATE_MW_PER_MIN
                 }
             })
 
@@ -2458,18 +2853,9 @@ class RampCalculatorView(APIView):
     def post(self, request):
         """Calculate when to adjust OXPH setpoint for a given target"""
         try:
-            # Import optimization modules
-            current_dir = Path(__file__).resolve().parent
-            project_root = current_dir.parent.parent
-
-            if str(project_root) not in sys.path:
-                sys.path.insert(0, str(project_root))
-
-            import abay_opt.constants as constants
-
             # Get input parameters
-            current_mw = float(request.data.get('current_mw', constants.OXPH_MIN_MW))
-            target_mw = float(request.data.get('target_mw', constants.SUMMER_OXPH_TARGET_MW))
+            current_mw = float(request.data.get('current_mw', abay_constants.OXPH_MIN_MW))
+            target_mw = float(request.data.get('target_mw', abay_constants.SUMMER_OXPH_TARGET_MW))
             target_time_str = request.data.get('target_time')  # Format: "HH:MM"
             target_date_str = request.data.get('target_date', timezone.now().date().strftime('%Y-%m-%d'))
 
@@ -2489,7 +2875,7 @@ class RampCalculatorView(APIView):
 
             # Calculate ramp time needed
             mw_difference = target_mw - current_mw
-            ramp_rate = constants.OXPH_RAMP_RATE_MW_PER_MIN
+            ramp_rate = abay_constants.OXPH_RAMP_RATE_MW_PER_MIN
 
             if mw_difference <= 0:
                 return Response({
@@ -2552,129 +2938,176 @@ def dashboard_data(request):
     return dashboard_view.get(request)
 
 
-def _load_run_results_dataframe(run):
-    """Load the combined optimization results DataFrame for a run."""
+# OptimizationResult fields loaded into a run's results DataFrame, timestamp first
+_RUN_RESULT_FIELDS = (
+    'timestamp_utc',
+    'oxph_setpoint_target',
+    'oxph_generation_mw',
+    'oxph_outflow_cfs',
+    'r26_flow_cfs',
+    'r5l_flow_cfs',
+    'r4_flow_cfs',
+    'r30_flow_cfs',
+    'r20_minus_r5l_cfs',
+    'mfra_mw',
+    'mf1_2_mw',
+    'mf1_2_cfs',
+    'abay_elev_ft',
+    'abay_af',
+    'abay_float_ft',
+    'expected_abay_ft',
+    'expected_abay_af',
+    'abay_error_cfs',
+    'abay_error_af',
+    'setpoint_adjust_time_pt',
+    'ccs_mode',
+    'head_limit_mw',
+    'bias_cfs',
+    'abay_net_flow_cfs',
+    'abay_net_expected_cfs',
+    'abay_net_actual_cfs',
+    'abay_net_expected_cfs_no_bias',
+    'abay_net_expected_cfs_with_bias',
+    'regulated_component_cfs',
+    'mfra_side_reduction_mw',
+    'adjust_oxph_needed',
+    'is_head_loss_limited',
+    'spill_volume_af',
+    'actual_oxph_mw',
+    'actual_abay_elev_ft',
+    'abay_delta_af',
+    'is_forecast',
+)
+
+# The subset _prepare_chart_data reads (after renaming), so chart loads skip the
+# diagnostic columns
+_CHART_RESULT_FIELDS = (
+    'timestamp_utc',
+    'oxph_setpoint_target',
+    'oxph_generation_mw',
+    'r26_flow_cfs',
+    'r5l_flow_cfs',
+    'r4_flow_cfs',
+    'r30_flow_cfs',
+    'r20_minus_r5l_cfs',
+    'mfra_mw',
+    'abay_elev_ft',
+    'abay_float_ft',
+    'setpoint_adjust_time_pt',
+    'ccs_mode',
+    'bias_cfs',
+)
+
+
+# OptimizationResult field -> results DataFrame column, matching the CSV output names
+_RESULT_RENAME_MAP = {
+    'oxph_setpoint_target': 'OXPH_setpoint_MW',
+    'oxph_generation_mw': 'OXPH_generation_MW',
+    'oxph_outflow_cfs': 'OXPH_outflow_cfs',
+    'r26_flow_cfs': 'R26_Flow',
+    'r5l_flow_cfs': 'R5L_Flow',
+    'r4_flow_cfs': 'R4_Flow',
+    'r30_flow_cfs': 'R30_Flow',
+    'mfra_mw': 'MFRA_MW',
+    'mf1_2_mw': 'MF_1_2_MW',
+    'mf1_2_cfs': 'MF_1_2_cfs',
+    'abay_elev_ft': 'ABAY_ft',
+    'abay_af': 'ABAY_af',
+    'abay_float_ft': 'FLOAT_FT',
+    'expected_abay_ft': 'Expected_ABAY_ft',
+    'expected_abay_af': 'Expected_ABAY_af',
+    'abay_error_cfs': 'abay_error_cfs',
+    'abay_error_af': 'abay_error_af',
+    'setpoint_adjust_time_pt': 'setpoint_change_time',
+    'ccs_mode': 'Mode',
+    'head_limit_mw': 'Head_limit_MW',
+    'bias_cfs': 'bias_cfs',
+    'abay_net_flow_cfs': 'ABAY_net_flow_cfs',
+    'abay_net_expected_cfs': 'ABAY_NET_expected_cfs',
+    'abay_net_actual_cfs': 'ABAY_NET_actual_cfs',
+    'abay_net_expected_cfs_no_bias': 'ABAY_NET_expected_cfs_no_bias',
+    'abay_net_expected_cfs_with_bias': 'ABAY_NET_expected_cfs_with_bias',
+    'regulated_component_cfs': 'Regulated_component_cfs',
+    'mfra_side_reduction_mw': 'MFRA_side_reduction_MW',
+    'adjust_oxph_needed': 'Adjust_OXPH_Needed',
+    'is_head_loss_limited': 'Is_Head_Loss_Limited',
+    'spill_volume_af': 'Spill_Volume_AF_Recalc',
+    'actual_oxph_mw': 'OXPH_generation_MW_hist',
+    'actual_abay_elev_ft': 'Afterbay_Elevation_Actual',
+    'abay_delta_af': 'ABAY_Delta_AF_Sim',
+    'is_forecast': 'is_forecast',
+}
+
+
+def _load_run_results_dataframe(run, fields=None):
+    """Load the combined optimization results DataFrame for a run.
+
+    ``fields`` narrows the DB query to a subset of ``_RUN_RESULT_FIELDS`` (timestamp
+    first); the CSV fallback always returns every column. Completed runs are
+    served from a small per-process cache; callers always get their own copy.
+    """
 
     if not run:
         raise ValueError('Run results not available for this optimization run')
 
+    if run.status == 'completed' and run.completed_at:
+        # Results are written before completed_at is stamped and a re-run stamps
+        # it again, so (run, completed_at, file) identifies one set of results
+        return _completed_run_results(run, run.completed_at, run.result_file_path, fields).copy()
+    return _build_run_results_dataframe(run, fields)
+
+
+@lru_cache(maxsize=8)
+def _completed_run_results(run, completed_at, result_file_path, fields):
+    return _build_run_results_dataframe(run, fields)
+
+
+def _build_run_results_dataframe(run, fields):
     result_qs = OptimizationResult.objects.filter(optimization_run=run).order_by('timestamp_utc')
 
-    if result_qs.exists():
-        records = list(result_qs.values(
-            'timestamp_utc',
-            'oxph_setpoint_target',
-            'oxph_generation_mw',
-            'oxph_outflow_cfs',
-            'r26_flow_cfs',
-            'r5l_flow_cfs',
-            'r4_flow_cfs',
-            'r30_flow_cfs',
-            'r20_minus_r5l_cfs',
-            'mfra_mw',
-            'mf1_2_mw',
-            'mf1_2_cfs',
-            'abay_elev_ft',
-            'abay_af',
-            'abay_float_ft',
-            'expected_abay_ft',
-            'expected_abay_af',
-            'abay_error_cfs',
-            'abay_error_af',
-            'setpoint_adjust_time_pt',
-            'ccs_mode',
-            'head_limit_mw',
-            'bias_cfs',
-            'abay_net_flow_cfs',
-            'abay_net_expected_cfs',
-            'abay_net_actual_cfs',
-            'abay_net_expected_cfs_no_bias',
-            'abay_net_expected_cfs_with_bias',
-            'regulated_component_cfs',
-            'mfra_side_reduction_mw',
-            'adjust_oxph_needed',
-            'is_head_loss_limited',
-            'spill_volume_af',
-            'actual_oxph_mw',
-            'actual_abay_elev_ft',
-            'abay_delta_af',
-            'is_forecast',
-        ))
-
-        df = pd.DataFrame.from_records(records)
-
-        if df.empty:
-            # Fall back to CSV if database rows failed to load for some reason
-            return _load_run_results_from_csv(run)
-
-        df['timestamp_end'] = pd.to_datetime(df.pop('timestamp_utc'), utc=True)
-        df.set_index('timestamp_end', inplace=True)
-
-        rename_map = {
-            'oxph_setpoint_target': 'OXPH_setpoint_MW',
-            'oxph_generation_mw': 'OXPH_generation_MW',
-            'oxph_outflow_cfs': 'OXPH_outflow_cfs',
-            'r26_flow_cfs': 'R26_Flow',
-            'r5l_flow_cfs': 'R5L_Flow',
-            'r4_flow_cfs': 'R4_Flow',
-            'r30_flow_cfs': 'R30_Flow',
-            'mfra_mw': 'MFRA_MW',
-            'mf1_2_mw': 'MF_1_2_MW',
-            'mf1_2_cfs': 'MF_1_2_cfs',
-            'abay_elev_ft': 'ABAY_ft',
-            'abay_af': 'ABAY_af',
-            'abay_float_ft': 'FLOAT_FT',
-            'expected_abay_ft': 'Expected_ABAY_ft',
-            'expected_abay_af': 'Expected_ABAY_af',
-            'abay_error_cfs': 'abay_error_cfs',
-            'abay_error_af': 'abay_error_af',
-            'setpoint_adjust_time_pt': 'setpoint_change_time',
-            'ccs_mode': 'Mode',
-            'head_limit_mw': 'Head_limit_MW',
-            'bias_cfs': 'bias_cfs',
-            'abay_net_flow_cfs': 'ABAY_net_flow_cfs',
-            'abay_net_expected_cfs': 'ABAY_NET_expected_cfs',
-            'abay_net_actual_cfs': 'ABAY_NET_actual_cfs',
-            'abay_net_expected_cfs_no_bias': 'ABAY_NET_expected_cfs_no_bias',
-            'abay_net_expected_cfs_with_bias': 'ABAY_NET_expected_cfs_with_bias',
-            'regulated_component_cfs': 'Regulated_component_cfs',
-            'mfra_side_reduction_mw': 'MFRA_side_reduction_MW',
-            'adjust_oxph_needed': 'Adjust_OXPH_Needed',
-            'is_head_loss_limited': 'Is_Head_Loss_Limited',
-            'spill_volume_af': 'Spill_Volume_AF_Recalc',
-            'actual_oxph_mw': 'OXPH_generation_MW_hist',
-            'actual_abay_elev_ft': 'Afterbay_Elevation_Actual',
-            'abay_delta_af': 'ABAY_Delta_AF_Sim',
-            'is_forecast': 'is_forecast',
-        }
+    result_fields = fields or _RUN_RESULT_FIELDS
+    rows = list(result_qs.values_list(*result_fields))
 
-        df.rename(columns=rename_map, inplace=True)
+    if not rows:
+        # Fall back to CSV if database rows failed to load for some reason
+        return _load_run_results_from_csv(run)
 
-        if 'r20_minus_r5l_cfs' in df.columns:
-            r5l = df.get('R5L_Flow')
-            r20_vals = pd.to_numeric(df['r20_minus_r5l_cfs'], errors='coerce').fillna(0.0)
-            if r5l is not None:
-                r5l_vals = pd.to_numeric(r5l, errors='coerce').fillna(0.0)
-            else:
-                r5l_vals = 0.0
-            df['R20_Flow'] = r20_vals + r5l_vals
-            df.drop(columns=['r20_minus_r5l_cfs'], inplace=True)
+    # Transpose once and build each column from its own sequence so pandas
+    # infers one dtype per column instead of walking a list of row dicts
+    timestamps, *columns = zip(*rows)
+    df = pd.DataFrame(
+        dict(zip(result_fields[1:], columns)),
+        index=pd.DatetimeIndex(pd.to_datetime(list(timestamps), utc=True), name='timestamp_end'),
+    )
 
-        if 'setpoint_change_time' in df.columns:
-            df['setpoint_change_time'] = df['setpoint_change_time'].apply(
+    df.rename(columns=_RESULT_RENAME_MAP, inplace=True)
+
+    if 'r20_minus_r5l_cfs' in df.columns:
+        # R20 = stored (R20 - R5L) + R5L, with missing parts counted as zero
+        r20_vals = df.pop('r20_minus_r5l_cfs').to_numpy(dtype=np.float64, na_value=np.nan)
+        r20_vals[np.isnan(r20_vals)] = 0.0
+        if 'R5L_Flow' in df.columns:
+            r5l_vals = df['R5L_Flow'].to_numpy(dtype=np.float64, na_value=np.nan)
+            r20_vals += np.where(np.isnan(r5l_vals), 0.0, r5l_vals)
+        df['R20_Flow'] = r20_vals
+
+    if 'setpoint_change_time' in df.columns:
+        change_times = df['setpoint_change_time']
+        if isinstance(change_times.dtype, pd.DatetimeTZDtype):
+            present = change_times.notna().to_numpy()
+            formatted = np.full(len(df), None, dtype=object)
+            formatted[present] = _isoformat_index(pd.DatetimeIndex(change_times[present]))
+            df['setpoint_change_time'] = formatted
+        else:
+            df['setpoint_change_time'] = change_times.apply(
                 lambda value: value.isoformat() if pd.notna(value) else None
             )
 
-        if 'is_forecast' in df.columns:
-            df['is_forecast'] = df['is_forecast'].fillna(False).astype(bool)
+    if 'is_forecast' in df.columns:
+        df['is_forecast'] = df['is_forecast'].to_numpy(dtype=bool, na_value=False)
 
-        # Provide a convenience column matching the CSV output
-        df['timestamp_end'] = df.index
-
-        df.sort_index(inplace=True)
-        return df
-
-    return _load_run_results_from_csv(run)
+    # Rows are already in timestamp order from the query's order_by
+    return df
 
 
 def _load_run_results_from_csv(run):
@@ -2694,9 +3127,6 @@ def _load_run_results_from_csv(run):
     else:
         df.index = df.index.tz_convert('UTC')
 
-    if 'timestamp_end' not in df.columns:
-        df['timestamp_end'] = df.index
-
     if 'is_forecast' not in df.columns:
         if 'Expected_ABAY_ft' in df.columns:
             df['is_forecast'] = df['Expected_ABAY_ft'].isna()
@@ -2711,49 +3141,61 @@ def _load_run_results_from_csv(run):
 def profile_view(request):
     """User profile page for updating personal info and preferences"""
 
-    # Get or create user profile
-    profile, created = UserProfile.objects.get_or_create(user=request.user)
+    # Use the profile cached on request.user: it is the instance the User
+    # post_save signal saves, so the form's changes are written by that save
+    try:
+        profile = request.user.optimization_profile
+    except UserProfile.DoesNotExist:
+        profile = UserProfile.objects.create(user=request.user)
+        request.user.optimization_profile = profile
 
     if request.method == 'POST':
         try:
-            # Update user basic info
-            request.user.first_name = request.POST.get('first_name', '')
-            request.user.last_name = request.POST.get('last_name', '')
-            request.user.email = request.POST.get('email', '')
-            request.user.save()
-
-            # Update profile info
-            profile.phone_number = request.POST.get('phone_number', '')
-            profile.email_notifications = request.POST.get('email_notifications') == 'on'
-            profile.sms_notifications = request.POST.get('sms_notifications') == 'on'
-            profile.browser_notifications = request.POST.get('browser_notifications') == 'on'
-            profile.default_tab = request.POST.get('default_tab', 'dashboard')
-            profile.refresh_interval = int(request.POST.get('refresh_interval', 60))
-            profile.dark_mode = request.POST.get('dark_mode') == 'on'
-
-            # Validate phone number if SMS notifications are enabled
-            if profile.sms_notifications and not profile.phone_number:
-                messages.warning(request, 'Phone number is required for SMS notifications')
-                profile.sms_notifications = False
-
-            profile.save()
-
-            # Handle password change
-            current_password = request.POST.get('current_password')
-            new_password = request.POST.get('new_password')
-            confirm_password = request.POST.get('confirm_password')
-
-            if current_password and new_password:
-                if new_password == confirm_password:
-                    if request.user.check_password(current_password):
-                        request.user.set_password(new_password)
-                        request.user.save()
-                        update_session_auth_hash(request, request.user)
-                        messages.success(request, 'Password changed successfully')
+            with transaction.atomic():
+                # Update user basic info
+                user_fields = ['first_name', 'last_name', 'email']
+                request.user.first_name = request.POST.get('first_name', '')
+                request.user.last_name = request.POST.get('last_name', '')
+                request.user.email = request.POST.get('email', '')
+
+                # Update profile info
+                profile.phone_number = request.POST.get('phone_number', '')
+                profile.email_notifications = request.POST.get('email_notifications') == 'on'
+                profile.sms_notifications = request.POST.get('sms_notifications') == 'on'
+                profile.browser_notifications = request.POST.get('browser_notifications') == 'on'
+                profile.default_tab = request.POST.get('default_tab', 'dashboard')
+                profile.refresh_interval = int(request.POST.get('refresh_interval', 60))
+                profile.dark_mode = request.POST.get('dark_mode') == 'on'
+
+                # Validate phone number if SMS notifications are enabled
+                if profile.sms_notifications and not profile.phone_number:
+                    messages.warning(request, 'Phone number is required for SMS notifications')
+                    profile.sms_notifications = False
+
+                # Handle password change
+                current_password = request.POST.get('current_password')
+                new_password = request.POST.get('new_password')
+                confirm_password = request.POST.get('confirm_password')
+
+                password_changed = False
+                if current_password and new_password:
+                    if new_password == confirm_password:
+                        if request.user.check_password(current_password):
+                            request.user.set_password(new_password)
+                            user_fields.append('password')
+                            password_changed = True
+                        else:
+                            messages.error(request, 'Current password is incorrect')
                     else:
-                        messages.error(request, 'Current password is incorrect')
-                else:
-                    messages.error(request, 'New passwords do not match')
+                        messages.error(request, 'New passwords do not match')
+
+                # One write for the user row, including the new password hash; the
+                # User post_save signal then writes the profile in a single save
+                request.user.save(update_fields=user_fields)
+
+            if password_changed:
+                update_session_auth_hash(request, request.user)
+                messages.success(request, 'Password changed successfully')
 
             messages.success(request, 'Profile updated successfully')
             return redirect('/')
@@ -4840,11 +4840,12 @@ async function runOptimization() {
 // Replace the existing pollOptimizationProgress function with this enhanced version:
 
 async function pollOptimizationProgress(taskId, loadingMessageElement) {
-  const maxPolls = 60; // 5 minutes max (5 second intervals)
-  let pollCount = 0;
+  const maxWaitMs = 5 * 60 * 1000; // 5 minutes max
+  const deadline = Date.now() + maxWaitMs;
+  let timedOut = true;
   let runId = null;
 
-  while (pollCount < maxPolls) {
+  while (Date.now() < deadline) {
     try {
       const response = await fetch(`/api/optimization-status/${taskId}/`);
 
@@ -4854,7 +4855,6 @@ async function pollOptimizationProgress(taskId, loadingMessageElement) {
           `Status endpoint not ready for task ${taskId}, retrying...`
         );
         await new Promise((resolve) => setTimeout(resolve, 5000));
-        pollCount++;
         continue;
       }
 
@@ -4890,6 +4890,7 @@ async function pollOptimizationProgress(taskId, loadingMessageElement) {
         markOptimizationFailed(errMsg);
         displayOptimizationStatus(status.solver_status || "Failed");
         showNotification(errMsg, "error");
+        timedOut = false;
         break;
       } else if (completed) {
         loadingMessageElement.textContent =
@@ -4901,12 +4902,14 @@ async function pollOptimizationProgress(taskId, loadingMessageElement) {
           await loadOptimizationResults(runId);
         }
 
+        timedOut = false;
         break;
       }
 
-      // Wait before next poll
-      await new Promise((resolve) => setTimeout(resolve, 5000));
-      pollCount++;
+      // Wait before next poll; the server backs off while the run is idle
+      await new Promise((resolve) =>
+        setTimeout(resolve, status.next_poll_ms || 5000)
+      );
     } catch (error) {
       console.error("Progress polling error:", error);
       loadingMessageElement.textContent =
@@ -4914,11 +4917,12 @@ async function pollOptimizationProgress(taskId, loadingMessageElement) {
       markOptimizationFailed("Optimization failed: " + error.message);
       displayOptimizationStatus("Failed");
       showNotification("Optimization failed: " + error.message, "error");
+      timedOut = false;
       break;
     }
   }
 
-  if (pollCount >= maxPolls) {
+  if (timedOut) {
     showNotification("Optimization is taking longer than expected", "warning");
     updateOptimizationProgressStatus(
       "Optimization is taking longer than expected."